@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Benchmarks of the Aqua and Chemistry hot paths, run with airspeed velocity (asv).
+
+The ``time_*`` methods are timed, the ``peakmem_*`` methods measure the peak resident memory
+and the ``track_*`` methods record the returned value, such as the number of executed circuits.
+All the inputs are synthetic or stored in the fixtures folder, and the quantum parts run on
+the BasicAer simulators, so that the suite runs offline.
+"""
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Benchmarks of the fermionic to qubit mappings of H2, LiH and BeH2.
+
+The fixtures hold the sto3g QMolecules computed by PySCF at the equilibrium
+bond lengths (0.735, 1.595 and 1.334 Angstrom).
+"""
+
+from qiskit.chemistry import FermionicOperator
+from qiskit.chemistry.drivers import HDF5Driver
+
+from .common import fixture_path
+
+
+def _load_molecule(molecule):
+    return HDF5Driver(hdf5_input=fixture_path('{}.hdf5'.format(molecule))).run()
+
+
+class MappingSuite:
+    """ FermionicOperator.mapping of the stored molecules """
+
+    params = (['h2', 'lih', 'beh2'], ['jordan_wigner', 'parity', 'bravyi_kitaev'])
+    param_names = ['molecule', 'map_type']
+    timeout = 300
+
+    def setup(self, molecule, map_type):
+        qmolecule = _load_molecule(molecule)
+        self.fer_op = FermionicOperator(h1=qmolecule.one_body_integrals, h2=qmolecule.two_body_integrals)
+
+    def time_mapping(self, molecule, map_type):
+        self.fer_op.mapping(map_type)
+
+    def peakmem_mapping(self, molecule, map_type):
+        self.fer_op.mapping(map_type)
+
+    def track_num_paulis(self, molecule, map_type):
+        return len(self.fer_op.mapping(map_type).paulis)
+
+    track_num_paulis.unit = 'paulis'
+
+
+class LoadSuite:
+    """ Loading of the stored molecules and construction of their FermionicOperator """
+
+    params = ['h2', 'lih', 'beh2']
+    param_names = ['molecule']
+
+    def time_load(self, molecule):
+        _load_molecule(molecule)
+
+    def time_fermionic_operator(self, molecule):
+        qmolecule = _load_molecule(molecule)
+        FermionicOperator(h1=qmolecule.one_body_integrals, h2=qmolecule.two_body_integrals)
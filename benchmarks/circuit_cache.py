@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Benchmarks of the CircuitCache on repeated executions of a parametrized circuit.
+
+The CircuitCache matches the gates of a circuit to the instructions of the cached Qobj by name,
+so the circuits are written directly in the u3 and cx basis of the BasicAer simulators.
+"""
+
+import numpy as np
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+from .common import SEED, ExecutionCounter, quantum_instance
+
+NUM_EXECUTIONS = 20
+DEPTH = 3
+
+
+class CircuitCacheSuite:
+    """ Executions of layers of u3 rotations and cx at random parameters, with and without the cache """
+
+    params = ([4, 8], [True, False])
+    param_names = ['num_qubits', 'circuit_caching']
+    number = 1
+    repeat = 3
+    timeout = 300
+
+    def setup(self, num_qubits, circuit_caching):
+        random = np.random.RandomState(SEED)
+        self.circuits = []
+        for _ in range(NUM_EXECUTIONS):
+            q = QuantumRegister(num_qubits, name='q')
+            c = ClassicalRegister(num_qubits, name='c')
+            circuit = QuantumCircuit(q, c)
+            for _ in range(DEPTH):
+                for i in range(num_qubits):
+                    circuit.u3(*random.uniform(-np.pi, np.pi, 3), q[i])
+                for i in range(num_qubits - 1):
+                    circuit.cx(q[i], q[i + 1])
+            circuit.measure(q, c)
+            self.circuits.append(circuit)
+
+    def _execute(self, circuit_caching):
+        instance = quantum_instance('qasm_simulator', shots=128, circuit_caching=circuit_caching)
+        counter = ExecutionCounter(instance)
+        for circuit in self.circuits:
+            instance.execute(circuit)
+        return counter
+
+    def time_executions(self, num_qubits, circuit_caching):
+        self._execute(circuit_caching)
+
+    def peakmem_executions(self, num_qubits, circuit_caching):
+        self._execute(circuit_caching)
+
+    def track_cache_hit_rate(self, num_qubits, circuit_caching):
+        return self._execute(circuit_caching).cache_hit_rate
+
+    track_cache_hit_rate.unit = 'ratio'
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+""" Shared inputs of the benchmarks """
+
+import os
+
+import numpy as np
+from qiskit import BasicAer
+from qiskit.quantum_info import Pauli
+
+from qiskit.aqua import Operator, QuantumInstance, aqua_globals
+
+SEED = 50
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def fixture_path(file_name):
+    """ Returns the path of a stored fixture """
+    return os.path.join(FIXTURES_PATH, file_name)
+
+
+def random_pauli_list(num_qubits, num_terms, seed=SEED):
+    """
+    Random weighted Paulis.
+
+    Args:
+        num_qubits (int): number of qubits
+        num_terms (int): number of Paulis
+        seed (int): random seed
+
+    Returns:
+        list[list]: the [coefficient, Pauli] terms
+    """
+    random = np.random.RandomState(seed)
+    z = random.randint(2, size=(num_terms, num_qubits)).astype(np.bool)
+    x = random.randint(2, size=(num_terms, num_qubits)).astype(np.bool)
+    coeffs = random.uniform(-1, 1, size=num_terms)
+    return [[coeff, Pauli(z_row, x_row)] for coeff, z_row, x_row in zip(coeffs, z, x)]
+
+
+def random_operator(num_qubits, num_terms, seed=SEED):
+    """ Operator of random weighted Paulis """
+    return Operator(paulis=random_pauli_list(num_qubits, num_terms, seed))
+
+
+def quantum_instance(backend_name='qasm_simulator', **kwargs):
+    """
+    Seeded QuantumInstance on a BasicAer simulator.
+
+    Args:
+        backend_name (str): name of the BasicAer simulator
+        kwargs: other QuantumInstance settings
+
+    Returns:
+        QuantumInstance: the quantum instance
+    """
+    aqua_globals.random_seed = SEED
+    return QuantumInstance(BasicAer.get_backend(backend_name),
+                           seed_simulator=SEED, seed_transpiler=SEED, **kwargs)
+
+
+class ExecutionCounter:
+    """
+    Counts the circuits executed by a QuantumInstance and the lookups of its CircuitCache.
+
+    The counts wrap the execute method of the instance and the Qobj loading of its cache, rather
+    than reading the run report of the instance, so that they also measure the older commits.
+    A lookup hits when the cached Qobj is loaded, and misses when the loading fails.
+    """
+
+    def __init__(self, instance):
+        self.circuits = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        execute = instance.execute
+
+        def _execute(circuits, **kwargs):
+            self.circuits += len(circuits) if isinstance(circuits, list) else 1
+            return execute(circuits, **kwargs)
+
+        instance.execute = _execute
+        circuit_cache = instance.circuit_cache
+        if circuit_cache is not None:
+            load_qobj_from_cache = circuit_cache.load_qobj_from_cache
+
+            def _load_qobj_from_cache(*args, **kwargs):
+                try:
+                    qobj = load_qobj_from_cache(*args, **kwargs)
+                except Exception:
+                    self.cache_misses += 1
+                    raise
+                self.cache_hits += 1
+                return qobj
+
+            circuit_cache.load_qobj_from_cache = _load_qobj_from_cache
+
+    @property
+    def cache_hit_rate(self):
+        """ Returns the ratio of the cache lookups that hit, 0 without lookups """
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups > 0 else 0.0
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+""" Benchmarks of the Operator construction, multiplication, grouping and evolution """
+
+import copy
+
+import numpy as np
+from qiskit import QuantumRegister
+
+from qiskit.aqua import Operator
+
+from .common import SEED, random_operator, random_pauli_list
+
+
+class OperatorSuite:
+    """ Operator arithmetic at growing qubit and term counts """
+
+    params = ([4, 8, 12], [100, 1000])
+    param_names = ['num_qubits', 'num_terms']
+
+    def setup(self, num_qubits, num_terms):
+        self.paulis = random_pauli_list(num_qubits, num_terms)
+        self.operator = Operator(paulis=copy.deepcopy(self.paulis))
+        self.other = random_operator(num_qubits, 10, seed=7)
+
+    def time_construction(self, num_qubits, num_terms):
+        Operator(paulis=[[coeff, pauli] for coeff, pauli in self.paulis])
+
+    def peakmem_construction(self, num_qubits, num_terms):
+        Operator(paulis=[[coeff, pauli] for coeff, pauli in self.paulis])
+
+    def time_multiplication(self, num_qubits, num_terms):
+        self.operator * self.other
+
+    def time_addition(self, num_qubits, num_terms):
+        self.operator + self.other
+
+    def time_evolution_circuit(self, num_qubits, num_terms):
+        self.operator.evolve(evo_time=1, evo_mode='circuit', num_time_slices=1,
+                             quantum_registers=QuantumRegister(num_qubits))
+
+    def track_evolution_circuit_size(self, num_qubits, num_terms):
+        circuit = self.operator.evolve(evo_time=1, evo_mode='circuit', num_time_slices=1,
+                                       quantum_registers=QuantumRegister(num_qubits))
+        return circuit.size()
+
+    track_evolution_circuit_size.unit = 'gates'
+
+
+class GroupingSuite:
+    """ Grouping of the Paulis into tensor product basis sets """
+
+    params = ([4, 8, 12], [100, 500])
+    param_names = ['num_qubits', 'num_terms']
+    # the grouping converts the operator in place, so every sample gets a fresh copy
+    number = 1
+    repeat = 5
+
+    def setup(self, num_qubits, num_terms):
+        self.operator = random_operator(num_qubits, num_terms)
+
+    def time_to_grouped_paulis(self, num_qubits, num_terms):
+        self.operator.to_grouped_paulis()
+
+    def peakmem_to_grouped_paulis(self, num_qubits, num_terms):
+        self.operator.to_grouped_paulis()
+
+    def track_num_groups(self, num_qubits, num_terms):
+        self.operator.to_grouped_paulis()
+        return len(self.operator.grouped_paulis)
+
+    track_num_groups.unit = 'groups'
+
+
+class MatrixSuite:
+    """ Conversion to the sparse matrix and statevector evolution """
+
+    params = [4, 8, 12]
+    param_names = ['num_qubits']
+    number = 1
+    repeat = 5
+
+    def setup(self, num_qubits):
+        self.operator = random_operator(num_qubits, 100)
+        random = np.random.RandomState(SEED)
+        state = random.uniform(-1, 1, 2 ** num_qubits) + 1j * random.uniform(-1, 1, 2 ** num_qubits)
+        self.state = state / np.linalg.norm(state)
+
+    def time_to_matrix(self, num_qubits):
+        self.operator.to_matrix()
+
+    def peakmem_to_matrix(self, num_qubits):
+        self.operator.to_matrix()
+
+    def time_evolution_statevector(self, num_qubits):
+        self.operator.evolve(self.state, evo_time=1, evo_mode='matrix', num_time_slices=1)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+""" Benchmarks of the QSVM kernel matrix """
+
+import numpy as np
+
+from qiskit.aqua.algorithms import QSVM
+from qiskit.aqua.components.feature_maps import SecondOrderExpansion
+
+from .common import SEED, ExecutionCounter, quantum_instance
+
+
+class KernelSuite:
+    """ QSVM.get_kernel_matrix of random training data """
+
+    params = (['qasm_simulator', 'statevector_simulator'], [10, 20])
+    param_names = ['backend', 'num_samples']
+    number = 1
+    repeat = 3
+    timeout = 300
+
+    def setup(self, backend, num_samples):
+        self.feature_map = SecondOrderExpansion(feature_dimension=2, depth=2)
+        self.data = np.random.RandomState(SEED).uniform(0, 2 * np.pi, size=(num_samples, 2))
+        self.quantum_instance = quantum_instance(backend, shots=1024)
+
+    def time_kernel_matrix(self, backend, num_samples):
+        QSVM.get_kernel_matrix(self.quantum_instance, self.feature_map, self.data)
+
+    def peakmem_kernel_matrix(self, backend, num_samples):
+        QSVM.get_kernel_matrix(self.quantum_instance, self.feature_map, self.data)
+
+    def track_num_circuits(self, backend, num_samples):
+        counter = ExecutionCounter(self.quantum_instance)
+        QSVM.get_kernel_matrix(self.quantum_instance, self.feature_map, self.data)
+        return counter.circuits
+
+    track_num_circuits.unit = 'circuits'
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Benchmarks of the SVM training solvers of optimize_svm.
+
+The kernels are RBF kernels of two separable Gaussian blobs, since the hard margin dual problem
+of overlapping classes is unbounded. They are written once as memory-mapped float32 files
+(1.6 GB for 20k points) in the cache directory of asv.
+"""
+
+import numpy as np
+
+from qiskit.aqua.utils import optimize_svm
+
+from .common import SEED
+
+SIZES = [1000, 5000, 20000]
+# the share of the points added since the previous training, for the warm start
+NEW_POINTS = 0.05
+
+
+def _kernel_file(num_points):
+    return 'rbf_kernel_{}.dat'.format(num_points)
+
+
+def _alpha_file(num_points):
+    return 'previous_alpha_{}.npy'.format(num_points)
+
+
+def _write_problem(num_points, chunk=1000):
+    """ Writes the kernel and labels of num_points points, and the alphas of the previous training """
+    random = np.random.RandomState(SEED)
+    labels = np.where(np.arange(num_points) % 2 == 0, 1.0, -1.0)
+    points = random.normal(scale=0.5, size=(num_points, 2)) + 2 * labels[:, np.newaxis]
+    kernel = np.memmap(_kernel_file(num_points), dtype=np.float32, mode='w+', shape=(num_points, num_points))
+    squared_norms = np.sum(points ** 2, axis=1)
+    for start in range(0, num_points, chunk):
+        distances = squared_norms[start:start + chunk, np.newaxis] + squared_norms \
+            - 2 * points[start:start + chunk] @ points.T
+        kernel[start:start + chunk] = np.exp(-np.maximum(distances, 0))
+    kernel.flush()
+
+    # the training before the last points were added, whose alphas are zero in the warm start
+    num_previous = int(num_points * (1 - NEW_POINTS))
+    previous_alpha, _, _ = optimize_svm(kernel[:num_previous, :num_previous], labels[:num_previous], solver='smo')
+    np.save(_alpha_file(num_points), np.concatenate([previous_alpha, np.zeros(num_points - num_previous)]))
+    return labels
+
+
+def _load_kernel(num_points):
+    return np.memmap(_kernel_file(num_points), dtype=np.float32, mode='r', shape=(num_points, num_points))
+
+
+class SMOSuite:
+    """ Sequential minimal optimization on memory-mapped kernels """
+
+    params = SIZES
+    param_names = ['num_points']
+    number = 1
+    repeat = 3
+    timeout = 1200
+
+    def setup_cache(self):
+        return {num_points: _write_problem(num_points) for num_points in SIZES}
+
+    def setup(self, labels, num_points):
+        self.kernel = _load_kernel(num_points)
+        self.labels = labels[num_points]
+        self.previous_alpha = np.load(_alpha_file(num_points))
+
+    def time_smo(self, labels, num_points):
+        optimize_svm(self.kernel, self.labels, solver='smo')
+
+    def peakmem_smo(self, labels, num_points):
+        optimize_svm(self.kernel, self.labels, solver='smo')
+
+    def time_smo_warm_start(self, labels, num_points):
+        optimize_svm(self.kernel, self.labels, solver='smo', initial_alpha=self.previous_alpha)
+
+    def track_num_support_vectors(self, labels, num_points):
+        _, _, support = optimize_svm(self.kernel, self.labels, solver='smo')
+        return int(np.sum(support))
+
+    track_num_support_vectors.unit = 'vectors'
+
+
+class CvxoptSuite:
+    """ The dense interior-point solver, at the size where it is still practical """
+
+    params = [1000]
+    param_names = ['num_points']
+    number = 1
+    repeat = 3
+
+    def setup(self, num_points):
+        random = np.random.RandomState(SEED)
+        self.labels = np.where(np.arange(num_points) % 2 == 0, 1.0, -1.0)
+        points = random.normal(scale=0.5, size=(num_points, 2)) + 2 * self.labels[:, np.newaxis]
+        squared_norms = np.sum(points ** 2, axis=1)
+        distances = squared_norms[:, np.newaxis] + squared_norms - 2 * points @ points.T
+        self.kernel = np.exp(-np.maximum(distances, 0))
+
+    def time_cvxopt(self, num_points):
+        optimize_svm(self.kernel, self.labels)
+
+    def peakmem_cvxopt(self, num_points):
+        optimize_svm(self.kernel, self.labels)
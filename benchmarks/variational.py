@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Benchmarks of the per-iteration latency of VQE and QAOA.
+
+Each run is limited to a fixed number of optimizer iterations, so that the time of a
+run and the per-evaluation time and circuit count stay comparable across commits.
+"""
+
+from qiskit.aqua.algorithms import VQE, QAOA
+from qiskit.aqua.components.optimizers import COBYLA
+from qiskit.aqua.components.variational_forms import RY
+from qiskit.aqua.translators.ising import max_cut
+from qiskit.chemistry import FermionicOperator
+from qiskit.chemistry.drivers import HDF5Driver
+
+from .common import SEED, ExecutionCounter, fixture_path, quantum_instance
+
+MAX_ITER = 10
+
+
+class _VariationalSuite:
+    """ Common measures of a variational algorithm, built by _algorithm """
+
+    params = ['statevector_simulator', 'qasm_simulator']
+    param_names = ['backend']
+    number = 1
+    repeat = 3
+    timeout = 300
+
+    def _algorithm(self, backend):
+        raise NotImplementedError()
+
+    @staticmethod
+    def _operator_mode(backend):
+        return 'matrix' if backend == 'statevector_simulator' else 'paulis'
+
+    def _run(self, backend):
+        instance = quantum_instance(backend, shots=1024)
+        counter = ExecutionCounter(instance)
+        result = self._algorithm(backend).run(instance)
+        return result, counter
+
+    def time_run(self, backend):
+        self._run(backend)
+
+    def peakmem_run(self, backend):
+        self._run(backend)
+
+    def track_time_per_evaluation(self, backend):
+        result, _ = self._run(backend)
+        return result['eval_time'] / result['eval_count']
+
+    track_time_per_evaluation.unit = 'seconds'
+
+    def track_circuits_per_evaluation(self, backend):
+        result, counter = self._run(backend)
+        return counter.circuits / result['eval_count']
+
+    track_circuits_per_evaluation.unit = 'circuits'
+
+
+class VQESuite(_VariationalSuite):
+    """ VQE of the jordan_wigner mapped H2 with a RY variational form """
+
+    def setup(self, backend):
+        qmolecule = HDF5Driver(hdf5_input=fixture_path('h2.hdf5')).run()
+        fer_op = FermionicOperator(h1=qmolecule.one_body_integrals, h2=qmolecule.two_body_integrals)
+        self.qubit_op = fer_op.mapping('jordan_wigner')
+
+    def _algorithm(self, backend):
+        return VQE(self.qubit_op, RY(self.qubit_op.num_qubits, depth=3), COBYLA(maxiter=MAX_ITER),
+                   operator_mode=self._operator_mode(backend))
+
+
+class QAOASuite(_VariationalSuite):
+    """ QAOA of the max-cut of a random 6 nodes graph """
+
+    def setup(self, backend):
+        weight_matrix = max_cut.random_graph(6, edge_prob=0.5, seed=SEED)
+        self.qubit_op, _ = max_cut.get_max_cut_qubitops(weight_matrix)
+
+    def _algorithm(self, backend):
+        return QAOA(self.qubit_op, COBYLA(maxiter=MAX_ITER), p=2, operator_mode=self._operator_mode(backend))
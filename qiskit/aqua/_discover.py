@@ -22,6 +22,7 @@ import pkgutil
 import importlib
 import inspect
 import copy
+import json
 from collections import namedtuple
 from enum import Enum
 from qiskit.aqua import AquaError
@@ -108,6 +109,10 @@ _REGISTERED_PLUGGABLES = {}
 
 _DISCOVERED = False
 
+PLUGGABLES_MANIFEST = os.path.join(os.path.dirname(__file__), 'pluggables.json')
+
+_MANIFEST = None
+
 
 def refresh_pluggables():
     """
@@ -223,6 +228,109 @@ def _discover_local_pluggables(directory=os.path.dirname(__file__),
             _discover_local_pluggables(fullpath, parentname + '.' + item, names_to_exclude, folders_to_exclude)
 
 
+def _load_manifest():
+    """
+    Loads the manifest of the local pluggables, keyed by pluggable type and name,
+    whose values are 'module:class' paths
+    """
+    global _MANIFEST
+    if _MANIFEST is None:
+        try:
+            with open(PLUGGABLES_MANIFEST) as manifest_file:
+                _MANIFEST = json.load(manifest_file)
+        except Exception as e:
+            logger.debug('Failed to load pluggables manifest {} error {}'.format(PLUGGABLES_MANIFEST, str(e)))
+            _MANIFEST = {}
+    return _MANIFEST
+
+
+def _get_manifest_class(pluggable_type, pluggable_name):
+    """
+    Imports the class of a pluggable listed in the manifest, without discovering all the pluggables
+    Args:
+        pluggable_type(PluggableType): The pluggable type
+        pluggable_name (str): The pluggable name
+    Returns:
+        cls: pluggable class, or None if it is not listed or not valid
+    """
+    path = _load_manifest().get(pluggable_type.value, {}).get(pluggable_name)
+    if path is None:
+        return None
+
+    module_name, class_name = path.split(':')
+    try:
+        cls = getattr(importlib.import_module(module_name), class_name)
+        if cls.CONFIGURATION['name'] != pluggable_name:
+            raise AquaError('Pluggable name {} does not match the manifest'.format(cls.CONFIGURATION['name']))
+        check_pluggable_valid = getattr(cls, 'check_pluggable_valid', None)
+        if check_pluggable_valid is not None:
+            # pylint: disable=not-callable
+            check_pluggable_valid()
+    except Exception as e:
+        logger.debug('Failed to load pluggable {} from manifest error {}'.format(path, str(e)))
+        return None
+
+    return cls
+
+
+def _generate_pluggables_manifest():
+    """
+    Generates the manifest of the local pluggables. Pluggables whose dependencies are not installed are
+    listed too, and the entries of modules that cannot be imported are kept from the current manifest.
+    Returns:
+        dict: the manifest
+    """
+    manifest = {}
+    failed_modules = set()
+    pluggables_types = _get_pluggables_types_dictionary()
+    for directory, parentname in [(os.path.dirname(__file__), 'qiskit.aqua'),
+                                  (os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'chemistry')),
+                                   'qiskit.chemistry')]:
+        for _, fullname, ispackage in pkgutil.walk_packages([directory], parentname + '.'):
+            if ispackage or fullname.split('.')[-1] + '.py' in _NAMES_TO_EXCLUDE or \
+                    any(folder in fullname.split('.') for folder in _FOLDERS_TO_EXCLUDE):
+                continue
+            try:
+                mod = importlib.import_module(fullname)
+            except Exception as e:
+                logger.debug('Failed to load {} error {}'.format(fullname, str(e)))
+                failed_modules.add(fullname)
+                continue
+            for _, cls in inspect.getmembers(mod, inspect.isclass):
+                if cls.__module__ != fullname or inspect.isabstract(cls):
+                    continue
+                for pluggable_type, c in pluggables_types.items():
+                    if issubclass(cls, c):
+                        try:
+                            pluggable_name = cls.CONFIGURATION['name']
+                        except (LookupError, TypeError):
+                            break
+                        manifest.setdefault(pluggable_type.value, {})[pluggable_name] = \
+                            '{}:{}'.format(fullname, cls.__qualname__)
+                        break
+
+    for pluggable_type, pluggables in _load_manifest().items():
+        for pluggable_name, path in pluggables.items():
+            if path.split(':')[0] in failed_modules:
+                manifest.setdefault(pluggable_type, {})[pluggable_name] = path
+
+    return {pluggable_type: dict(sorted(pluggables.items()))
+            for pluggable_type, pluggables in sorted(manifest.items())}
+
+
+def _write_pluggables_manifest():
+    """
+    Writes the manifest of the local pluggables, which lets get_pluggable_class and
+    get_pluggable_configuration import a single pluggable instead of discovering all of them
+    """
+    manifest = _generate_pluggables_manifest()
+    with open(PLUGGABLES_MANIFEST, 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+        manifest_file.write('\n')
+    global _MANIFEST
+    _MANIFEST = None
+
+
 def register_pluggable(cls):
     """
     Registers a pluggable class
@@ -332,8 +440,6 @@ def get_pluggable_class(pluggable_type, pluggable_name):
     Raises:
         AquaError: if the class is not registered
     """
-    _discover_on_demand()
-
     if isinstance(pluggable_type, str):
         for ptype in PluggableType:
             if ptype.value == pluggable_type:
@@ -343,6 +449,14 @@ def get_pluggable_class(pluggable_type, pluggable_name):
     if not isinstance(pluggable_type, PluggableType):
         raise AquaError('Invalid pluggable type {} {}'.format(pluggable_type, pluggable_name))
 
+    if not _DISCOVERED:
+        # resolve the pluggable from the manifest, discovering all of them only if it is not listed
+        cls = _get_manifest_class(pluggable_type, pluggable_name)
+        if cls is not None:
+            return cls
+
+    _discover_on_demand()
+
     if pluggable_type not in _REGISTERED_PLUGGABLES:
         raise AquaError('{} {} not registered'.format(pluggable_type, pluggable_name))
 
@@ -366,8 +480,6 @@ def get_pluggable_configuration(pluggable_type, pluggable_name):
     Raises:
         AquaError: if the class is not registered
     """
-    _discover_on_demand()
-
     if isinstance(pluggable_type, str):
         for ptype in PluggableType:
             if ptype.value == pluggable_type:
@@ -377,6 +489,14 @@ def get_pluggable_configuration(pluggable_type, pluggable_name):
     if not isinstance(pluggable_type, PluggableType):
         raise AquaError('Invalid pluggable type {} {}'.format(pluggable_type, pluggable_name))
 
+    if not _DISCOVERED:
+        # resolve the pluggable from the manifest, discovering all of them only if it is not listed
+        cls = _get_manifest_class(pluggable_type, pluggable_name)
+        if cls is not None:
+            return copy.deepcopy(cls.CONFIGURATION)
+
+    _discover_on_demand()
+
     if pluggable_type not in _REGISTERED_PLUGGABLES:
         raise AquaError('{} {} not registered'.format(pluggable_type, pluggable_name))
 
@@ -16,8 +16,8 @@ from .quantum_algorithm import QuantumAlgorithm
 from .adaptive import VQE, QAOA, VQC, QGAN
 from .classical import ExactEigensolver, ExactLSsolver, SVM_Classical
 from .many_sample import EOH, QSVM
-from .single_sample import Grover, IQPE, QPE, AmplitudeEstimation, Simon, \
-    DeutschJozsa, BernsteinVazirani, HHL, Shor
+from .single_sample import Grover, IQPE, QPE, AmplitudeEstimation, MaximumLikelihoodAmplitudeEstimation, \
+    Simon, DeutschJozsa, BernsteinVazirani, HHL, Shor
 
 
 __all__ = [
@@ -35,6 +35,7 @@ __all__ = [
     'IQPE',
     'QPE',
     'AmplitudeEstimation',
+    'MaximumLikelihoodAmplitudeEstimation',
     'Simon',
     'DeutschJozsa',
     'BernsteinVazirani',
@@ -12,10 +12,15 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import copy
 import logging
 
+import numpy as np
+from qiskit import ClassicalRegister
+
 from qiskit.aqua import AquaError, Pluggable, PluggableType, get_pluggable_class
 from qiskit.aqua.algorithms.adaptive import VQE
+from qiskit.aqua.translators.ising.ising_model import IsingModel
 from .var_form import QAOAVarForm
 
 logger = logging.getLogger(__name__)
@@ -100,6 +105,8 @@ class QAOA(VQE):
         super().__init__(operator, var_form, optimizer,
                          operator_mode=operator_mode, initial_point=initial_point,
                          max_evals_grouped=max_evals_grouped, aux_operators=aux_operators, callback=callback)
+        self._ising_model = None
+        self._ising_model_built = False
 
     @classmethod
     def init_params(cls, params, algo_input):
@@ -134,3 +141,70 @@ class QAOA(VQE):
         return cls(operator, optimizer, p=p, initial_state=init_state, operator_mode=operator_mode,
                    initial_point=initial_point, max_evals_grouped=max_evals_grouped,
                    aux_operators=algo_input.aux_ops)
+
+    def _get_ising_model(self):
+        """
+        Build the Ising model of the operator on first use.
+
+        The model is built only if the operator already has its Paulis or grouped Paulis, the latter
+        being converted on a copy, so that the representations of the operator are left untouched;
+        converting a matrix to Paulis costs more than what the classical evaluation saves.
+
+        Returns:
+            IsingModel: the model, or None if the operator is not an Ising Hamiltonian
+        """
+        if not self._ising_model_built:
+            self._ising_model_built = True
+            operator = self._operator
+            if operator.paulis is None and operator.grouped_paulis is not None:
+                operator = copy.deepcopy(operator)
+            if operator.paulis is not None or operator.grouped_paulis is not None:
+                try:
+                    self._ising_model = IsingModel.from_operator(operator)
+                except AquaError:
+                    self._ising_model = None
+        return self._ising_model
+
+    def _energy_evaluation(self, parameters):
+        """
+        Evaluate energy at given parameters for the variational form.
+
+        When the operator is an Ising Hamiltonian, the energy is evaluated classically from the
+        probabilities of the statevector, or from a single measurement of all qubits on qasm backends,
+        instead of through the evaluation circuits of the operator.
+
+        Args:
+            parameters (numpy.ndarray): parameters for variational form.
+
+        Returns:
+            float or list of float: energy of the hamiltonian of each parameter.
+        """
+        if self._use_simulator_operator_mode or self._get_ising_model() is None:
+            return super()._energy_evaluation(parameters)
+
+        num_parameter_sets = len(parameters) // self._var_form.num_parameters
+        parameter_sets = np.split(parameters, num_parameter_sets)
+        circuits = []
+        for parameter in parameter_sets:
+            circuit = self._var_form.construct_circuit(parameter)
+            if not self._quantum_instance.is_statevector:
+                c = ClassicalRegister(circuit.width(), name='c')
+                circuit.add_register(c)
+                circuit.measure(circuit.qregs[0], c)
+            circuits.append(circuit)
+        result = self._quantum_instance.execute(circuits)
+
+        mean_energy = []
+        for parameter, circuit in zip(parameter_sets, circuits):
+            if self._quantum_instance.is_statevector:
+                mean = self._ising_model.evaluate_statevector(result.get_statevector(circuit))
+                std = 0.0
+            else:
+                mean, std = self._ising_model.evaluate_counts(result.get_counts(circuit))
+            mean_energy.append(mean)
+            self._eval_count += 1
+            if self._callback is not None:
+                self._callback(self._eval_count, parameter, mean, std)
+            logger.info('Energy evaluation {} returned {}'.format(self._eval_count, mean))
+
+        return mean_energy if len(mean_energy) > 1 else mean_energy[0]
@@ -29,6 +29,8 @@ class QAOAVarForm:
         self.num_parameters = 2 * p
         self.parameter_bounds = [(0, np.pi)] * p + [(0, 2 * np.pi)] * p
         self.preferred_init_points = [0] * p * 2
+        # the angles are shared by the evolution of all the terms of the operators
+        self.support_parameter_shift = False
 
         # prepare the mixer operator
         v = np.zeros(self._cost_operator.num_qubits)
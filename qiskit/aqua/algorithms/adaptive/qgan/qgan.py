@@ -12,7 +12,6 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-from copy import deepcopy
 import csv
 import os
 import logging
@@ -138,6 +137,7 @@ class QGAN(QuantumAlgorithm):
             self._prob_data = np.zeros(int(np.prod(np.power(np.array([2]), self._num_qubits))))
         self._data_grid = []
         self._grid_elements = None
+        self._grid_shape = None
         self._prepare_data()
         self._batch_size = batch_size
         self._num_epochs = num_epochs
@@ -292,67 +292,51 @@ class QGAN(QuantumAlgorithm):
         else:
             bounds = self._bounds
         self._data = self._data.reshape((len(self._data), len(self._num_qubits)))
-        temp = []
-        for i, data_sample in enumerate(self._data):
-            append = True
-            for j, entry in enumerate(data_sample):
-                if entry < bounds[j, 0]:
-                    append = False
-                if entry > bounds[j, 1]:
-                    append = False
-            if append:
-                temp.append(list(data_sample))
-        self._data = np.array(temp)
+        inside = np.all((self._data >= bounds[:, 0]) & (self._data <= bounds[:, 1]), axis=1)
+        self._data = self._data[inside]
 
         # Fit the data to the data resolution. i.e. grid
-        for j, prec in enumerate(self._num_qubits):
-            data_row = self._data[:, j]  # dim j of all data samples
-            grid = np.linspace(bounds[j, 0], bounds[j, 1], (2 ** prec))  # prepare data grid for dim j
-            index_grid = np.searchsorted(grid, data_row-(grid[1]-grid[0])*0.5)  # find index for data sample in grid
-            for k, index in enumerate(index_grid):
-                self._data[k, j] = grid[index]
-            if j == 0:
-                if len(self._num_qubits) > 1:
-                    self._data_grid = [grid]
-                else:
-                    self._data_grid = grid
-                self._grid_elements = grid
-            elif j == 1:
-                self._data_grid.append(grid)
-                temp = []
-                for g_e in self._grid_elements:
-                    for g in grid:
-                        temp0 = [g_e]
-                        temp0.append(g)
-                        temp.append(temp0)
-                self._grid_elements = temp
-            else:
-                self._data_grid.append(grid)
-                temp = []
-                for g_e in self._grid_elements:
-                    for g in grid:
-                        temp0 = deepcopy(g_e)
-                        temp0.append(g)
-                        temp.append(temp0)
-                self._grid_elements = deepcopy(temp)
-        self._data_grid = np.array(self._data_grid)
-        self._data = np.reshape(self._data, (len(self._data), len(self._data[0])))
-        for data in self._data:
-            for i, element in enumerate(self._grid_elements):
-                if all(data == element):
-                    self._prob_data[i] += 1 / len(self._data)
-        self._prob_data = [1e-10 if x == 0 else x for x in self._prob_data]
+        grids = [np.linspace(bounds[j, 0], bounds[j, 1], (2 ** prec)) for j, prec in enumerate(self._num_qubits)]
+        if len(self._num_qubits) > 1:
+            self._data_grid = np.array(grids)
+            # grid elements in mixed-radix order, the last dimension running fastest
+            self._grid_elements = np.stack(np.meshgrid(*grids, indexing='ij'), axis=-1).reshape(-1, len(grids))
+        else:
+            self._data_grid = grids[0]
+            self._grid_elements = grids[0]
+        self._grid_shape = tuple(len(grid) for grid in grids)
+        data_indices = self._get_grid_indices(self._data)
+        for j, grid in enumerate(grids):
+            self._data[:, j] = grid[data_indices[:, j]]
+
+        # Histogram of the data over the grid elements, computed once
+        self._prob_data = np.bincount(np.ravel_multi_index(data_indices.T, self._grid_shape),
+                                      minlength=len(self._grid_elements)) / len(self._data)
+        self._prob_data[self._prob_data == 0] = 1e-10
         return
 
+    def _get_grid_indices(self, samples):
+        """
+        Find the nearest grid point of each sample, per dimension.
+        Args:
+            samples: array, samples of shape (N, k)
+
+        Returns: array, grid indices of shape (N, k)
+
+        """
+        samples = np.reshape(samples, (len(samples), len(self._num_qubits)))
+        grids = self._data_grid if len(self._num_qubits) > 1 else [self._data_grid]
+        indices = np.empty(samples.shape, dtype=int)
+        for j, grid in enumerate(grids):
+            # find index for data sample in grid
+            indices[:, j] = np.searchsorted(grid, samples[:, j] - (grid[1] - grid[0]) * 0.5)
+        return np.minimum(indices, np.array(self._grid_shape) - 1)
+
     def get_rel_entr(self):
         samples_gen, prob_gen = self._generator.get_output(self._quantum_instance)
-        temp = np.zeros(len(self._grid_elements))
-        for j, sample in enumerate(samples_gen):
-            for i, element in enumerate(self._grid_elements):
-                if all(sample == element):
-                    temp[i] += prob_gen[j]
-        prob_gen = temp
-        prob_gen = [1e-8 if x == 0 else x for x in prob_gen]
+        grid_indices = np.ravel_multi_index(self._get_grid_indices(np.array(samples_gen)).T, self._grid_shape)
+        prob_gen = np.bincount(grid_indices, weights=prob_gen, minlength=len(self._grid_elements))
+        prob_gen[prob_gen == 0] = 1e-8
         rel_entr = entropy(prob_gen, self._prob_data)
         return rel_entr
 
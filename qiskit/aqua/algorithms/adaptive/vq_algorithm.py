@@ -28,6 +28,7 @@ from abc import abstractmethod
 
 from qiskit.aqua import AquaError
 from qiskit.aqua.algorithms import QuantumAlgorithm
+from qiskit.aqua.components.optimizers import Optimizer
 
 logger = logging.getLogger(__name__)
 
@@ -125,6 +126,32 @@ class VQAlgorithm(QuantumAlgorithm):
 
         return ret
 
+    def gradient(self, parameters, cost_fn=None):
+        """Compute the gradient of the cost function with the parameter-shift rule.
+
+        The 2 * num_parameters shifted parameter sets are passed to the cost function in groups of
+        the max_evals_grouped of the optimizer, concatenated as the cost functions supporting
+        max_evals_grouped accept them, such that each group is evaluated in a single execution.
+
+        Args:
+            parameters (numpy.ndarray): parameters of the variational form
+            cost_fn (callable): cost function, the expectation value of an operator; defaults to the
+                                cost function of the algorithm
+
+        Returns:
+            numpy.ndarray: the gradient
+
+        Raises:
+            AquaError: if the variational form does not support the parameter-shift rule
+        """
+        if not self._var_form.support_parameter_shift:
+            raise AquaError('Variational form {} does not support parameter-shift gradients.'.format(
+                self._var_form.__class__.__name__))
+        cost_fn = cost_fn if cost_fn is not None else self._cost_fn
+        return Optimizer.gradient_num_diff(parameters, cost_fn, None,
+                                           max_evals_grouped=self._optimizer._max_evals_grouped,
+                                           method='parameter_shift')
+
     # Helper function to get probability vectors for a set of params
     def get_prob_vector_for_params(self, construct_circuit_fn, params_s,
                                    quantum_instance, construct_circuit_args=None):
@@ -16,10 +16,10 @@ import logging
 import math
 import numpy as np
 
-from sklearn.utils import shuffle
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.aqua import Pluggable, PluggableType, get_pluggable_class, AquaError
 from qiskit.aqua.components.feature_maps import FeatureMap
+from qiskit.aqua.components.optimizers import Optimizer
 from qiskit.aqua.utils import get_feature_dimension
 from qiskit.aqua.utils import map_label_to_class_name
 from qiskit.aqua.utils import split_dataset_to_data_and_labels
@@ -116,6 +116,49 @@ def cost_estimate_sigmoid(shots, probs, gt_labels):
     return loss
 
 
+_LABEL_TABLES = {}
+
+
+def get_label_table(num_qubits, num_classes):
+    """Return the class label of every basis state, as assigned by `assign_label` to its bitstring.
+
+    The table is computed once per (num_qubits, num_classes) with vectorized bit operations and then reused.
+
+    Args:
+        num_qubits (int): number of measured qubits
+        num_classes (int): number of classes
+    Returns:
+        numpy.ndarray: read-only 1-D array of length 2 ** num_qubits, the label of each basis state index
+    """
+    key = (num_qubits, num_classes)
+    if key not in _LABEL_TABLES:
+        indices = np.arange(2 ** num_qubits)
+
+        def hamming_weight(start, stop):
+            # the jth character of a bitstring is the bit num_qubits - 1 - j of its basis state index
+            weight = np.zeros(len(indices), dtype=int)
+            for j in range(start, stop):
+                weight += (indices >> (num_qubits - 1 - j)) & 1
+            return weight
+
+        if num_classes == 2:
+            total = hamming_weight(0, num_qubits)
+            if num_qubits % 2 != 0:
+                labels = (total > num_qubits / 2).astype(int)
+            else:
+                labels = total % 2
+        elif num_classes == 3:
+            split = int(np.floor(num_qubits / 2)) + num_qubits % 2
+            labels = hamming_weight(0, split) % 2 + hamming_weight(split, num_qubits) % 2
+        else:
+            class_step = np.floor(2 ** num_qubits / num_classes)
+            labels = np.minimum((indices / class_step).astype(int), num_classes - 1)
+        # the table is shared by all callers, hence must not be modified in place
+        labels.setflags(write=False)
+        _LABEL_TABLES[key] = labels
+    return _LABEL_TABLES[key]
+
+
 def return_probabilities(counts, num_classes):
     """Return the probabilities of given measured counts
     Args:
@@ -128,13 +171,30 @@ def return_probabilities(counts, num_classes):
     probs = np.zeros(((len(counts), num_classes)))
     for idx in range(len(counts)):
         count = counts[idx]
-        shots = sum(count.values())
-        for k, v in count.items():
-            label = assign_label(k, num_classes)
-            probs[idx][label] += v / shots
+        if len(count) == 0:
+            continue
+        keys = list(count.keys())
+        label_table = get_label_table(len(keys[0]), num_classes)
+        labels = label_table[[int(k, 2) for k in keys]]
+        values = np.fromiter(count.values(), dtype=float, count=len(count))
+        probs[idx] = np.bincount(labels, weights=values, minlength=num_classes) / np.sum(values)
     return probs
 
 
+def return_probabilities_from_statevectors(statevectors, num_classes):
+    """Return the class probabilities of given statevectors
+    Args:
+        statevectors (numpy.ndarray): NxM array, N statevectors of M = 2 ** num_qubits amplitudes
+        num_classes (int): number of classes
+    Returns:
+        numpy.ndarray: NxK array
+    """
+    outcome_matrix = np.abs(np.asarray(statevectors)) ** 2
+    num_qubits = int(math.log2(outcome_matrix.shape[1]))
+    label_one_hot = np.eye(num_classes)[get_label_table(num_qubits, num_classes)]
+    return outcome_matrix @ label_one_hot
+
+
 class VQC(VQAlgorithm):
 
     CONFIGURATION = {
@@ -349,25 +409,13 @@ class VQC(VQAlgorithm):
         predicted_probs = []
         predicted_labels = []
         for _ in theta_sets:
-            counts = []
-            for _ in data:
-                if self._quantum_instance.is_statevector:
-                    temp = results.get_statevector(circuits[circuit_id])
-                    outcome_vector = (temp * temp.conj()).real
-                    # convert outcome_vector to outcome_dict, where key is a basis state and value is the count.
-                    # Note: the count can be scaled linearly, i.e., it does not have to be an integer.
-                    outcome_dict = {}
-                    bitstr_size = int(math.log2(len(outcome_vector)))
-                    for i in range(len(outcome_vector)):
-                        bitstr_i = format(i, '0' + str(bitstr_size) + 'b')
-                        outcome_dict[bitstr_i] = outcome_vector[i]
-                else:
-                    outcome_dict = results.get_counts(circuits[circuit_id])
-
-                counts.append(outcome_dict)
-                circuit_id += 1
-
-            probs = return_probabilities(counts, self._num_classes)
+            if self._quantum_instance.is_statevector:
+                statevectors = [results.get_statevector(circuits[circuit_id + i]) for i in range(len(data))]
+                probs = return_probabilities_from_statevectors(statevectors, self._num_classes)
+            else:
+                counts = [results.get_counts(circuits[circuit_id + i]) for i in range(len(data))]
+                probs = return_probabilities(counts, self._num_classes)
+            circuit_id += len(data)
             predicted_probs.append(probs)
             predicted_labels.append(np.argmax(probs, axis=1))
 
@@ -380,6 +428,8 @@ class VQC(VQAlgorithm):
 
     # Breaks data into minibatches. Labels are optional, but will be broken into batches if included.
     def batch_data(self, data, labels=None, minibatch_size=-1):
+        from sklearn.utils import shuffle
+
         label_batches = None
 
         if 0 < minibatch_size < len(data):
@@ -442,7 +492,6 @@ class VQC(VQAlgorithm):
 
         self._ret['training_loss'] = self._ret['min_val']
 
-    # temporary fix: this code should be unified with the gradient api in optimizer.py
     def _gradient_function_wrapper(self, theta):
         """Compute and return the gradient at the point theta.
         Args:
@@ -451,13 +500,8 @@ class VQC(VQAlgorithm):
             numpy.ndarray: 1-d array with the same shape as theta. The  gradient computed
         """
         epsilon = 1e-8
-        f_orig = self._cost_function_wrapper(theta)
-        grad = np.zeros((len(theta),), float)
-        for k in range(len(theta)):
-            theta[k] += epsilon
-            f_new = self._cost_function_wrapper(theta)
-            grad[k] = (f_new - f_orig) / epsilon
-            theta[k] -= epsilon  # recover to the center state
+        grad = Optimizer.gradient_num_diff(theta, self._cost_function_wrapper, epsilon,
+                                           self._optimizer._max_evals_grouped)
         if self.is_gradient_really_supported():
             self._batch_index += 1  # increment the batch after gradient callback
         return grad
@@ -60,6 +60,10 @@ class VQE(VQAlgorithm):
                 'max_evals_grouped': {
                     'type': 'integer',
                     'default': 1
+                },
+                'use_parameter_shift': {
+                    'type': 'boolean',
+                    'default': False
                 }
             },
             'additionalProperties': False
@@ -80,7 +84,8 @@ class VQE(VQAlgorithm):
     }
 
     def __init__(self, operator, var_form, optimizer, operator_mode='matrix',
-                 initial_point=None, max_evals_grouped=1, aux_operators=None, callback=None):
+                 initial_point=None, max_evals_grouped=1, aux_operators=None, callback=None,
+                 use_parameter_shift=False):
         """Constructor.
 
         Args:
@@ -95,6 +100,12 @@ class VQE(VQAlgorithm):
                                  Internally, four arguments are provided as follows
                                  the index of evaluation, parameters of variational form,
                                  evaluated mean, evaluated standard devation.
+            use_parameter_shift (bool): give the optimizer the parameter-shift gradient, computed from
+                                        one execution of the shifted circuits, instead of finite differences.
+                                        The variational form has to support the parameter-shift rule.
+
+        Raises:
+            AquaError: if use_parameter_shift is set and the variational form does not support it
         """
         self.validate(locals())
         super().__init__(var_form=var_form,
@@ -105,6 +116,10 @@ class VQE(VQAlgorithm):
         self._callback = callback
         if initial_point is None:
             self._initial_point = var_form.preferred_init_points
+        if use_parameter_shift and not var_form.support_parameter_shift:
+            raise AquaError('Variational form {} does not support parameter-shift gradients.'.format(
+                var_form.__class__.__name__))
+        self._use_parameter_shift = use_parameter_shift
         self._operator = operator
         self._operator_mode = operator_mode
         self._eval_count = 0
@@ -135,6 +150,7 @@ class VQE(VQAlgorithm):
         operator_mode = vqe_params.get('operator_mode')
         initial_point = vqe_params.get('initial_point')
         max_evals_grouped = vqe_params.get('max_evals_grouped')
+        use_parameter_shift = vqe_params.get('use_parameter_shift')
 
         # Set up variational form, we need to add computed num qubits
         # Pass all parameters so that Variational Form can create its dependents
@@ -150,7 +166,7 @@ class VQE(VQAlgorithm):
 
         return cls(operator, var_form, optimizer, operator_mode=operator_mode,
                    initial_point=initial_point, max_evals_grouped=max_evals_grouped,
-                   aux_operators=algo_input.aux_ops)
+                   aux_operators=algo_input.aux_ops, use_parameter_shift=use_parameter_shift)
 
     @property
     def setting(self):
@@ -277,7 +293,8 @@ class VQE(VQAlgorithm):
         self._ret = self.find_minimum(initial_point=self.initial_point,
                                       var_form=self.var_form,
                                       cost_fn=self._energy_evaluation,
-                                      optimizer=self.optimizer)
+                                      optimizer=self.optimizer,
+                                      gradient_fn=self.gradient if self._use_parameter_shift else None)
 
         if self._ret['num_optimizer_evals'] is not None and self._eval_count >= self._ret['num_optimizer_evals']:
             self._eval_count = self._ret['num_optimizer_evals']
@@ -315,6 +332,12 @@ class VQE(VQAlgorithm):
             circuits.append(circuit)
 
         to_be_simulated_circuits = functools.reduce(lambda x, y: x + y, circuits)
+        names = [circuit.name for circuit in to_be_simulated_circuits]
+        if len(set(names)) < len(names):
+            # the results are looked up by circuit name, so the circuits of different parameter sets
+            # built by a variational form reusing a circuit name would read each other's results
+            for idx, circuit in enumerate(to_be_simulated_circuits):
+                circuit.name = '{}_{}'.format(circuit.name, idx)
         if self._use_simulator_operator_mode:
             extra_args = {'expectation': {
                 'params': [self._operator.aer_paulis],
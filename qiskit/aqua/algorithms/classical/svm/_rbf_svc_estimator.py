@@ -12,8 +12,6 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-from sklearn.svm import SVC
-
 from qiskit.aqua.components.multiclass_extensions import Estimator
 
 
@@ -21,6 +19,8 @@ class _RBF_SVC_Estimator(Estimator):
     """The estimator that uses the RBF Kernel."""
 
     def __init__(self):
+        from sklearn.svm import SVC
+
         self._estimator = SVC(kernel='rbf', gamma='auto')
 
     def fit(self, x, y):
@@ -22,7 +22,8 @@ class _SVM_Classical_ABC(ABC):
     abstract base class for the binary classifier and the multiclass classifier
     """
 
-    def __init__(self, training_dataset, test_dataset=None, datapoints=None, gamma=None):
+    def __init__(self, training_dataset, test_dataset=None, datapoints=None, gamma=None,
+                 solver='cvxopt', initial_alpha=None):
         if training_dataset is None:
             raise ValueError('training dataset is missing! please provide it')
 
@@ -38,6 +39,8 @@ class _SVM_Classical_ABC(ABC):
 
         self.datapoints = datapoints
         self.gamma = gamma
+        self.solver = solver
+        self.initial_alpha = initial_alpha
         self._ret = {}
 
     @abstractmethod
@@ -15,7 +15,6 @@
 import logging
 
 import numpy as np
-from sklearn.metrics.pairwise import rbf_kernel
 
 from qiskit.aqua.algorithms.classical.svm import _SVM_Classical_ABC
 from qiskit.aqua.utils import map_label_to_class_name, optimize_svm
@@ -29,6 +28,8 @@ class _SVM_Classical_Binary(_SVM_Classical_ABC):
     """
 
     def construct_kernel_matrix(self, points_array, points_array2, gamma=None):
+        from sklearn.metrics.pairwise import rbf_kernel
+
         return rbf_kernel(points_array, points_array2, gamma)
 
     def train(self, data, labels):
@@ -42,7 +43,8 @@ class _SVM_Classical_Binary(_SVM_Classical_ABC):
         labels = labels * 2. - 1.
         kernel_matrix = self.construct_kernel_matrix(data, data, self.gamma)
         self._ret['kernel_matrix_training'] = kernel_matrix
-        [alpha, b, support] = optimize_svm(kernel_matrix, labels)
+        [alpha, b, support] = optimize_svm(kernel_matrix, labels, solver=self.solver,
+                                           initial_alpha=self.initial_alpha)
         alphas = np.array([])
         svms = np.array([])
         yin = np.array([])
@@ -14,6 +14,8 @@
 
 import logging
 
+import numpy as np
+
 from qiskit.aqua.algorithms import QuantumAlgorithm
 from qiskit.aqua import AquaError, Pluggable, PluggableType, get_pluggable_class
 from qiskit.aqua.algorithms.classical.svm import (_SVM_Classical_Binary,
@@ -43,6 +45,18 @@ class SVM_Classical(QuantumAlgorithm):
                 'gamma': {
                     'type': ['number', 'null'],
                     'default': None
+                },
+                'solver': {
+                    'type': 'string',
+                    'default': 'cvxopt',
+                    'enum': ['cvxopt', 'smo']
+                },
+                'initial_alpha': {
+                    'type': ['array', 'null'],
+                    "items": {
+                        "type": "number"
+                    },
+                    'default': None
                 }
             },
             'additionalProperties': False
@@ -54,7 +68,24 @@ class SVM_Classical(QuantumAlgorithm):
     }
 
     def __init__(self, training_dataset, test_dataset=None, datapoints=None,
-                 gamma=None, multiclass_extension=None):
+                 gamma=None, multiclass_extension=None, solver='cvxopt', initial_alpha=None):
+        """
+        Args:
+            training_dataset (dict): training dataset.
+            test_dataset (dict, optional): testing dataset.
+            datapoints (numpy.ndarray, optional): prediction dataset.
+            gamma (float, optional): gamma of the rbf kernel.
+            multiclass_extension (MultiExtension, optional): if number of classes > 2 then
+                a multiclass scheme is needed.
+            solver (str, optional): quadratic program solver of the binary training, 'cvxopt' or 'smo',
+                see `optimize_svm`.
+            initial_alpha (numpy.ndarray, optional): starting alphas of the 'smo' solver, one per training
+                point, e.g. the alphas of a previous training; binary classification only.
+
+        Raises:
+            AquaError: if the training dataset is missing, if a multiclass extension is missing for more
+                than two classes, or initial_alpha is given with a multiclass extension
+        """
         self.validate(locals())
         super().__init__()
         if training_dataset is None:
@@ -69,8 +100,11 @@ class SVM_Classical(QuantumAlgorithm):
                 logger.warning("Dataset has just two classes. Supplied multiclass extension will be ignored")
 
         if multiclass_extension is None:
-            svm_instance = _SVM_Classical_Binary(training_dataset, test_dataset, datapoints, gamma)
+            svm_instance = _SVM_Classical_Binary(training_dataset, test_dataset, datapoints, gamma,
+                                                 solver, initial_alpha)
         else:
+            if initial_alpha is not None:
+                raise AquaError('initial_alpha is only supported for binary classification.')
             svm_instance = _SVM_Classical_Multiclass(
                 training_dataset, test_dataset, datapoints, gamma, multiclass_extension)
 
@@ -80,6 +114,10 @@ class SVM_Classical(QuantumAlgorithm):
     def init_params(cls, params, algo_input):
         svm_params = params.get(Pluggable.SECTION_KEY_ALGORITHM)
         gamma = svm_params.get('gamma', None)
+        solver = svm_params.get('solver', 'cvxopt')
+        initial_alpha = svm_params.get('initial_alpha')
+        if initial_alpha is not None:
+            initial_alpha = np.asarray(initial_alpha)
 
         multiclass_extension = None
         multiclass_extension_params = params.get(Pluggable.SECTION_KEY_MULTICLASS_EXTENSION)
@@ -91,7 +129,7 @@ class SVM_Classical(QuantumAlgorithm):
             logger.info("Multiclass dataset with extension: {}".format(multiclass_extension_params['name']))
 
         return cls(algo_input.training_dataset, algo_input.test_dataset,
-                   algo_input.datapoints, gamma, multiclass_extension)
+                   algo_input.datapoints, gamma, multiclass_extension, solver, initial_alpha)
 
     def train(self, data, labels):
         """
@@ -73,7 +73,8 @@ class _QSVM_Binary(_QSVM_ABC):
         kernel_matrix = self._qalgo.construct_kernel_matrix(data)
         labels = labels * 2 - 1  # map label from 0 --> -1 and 1 --> 1
         labels = labels.astype(np.float)
-        [alpha, b, support] = optimize_svm(kernel_matrix, labels, scaling=scaling)
+        [alpha, b, support] = optimize_svm(kernel_matrix, labels, scaling=scaling, solver=self._qalgo._solver,
+                                           initial_alpha=self._qalgo._initial_alpha)
         support_index = np.where(support)
         alphas = alpha[support_index]
         svms = data[support_index]
@@ -33,18 +33,40 @@ class _QSVM_Multiclass(_QSVM_ABC):
         super().__init__(qalgo)
         self.multiclass_classifier = multiclass_classifier
         self.multiclass_classifier.params.append(qalgo)
+        self._training_data = None
+
+    def _share_kernel(self, data, training_data=None):
+        # the estimators slice their kernel matrices from the one with all the training points,
+        # which include the support vectors of every estimator
+        if self._qalgo._share_kernel:
+            self._qalgo._set_kernel_cache(data, training_data)
 
     def train(self, data, labels):
-        self.multiclass_classifier.train(data, labels)
+        self._training_data = data
+        self._share_kernel(data)
+        try:
+            self.multiclass_classifier.train(data, labels)
+        finally:
+            self._qalgo._clear_kernel_cache()
 
     def test(self, data, labels):
-        accuracy = self.multiclass_classifier.test(data, labels)
+        if self._training_data is not None:
+            self._share_kernel(data, self._training_data)
+        try:
+            accuracy = self.multiclass_classifier.test(data, labels)
+        finally:
+            self._qalgo._clear_kernel_cache()
         self._ret['testing_accuracy'] = accuracy
         self._ret['test_success_ratio'] = accuracy
         return accuracy
 
     def predict(self, data):
-        predicted_labels = self.multiclass_classifier.predict(data)
+        if self._training_data is not None:
+            self._share_kernel(data, self._training_data)
+        try:
+            predicted_labels = self.multiclass_classifier.predict(data)
+        finally:
+            self._qalgo._clear_kernel_cache()
         self._ret['predicted_labels'] = predicted_labels
         return predicted_labels
 
@@ -47,6 +47,22 @@ class QSVM(QuantumAlgorithm):
             'id': 'QSVM_schema',
             'type': 'object',
             'properties': {
+                'share_kernel': {
+                    'type': 'boolean',
+                    'default': False
+                },
+                'solver': {
+                    'type': 'string',
+                    'default': 'cvxopt',
+                    'enum': ['cvxopt', 'smo']
+                },
+                'initial_alpha': {
+                    'type': ['array', 'null'],
+                    "items": {
+                        "type": "number"
+                    },
+                    'default': None
+                }
             },
             'additionalProperties': False
         },
@@ -65,7 +81,7 @@ class QSVM(QuantumAlgorithm):
     BATCH_SIZE = 1000
 
     def __init__(self, feature_map, training_dataset=None, test_dataset=None, datapoints=None,
-                 multiclass_extension=None):
+                 multiclass_extension=None, share_kernel=False, solver='cvxopt', initial_alpha=None):
         """Constructor.
 
         Args:
@@ -75,9 +91,16 @@ class QSVM(QuantumAlgorithm):
             datapoints (numpy.ndarray, optional): prediction dataset.
             multiclass_extension (MultiExtension, optional): if number of classes > 2 then
                 a multiclass scheme is needed.
+            share_kernel (bool, optional): if True, the multiclass estimators are trained and evaluated
+                on slices of one kernel matrix over all training points, instead of computing a kernel
+                matrix per estimator.
+            solver (str, optional): quadratic program solver of the training, 'cvxopt' or 'smo',
+                see `optimize_svm`.
+            initial_alpha (numpy.ndarray, optional): starting alphas of the 'smo' solver, one per training
+                point, e.g. the alphas of a previous training; binary classification only.
 
         Raises:
-            AquaError: use binary classifer for classes > 3
+            AquaError: use binary classifer for classes > 3, or initial_alpha with a multiclass extension
         """
         super().__init__()
         # check the validity of provided arguments if possible
@@ -105,10 +128,16 @@ class QSVM(QuantumAlgorithm):
 
         self.feature_map = feature_map
         self.num_qubits = self.feature_map.num_qubits
+        self._share_kernel = share_kernel
+        self._kernel_cache = None
+        self._solver = solver
+        self._initial_alpha = initial_alpha
 
         if multiclass_extension is None:
             qsvm_instance = _QSVM_Binary(self)
         else:
+            if initial_alpha is not None:
+                raise AquaError('initial_alpha is only supported for binary classification.')
             qsvm_instance = _QSVM_Multiclass(self, multiclass_extension)
 
         self.instance = qsvm_instance
@@ -133,8 +162,15 @@ class QSVM(QuantumAlgorithm):
                                                        multiclass_extension_params['name']).init_params(params)
             logger.info("Multiclass classifier based on {}".format(multiclass_extension_params['name']))
 
+        qsvm_params = params.get(Pluggable.SECTION_KEY_ALGORITHM)
+        share_kernel = qsvm_params.get('share_kernel', False)
+        solver = qsvm_params.get('solver', 'cvxopt')
+        initial_alpha = qsvm_params.get('initial_alpha')
+        if initial_alpha is not None:
+            initial_alpha = np.asarray(initial_alpha)
+
         return cls(feature_map, algo_input.training_dataset, algo_input.test_dataset,
-                   algo_input.datapoints, multiclass_extension)
+                   algo_input.datapoints, multiclass_extension, share_kernel, solver, initial_alpha)
 
     @staticmethod
     def _construct_circuit(x, feature_map, measurement, is_statevector_sim=False):
@@ -327,8 +363,45 @@ class QSVM(QuantumAlgorithm):
         if self._quantum_instance is None:
             raise AquaError("Either setup quantum instance or provide it in the parameter.")
 
+        kernel_matrix = self._get_cached_kernel_matrix(x1_vec, x2_vec)
+        if kernel_matrix is not None:
+            return kernel_matrix
         return QSVM.get_kernel_matrix(self._quantum_instance, self.feature_map, x1_vec, x2_vec)
 
+    @staticmethod
+    def _index_points(x_vec):
+        return {np.asarray(x, dtype=float).tobytes(): i for i, x in enumerate(x_vec)}
+
+    def _set_kernel_cache(self, x1_vec, x2_vec=None):
+        """
+        Compute the kernel matrix of x1_vec and x2_vec once, such that the kernel matrices of any
+        subsets of their points are sliced from it by construct_kernel_matrix.
+
+        Args:
+            x1_vec (numpy.ndarray): data points, 2-D array, N1xD
+            x2_vec (numpy.ndarray): data points, 2-D array, N2xD, defaults to x1_vec
+        """
+        self._kernel_cache = None
+        kernel_matrix = self.construct_kernel_matrix(x1_vec, x2_vec)
+        self._kernel_cache = (QSVM._index_points(x1_vec),
+                              QSVM._index_points(x1_vec if x2_vec is None else x2_vec),
+                              kernel_matrix)
+
+    def _clear_kernel_cache(self):
+        self._kernel_cache = None
+
+    def _get_cached_kernel_matrix(self, x1_vec, x2_vec=None):
+        if self._kernel_cache is None:
+            return None
+        rows, cols, kernel_matrix = self._kernel_cache
+        try:
+            row_indices = [rows[np.asarray(x, dtype=float).tobytes()] for x in x1_vec]
+            col_indices = [cols[np.asarray(x, dtype=float).tobytes()]
+                           for x in (x1_vec if x2_vec is None else x2_vec)]
+        except KeyError:
+            return None
+        return kernel_matrix[np.ix_(row_indices, col_indices)]
+
     def train(self, data, labels, quantum_instance=None):
         """
         Train the svm.
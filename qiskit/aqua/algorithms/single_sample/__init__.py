@@ -16,6 +16,7 @@ from .grover.grover import Grover
 from .iterative_qpe.iqpe import IQPE
 from .qpe.qpe import QPE
 from .amplitude_estimation.ae import AmplitudeEstimation
+from .amplitude_estimation.mlae import MaximumLikelihoodAmplitudeEstimation
 from .simon.simon import Simon
 from .deutsch_jozsa.dj import DeutschJozsa
 from .bernstein_vazirani.bv import BernsteinVazirani
@@ -28,6 +29,7 @@ __all__ = [
     'IQPE',
     'QPE',
     'AmplitudeEstimation',
+    'MaximumLikelihoodAmplitudeEstimation',
     'Simon',
     'DeutschJozsa',
     'BernsteinVazirani',
@@ -24,6 +24,7 @@ from qiskit.aqua import AquaError
 from qiskit.aqua import Pluggable, PluggableType, get_pluggable_class
 from qiskit.aqua.algorithms import QuantumAlgorithm
 from qiskit.aqua.circuits import PhaseEstimationCircuit
+from qiskit.aqua.utils import CachedCircuitFactory
 from qiskit.aqua.components.iqfts import Standard
 from .q_factory import QFactory
 
@@ -102,6 +103,7 @@ class AmplitudeEstimation(QuantumAlgorithm):
             iqft = Standard(self._m)
 
         self._iqft = iqft
+        self._cached_q_factory = None
         self._circuit = None
         self._ret = {}
 
@@ -144,29 +146,31 @@ class AmplitudeEstimation(QuantumAlgorithm):
         Returns:
             the QuantumCircuit object for the constructed circuit
         """
+        # reuse the controlled powers of Q built by previous calls
+        if self._cached_q_factory is None or self._cached_q_factory.circuit_factory is not self.q_factory:
+            self._cached_q_factory = CachedCircuitFactory(self.q_factory)
+
         pec = PhaseEstimationCircuit(
             iqft=self._iqft, num_ancillae=self._m,
             state_in_circuit_factory=self.a_factory,
-            unitary_circuit_factory=self.q_factory
+            unitary_circuit_factory=self._cached_q_factory
         )
 
         self._circuit = pec.construct_circuit(measurement=measurement)
         return self._circuit
 
     def _evaluate_statevector_results(self, probabilities):
-        # map measured results to estimates
-        y_probabilities = OrderedDict()
-        for i, probability in enumerate(probabilities):
-            b = "{0:b}".format(i).rjust(self._num_qubits, '0')[::-1]
-            y = int(b[:self._m], 2)
-            y_probabilities[y] = y_probabilities.get(y, 0) + probability
-
-        a_probabilities = OrderedDict()
-        for y, probability in y_probabilities.items():
-            if y >= int(self._M / 2):
-                y = self._M - y
-            a = np.power(np.sin(y * np.pi / 2 ** self._m), 2)
-            a_probabilities[a] = a_probabilities.get(a, 0) + probability
+        # map measured results to estimates, y being the evaluation qubits read in reversed bit order
+        evaluation_bits = (np.arange(len(probabilities))[:, np.newaxis] >> np.arange(self._m)) & 1
+        ys = evaluation_bits @ (1 << np.arange(self._m - 1, -1, -1))
+        y_weights = np.bincount(ys, weights=probabilities, minlength=self._M)
+        y_probabilities = OrderedDict(zip(range(self._M), y_weights))
+
+        # y and M - y give the same estimate
+        folded_ys = np.minimum(np.arange(self._M), self._M - np.arange(self._M))
+        a_weights = np.bincount(folded_ys, weights=y_weights)
+        a_values = np.power(np.sin(np.arange(len(a_weights)) * np.pi / 2 ** self._m), 2)
+        a_probabilities = OrderedDict(zip(a_values, a_weights))
 
         return a_probabilities, y_probabilities
 
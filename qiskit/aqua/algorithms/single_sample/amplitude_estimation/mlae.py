@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+The Maximum Likelihood Amplitude Estimation Algorithm.
+"""
+
+import logging
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.aqua import AquaError
+from qiskit.aqua import Pluggable, PluggableType, get_pluggable_class
+from qiskit.aqua.algorithms import QuantumAlgorithm
+from .q_factory import QFactory
+
+logger = logging.getLogger(__name__)
+
+
+class MaximumLikelihoodAmplitudeEstimation(QuantumAlgorithm):
+    """
+    The Maximum Likelihood Amplitude Estimation algorithm.
+
+    Instead of phase estimation, the circuits Q^k A |0> are sampled for a schedule of powers k,
+    without evaluation qubits, and the amplitude a = sin^2(theta) maximizing the likelihood of the
+    measured objective qubit, P(1 | k) = sin^2((2k + 1) theta), is returned.
+
+    See https://arxiv.org/abs/1904.10246
+    """
+
+    CONFIGURATION = {
+        'name': 'MaximumLikelihoodAmplitudeEstimation',
+        'description': 'Maximum Likelihood Amplitude Estimation Algorithm',
+        'input_schema': {
+            '$schema': 'http://json-schema.org/schema#',
+            'id': 'MaximumLikelihoodAmplitudeEstimation_schema',
+            'type': 'object',
+            'properties': {
+                'num_oracle_circuits': {
+                    'type': 'integer',
+                    'default': 5,
+                    'minimum': 1
+                },
+                'likelihood_evals': {
+                    'type': ['integer', 'null'],
+                    'default': None
+                }
+            },
+            'additionalProperties': False
+        },
+        'problems': ['uncertainty'],
+        'depends': [
+            {
+                'pluggable_type': 'uncertainty_problem',
+                'default': {
+                    'name': 'EuropeanCallDelta'
+                }
+            },
+        ],
+    }
+
+    def __init__(self, num_oracle_circuits, a_factory, i_objective=None, q_factory=None, likelihood_evals=None):
+        """
+        Constructor.
+
+        Args:
+            num_oracle_circuits (int): number of circuits, which apply the powers 0, 1, 2, 4, ..., 2^(num_oracle_circuits - 2) of Q
+            a_factory (CircuitFactory): the CircuitFactory subclass object representing the problem unitary
+            i_objective (int): index of the objective qubit, defaults to the last qubit of the problem unitary
+            q_factory (CircuitFactory): the CircuitFactory subclass object representing an amplitude estimation sample (based on a_factory)
+            likelihood_evals (int): number of grid points of theta in [0, pi/2] evaluating the likelihood,
+                                    defaults to a resolution finer than the largest power of Q
+        """
+        self.validate(locals())
+        super().__init__()
+
+        # get/construct A/Q operator
+        self.a_factory = a_factory
+        if i_objective is None:
+            i_objective = self.a_factory.num_target_qubits - 1
+        self.i_objective = i_objective
+        if q_factory is None:
+            self.q_factory = QFactory(a_factory, i_objective)
+        else:
+            self.q_factory = q_factory
+
+        self._evaluation_schedule = np.asarray([0] + [2 ** j for j in range(num_oracle_circuits - 1)])
+        if likelihood_evals is None:
+            likelihood_evals = max(10000, int(np.pi / 2 * 1000 * (2 * self._evaluation_schedule[-1] + 1)))
+        self._likelihood_evals = likelihood_evals
+
+        self._num_ancillas = max(self.a_factory.required_ancillas(), self.q_factory.required_ancillas())
+        self._circuits = []
+        self._ret = {}
+
+    @classmethod
+    def init_params(cls, params, algo_input):
+        """
+        Initialize via parameters dictionary and algorithm input instance
+        Args:
+            params: parameters dictionary
+            algo_input: Input instance
+        """
+        if algo_input is not None:
+            raise AquaError("Input instance not supported.")
+
+        ae_params = params.get(Pluggable.SECTION_KEY_ALGORITHM)
+        num_oracle_circuits = ae_params.get('num_oracle_circuits')
+        likelihood_evals = ae_params.get('likelihood_evals')
+
+        uncertainty_problem_params = params.get(Pluggable.SECTION_KEY_UNCERTAINTY_PROBLEM)
+        uncertainty_problem = get_pluggable_class(
+            PluggableType.UNCERTAINTY_PROBLEM,
+            uncertainty_problem_params['name']).init_params(params)
+
+        return cls(num_oracle_circuits, uncertainty_problem, q_factory=None, likelihood_evals=likelihood_evals)
+
+    @property
+    def evaluation_schedule(self):
+        """ Returns the powers of Q applied by the circuits """
+        return self._evaluation_schedule
+
+    def construct_circuits(self, measurement=False):
+        """
+        Construct the circuits Q^k A |0> of the evaluation schedule.
+
+        Args:
+            measurement (bool): Boolean flag to indicate if the objective qubit should be measured.
+
+        Returns:
+            list of the QuantumCircuit objects, one per power of Q
+        """
+        self._circuits = []
+        for power in self._evaluation_schedule:
+            q = QuantumRegister(self.a_factory.num_target_qubits, name='q')
+            qc = QuantumCircuit(q)
+            q_ancillas = None
+            if self._num_ancillas > 0:
+                q_ancillas = QuantumRegister(self._num_ancillas, name='aux')
+                qc.add_register(q_ancillas)
+            self.a_factory.build(qc, q, q_ancillas)
+            self.q_factory.build_power(qc, q, power, q_ancillas)
+            if measurement:
+                c = ClassicalRegister(1)
+                qc.add_register(c)
+                qc.measure(q[self.i_objective], c[0])
+            self._circuits.append(qc)
+        return self._circuits
+
+    def _compute_mle(self, good_counts, shots):
+        """
+        Maximize the likelihood of the measured counts over a grid of theta.
+
+        Args:
+            good_counts (numpy.ndarray): number of measured 1s of the objective qubit, per power of Q
+            shots (numpy.ndarray): number of shots, per power of Q
+
+        Returns:
+            float: the angle theta maximizing the likelihood
+        """
+        thetas = np.linspace(0, np.pi / 2, self._likelihood_evals)
+        eps = 1e-15  # log(0) guard at the boundaries of the grid
+        # summed one power of Q at a time, so that the memory stays linear in the grid size
+        log_likelihood = np.zeros(len(thetas))
+        for power, good, total in zip(self._evaluation_schedule, good_counts, shots):
+            probabilities = np.sin((2 * power + 1) * thetas) ** 2
+            log_likelihood += good * np.log(np.maximum(probabilities, eps))
+            log_likelihood += (total - good) * np.log(np.maximum(1 - probabilities, eps))
+        return thetas[np.argmax(log_likelihood)]
+
+    def _run(self):
+        if self._quantum_instance.is_statevector:
+            # the amplitude is read from the state A |0> directly
+            circuit = self.construct_circuits(measurement=False)[0]
+            ret = self._quantum_instance.execute(circuit)
+            state_vector = np.asarray(ret.get_statevector(circuit))
+            self._ret['statevector'] = state_vector
+            state_probabilities = np.real(state_vector.conj() * state_vector)
+            good_states = (np.arange(len(state_probabilities)) >> self.i_objective) & 1 == 1
+            value = np.sum(state_probabilities[good_states])
+            theta = np.arcsin(np.sqrt(value))
+        else:
+            # run all the circuits in one batch
+            circuits = self.construct_circuits(measurement=True)
+            ret = self._quantum_instance.execute(circuits)
+            counts = [ret.get_counts(circuit) for circuit in circuits]
+            good_counts = np.asarray([c.get('1', 0) for c in counts], dtype=float)
+            shots = np.asarray([sum(c.values()) for c in counts], dtype=float)
+            self._ret['counts'] = counts
+            self._ret['good_counts'] = good_counts
+            theta = self._compute_mle(good_counts, shots)
+            value = np.sin(theta) ** 2
+
+        self._ret['evaluation_schedule'] = self._evaluation_schedule
+        self._ret['theta'] = theta
+        self._ret['value'] = value
+        self._ret['estimation'] = self.a_factory.value_to_estimation(value)
+        return self._ret
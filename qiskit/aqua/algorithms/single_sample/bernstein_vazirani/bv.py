@@ -23,7 +23,7 @@ from qiskit import ClassicalRegister, QuantumCircuit
 
 from qiskit.aqua import AquaError, Pluggable, PluggableType, get_pluggable_class
 from qiskit.aqua.algorithms import QuantumAlgorithm
-from qiskit.aqua.utils import get_subsystem_density_matrix
+from qiskit.aqua.utils import get_subsystem_probabilities
 
 logger = logging.getLogger(__name__)
 
@@ -121,17 +121,11 @@ class BernsteinVazirani(QuantumAlgorithm):
             qc = self.construct_circuit(measurement=False)
             result = self._quantum_instance.execute(qc)
             complete_state_vec = result.get_statevector(qc)
-            variable_register_density_matrix = get_subsystem_density_matrix(
+            variable_register_probabilities = get_subsystem_probabilities(
                 complete_state_vec,
                 range(len(self._oracle.variable_register), qc.width())
             )
-            variable_register_density_matrix_diag = np.diag(variable_register_density_matrix)
-            max_amplitude = max(
-                variable_register_density_matrix_diag.min(),
-                variable_register_density_matrix_diag.max(),
-                key=abs
-            )
-            max_amplitude_idx = np.where(variable_register_density_matrix_diag == max_amplitude)[0][0]
+            max_amplitude_idx = np.argmax(variable_register_probabilities)
             top_measurement = np.binary_repr(max_amplitude_idx, len(self._oracle.variable_register))
         else:
             qc = self.construct_circuit(measurement=True)
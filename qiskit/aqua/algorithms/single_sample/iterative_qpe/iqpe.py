@@ -25,7 +25,6 @@ from qiskit.quantum_info import Pauli
 
 from qiskit.aqua import Operator, AquaError
 from qiskit.aqua import Pluggable, PluggableType, get_pluggable_class
-from qiskit.aqua.utils import get_subsystem_density_matrix
 from qiskit.aqua.algorithms import QuantumAlgorithm
 
 
@@ -90,7 +89,7 @@ class IQPE(QuantumAlgorithm):
 
     def __init__(self, operator, state_in, num_time_slices=1, num_iterations=1,
                  expansion_mode='suzuki', expansion_order=2,
-                 shallow_circuit_concat=False):
+                 shallow_circuit_concat=False, speculative_execution=False):
         """
         Constructor.
 
@@ -102,6 +101,8 @@ class IQPE(QuantumAlgorithm):
             expansion_mode (str): the expansion mode (trotter|suzuki)
             expansion_order (int): the suzuki expansion order
             shallow_circuit_concat (bool): indicate whether to use shallow (cheap) mode for circuit concatenation
+            speculative_execution (bool): on non-statevector backends, indicate whether to execute the circuits of
+                both candidate next iterations together with the current one, halving the number of executions
         """
         self.validate(locals())
         super().__init__()
@@ -112,6 +113,7 @@ class IQPE(QuantumAlgorithm):
         self._expansion_mode = expansion_mode
         self._expansion_order = expansion_order
         self._shallow_circuit_concat = shallow_circuit_concat
+        self._speculative_execution = speculative_execution
         self._state_register = None
         self._ancillary_register = None
         self._pauli_list = None
@@ -195,6 +197,21 @@ class IQPE(QuantumAlgorithm):
             QuantumCircuit: the quantum circuit per iteration
         """
         k = self._num_iterations if k is None else k
+        qc = self._construct_controlled_evolution_circuit(k)
+        a = self._ancillary_register
+        # rz on a[0]
+        qc.u1(omega, a[0])
+        # hadamard on a[0]
+        qc.u2(0, np.pi, a[0])
+        if measurement:
+            c = ClassicalRegister(1, name='c')
+            qc.add_register(c)
+            # qc.barrier(self._ancillary_register)
+            qc.measure(self._ancillary_register, c)
+        return qc
+
+    def _construct_controlled_evolution_circuit(self, k):
+        """Construct the kth iteration circuit up to, but excluding, the feedback rotation and the final hadamard."""
         a = QuantumRegister(1, name='a')
         q = QuantumRegister(self._operator.num_qubits, name='q')
         self._ancillary_register = a
@@ -215,55 +232,83 @@ class IQPE(QuantumAlgorithm):
             qc += qc_evolutions
         # global phase due to identity pauli
         qc.u1(2 * np.pi * self._ancilla_phase_coef * (2 ** (k - 1)), a[0])
-        # rz on a[0]
-        qc.u1(omega, a[0])
-        # hadamard on a[0]
-        qc.u2(0, np.pi, a[0])
-        if measurement:
-            c = ClassicalRegister(1, name='c')
-            qc.add_register(c)
-            # qc.barrier(self._ancillary_register)
-            qc.measure(self._ancillary_register, c)
         return qc
 
     def _estimate_phase_iteratively(self):
         """Iteratively construct the different order of controlled evolution circuit to carry out phase estimation."""
         self._ret['top_measurement_label'] = ''
+        if self._quantum_instance.is_statevector:
+            return self._estimate_phase_from_statevectors()
 
         omega_coef = 0
         # k runs from the number of iterations back to 1
-        for k in range(self._num_iterations, 0, -1):
+        k = self._num_iterations
+        while k > 0:
             omega_coef /= 2
-            if self._quantum_instance.is_statevector:
-                qc = self.construct_circuit(k, -2 * np.pi * omega_coef, measurement=False)
-                result = self._quantum_instance.execute(qc)
-                complete_state_vec = result.get_statevector(qc)
-                ancilla_density_mat = get_subsystem_density_matrix(
-                    complete_state_vec,
-                    range(self._operator.num_qubits)
-                )
-                ancilla_density_mat_diag = np.diag(ancilla_density_mat)
-                max_amplitude = max(ancilla_density_mat_diag.min(), ancilla_density_mat_diag.max(), key=abs)
-                x = np.where(ancilla_density_mat_diag == max_amplitude)[0][0]
+            if self._speculative_execution and k > 1:
+                # the feedback angle of the next iteration only depends on the bit measured in this one,
+                # so both candidate circuits of the next iteration are executed along with the current one
+                circuits = [self.construct_circuit(k, -2 * np.pi * omega_coef, measurement=True)]
+                circuits += [
+                    self.construct_circuit(k - 1, -2 * np.pi * (omega_coef + x / 2) / 2, measurement=True)
+                    for x in [0, 1]
+                ]
+                result = self._quantum_instance.execute(circuits)
+                x = self._get_bit_from_counts(result.get_counts(circuits[0]))
+                omega_coef = self._record_bit(k, x, omega_coef) / 2
+                x = self._get_bit_from_counts(result.get_counts(circuits[1 + x]))
+                omega_coef = self._record_bit(k - 1, x, omega_coef)
+                k -= 2
             else:
                 qc = self.construct_circuit(k, -2 * np.pi * omega_coef, measurement=True)
-                measurements = self._quantum_instance.execute(qc).get_counts(qc)
-
-                if '0' not in measurements:
-                    if '1' in measurements:
-                        x = 1
-                    else:
-                        raise RuntimeError('Unexpected measurement {}.'.format(measurements))
-                else:
-                    if '1' not in measurements:
-                        x = 0
-                    else:
-                        x = 1 if measurements['1'] > measurements['0'] else 0
-            self._ret['top_measurement_label'] = '{}{}'.format(x, self._ret['top_measurement_label'])
-            omega_coef = omega_coef + x / 2
-            logger.info('Reverse iteration {} of {} with measured bit {}'.format(k, self._num_iterations, x))
+                x = self._get_bit_from_counts(self._quantum_instance.execute(qc).get_counts(qc))
+                omega_coef = self._record_bit(k, x, omega_coef)
+                k -= 1
         return omega_coef
 
+    def _estimate_phase_from_statevectors(self):
+        """
+        Carry out the phase estimation with all iterations' circuits simulated in a single execution.
+
+        The ancilla readout of the kth iteration only depends on the feedback angle omega through
+        the final rotation and hadamard: with a_0, a_1 the amplitudes of the state for the ancilla in 0 and 1,
+        P(0) - P(1) = 2 Re(exp(i omega) <a_0|a_1>). The circuits therefore do not depend on the
+        previously measured bits, and the feedback is applied classically.
+        """
+        iterations = range(self._num_iterations, 0, -1)
+        circuits = [self._construct_controlled_evolution_circuit(k) for k in iterations]
+        result = self._quantum_instance.execute(circuits)
+
+        omega_coef = 0
+        for k, qc in zip(iterations, circuits):
+            omega_coef /= 2
+            complete_state_vec = np.asarray(result.get_statevector(qc))
+            # the ancilla is the most significant qubit
+            half = len(complete_state_vec) // 2
+            overlap = np.vdot(complete_state_vec[:half], complete_state_vec[half:])
+            x = 0 if np.real(np.exp(-2j * np.pi * omega_coef) * overlap) >= 0 else 1
+            omega_coef = self._record_bit(k, x, omega_coef)
+        return omega_coef
+
+    @staticmethod
+    def _get_bit_from_counts(measurements):
+        if '0' not in measurements:
+            if '1' in measurements:
+                x = 1
+            else:
+                raise RuntimeError('Unexpected measurement {}.'.format(measurements))
+        else:
+            if '1' not in measurements:
+                x = 0
+            else:
+                x = 1 if measurements['1'] > measurements['0'] else 0
+        return x
+
+    def _record_bit(self, k, x, omega_coef):
+        self._ret['top_measurement_label'] = '{}{}'.format(x, self._ret['top_measurement_label'])
+        logger.info('Reverse iteration {} of {} with measured bit {}'.format(k, self._num_iterations, x))
+        return omega_coef + x / 2
+
     def _compute_energy(self):
         # check for identify paulis to get its coef for applying global phase shift on ancilla later
         num_identities = 0
@@ -23,7 +23,7 @@ from qiskit.quantum_info import Pauli
 
 from qiskit.aqua import Operator, AquaError
 from qiskit.aqua import Pluggable, PluggableType, get_pluggable_class
-from qiskit.aqua.utils import get_subsystem_density_matrix
+from qiskit.aqua.utils import get_subsystem_probabilities
 from qiskit.aqua.algorithms import QuantumAlgorithm
 from qiskit.aqua.circuits import PhaseEstimationCircuit
 
@@ -196,13 +196,11 @@ class QPE(QuantumAlgorithm):
             qc = self.construct_circuit(measurement=False)
             result = self._quantum_instance.execute(qc)
             complete_state_vec = result.get_statevector(qc)
-            ancilla_density_mat = get_subsystem_density_matrix(
+            ancilla_probabilities = get_subsystem_probabilities(
                 complete_state_vec,
                 range(self._num_ancillae, self._num_ancillae + self._operator.num_qubits)
             )
-            ancilla_density_mat_diag = np.diag(ancilla_density_mat)
-            max_amplitude = max(ancilla_density_mat_diag.min(), ancilla_density_mat_diag.max(), key=abs)
-            max_amplitude_idx = np.where(ancilla_density_mat_diag == max_amplitude)[0][0]
+            max_amplitude_idx = np.argmax(ancilla_probabilities)
             top_measurement_label = np.binary_repr(max_amplitude_idx, self._num_ancillae)[::-1]
         else:
             qc = self.construct_circuit(measurement=True)
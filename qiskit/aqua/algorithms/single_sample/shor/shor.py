@@ -27,7 +27,7 @@ from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 
 from qiskit.aqua.utils.arithmetic import is_power
 from qiskit.aqua import AquaError, Pluggable
-from qiskit.aqua.utils import get_subsystem_density_matrix
+from qiskit.aqua.utils import get_subsystem_probabilities
 from qiskit.aqua.algorithms import QuantumAlgorithm
 from qiskit.aqua.circuits import FourierTransformCircuits as ftc
 from qiskit.aqua.circuits.gates import mcu1
@@ -458,20 +458,16 @@ class Shor(QuantumAlgorithm):
 
             if self._quantum_instance.is_statevector:
                 circuit = self.construct_circuit(measurement=False)
-                logger.warning('The statevector_simulator might lead to subsequent computation using too much memory.')
                 result = self._quantum_instance.execute(circuit)
                 complete_state_vec = result.get_statevector(circuit)
-                # TODO: this uses too much memory
-                up_qreg_density_mat = get_subsystem_density_matrix(
+                up_qreg_probabilities = get_subsystem_probabilities(
                     complete_state_vec,
                     range(2 * self._n, 4 * self._n + 2)
                 )
-                up_qreg_density_mat_diag = np.diag(up_qreg_density_mat)
 
                 counts = dict()
-                for i, v in enumerate(up_qreg_density_mat_diag):
-                    if not v == 0:
-                        counts[bin(int(i))[2:].zfill(2 * self._n)] = v ** 2
+                for i in np.nonzero(up_qreg_probabilities)[0]:
+                    counts[bin(int(i))[2:].zfill(2 * self._n)] = up_qreg_probabilities[i]
             else:
                 circuit = self.construct_circuit(measurement=True)
                 counts = self._quantum_instance.execute(circuit).get_counts(circuit)
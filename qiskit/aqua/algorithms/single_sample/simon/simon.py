@@ -23,7 +23,7 @@ from qiskit import ClassicalRegister, QuantumCircuit
 
 from qiskit.aqua import AquaError, Pluggable, PluggableType, get_pluggable_class
 from qiskit.aqua.algorithms import QuantumAlgorithm
-from qiskit.aqua.utils import get_subsystem_density_matrix
+from qiskit.aqua.utils import get_subsystem_probabilities
 
 
 class Simon(QuantumAlgorithm):
@@ -148,16 +148,13 @@ class Simon(QuantumAlgorithm):
             qc = self.construct_circuit(measurement=False)
             result = self._quantum_instance.execute(qc)
             complete_state_vec = result.get_statevector(qc)
-            variable_register_density_matrix = get_subsystem_density_matrix(
+            variable_register_probabilities = get_subsystem_probabilities(
                 complete_state_vec,
                 range(len(self._oracle.variable_register), qc.width())
             )
-            variable_register_density_matrix_diag = np.diag(variable_register_density_matrix)
             measurements = {
-                np.binary_repr(idx, width=len(self._oracle.variable_register)):
-                    abs(variable_register_density_matrix_diag[idx]) ** 2
-                for idx in range(len(variable_register_density_matrix_diag))
-                if not variable_register_density_matrix_diag[idx] == 0
+                np.binary_repr(idx, width=len(self._oracle.variable_register)): variable_register_probabilities[idx]
+                for idx in np.nonzero(variable_register_probabilities)[0]
             }
         else:
             qc = self.construct_circuit(measurement=True)
@@ -20,6 +20,7 @@ import numpy as np
 from qiskit import QuantumRegister, QuantumCircuit, ClassicalRegister
 
 from qiskit.aqua import Operator, AquaError
+from qiskit.aqua.utils import CachedCircuitFactory
 
 
 class PhaseEstimationCircuit:
@@ -67,6 +68,9 @@ class PhaseEstimationCircuit:
         self._operator = operator
         if operator is not None:
             self._pauli_list = operator.get_flat_pauli_list() if pauli_list is None else pauli_list
+        # the controlled powers of the unitary are memoized across construct_circuit calls
+        if unitary_circuit_factory is not None and not isinstance(unitary_circuit_factory, CachedCircuitFactory):
+            unitary_circuit_factory = CachedCircuitFactory(unitary_circuit_factory)
         self._unitary_circuit_factory = unitary_circuit_factory
         self._state_in = state_in
         self._state_in_circuit_factory = state_in_circuit_factory
@@ -170,12 +174,14 @@ class PhaseEstimationCircuit:
                         )
                     else:
                         raise ValueError('Unrecognized expansion mode {}.'.format(self._expansion_mode))
-                for i in range(self._num_ancillae):
-                    qc_evolutions = Operator.construct_evolution_circuit(
-                        slice_pauli_list, -self._evo_time,
-                        self._num_time_slices, q, a, ctl_idx=i,
-                        shallow_slicing=self._shallow_circuit_concat
-                    )
+                # the controlled slice is built once and rescaled for every power of the unitary
+                qcs_evolutions = Operator.construct_controlled_evolution_circuits(
+                    slice_pauli_list, -self._evo_time,
+                    self._num_time_slices, q, a,
+                    unitary_powers=[2 ** i for i in range(self._num_ancillae)],
+                    shallow_slicing=self._shallow_circuit_concat
+                )
+                for i, qc_evolutions in enumerate(qcs_evolutions):
                     if self._shallow_circuit_concat:
                         qc.data += qc_evolutions.data
                     else:
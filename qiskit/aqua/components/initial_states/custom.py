@@ -139,6 +139,7 @@ class Custom(InitialState):
                 else:
                     AquaError('Unexpected state mode {}.'.format(self._state))
                 self._circuit = circuit
-            return self._circuit.copy()
+            # a new circuit, named apart from the ones returned before, since results are looked up by name
+            return QuantumCircuit() + self._circuit
         else:
             raise AquaError('Mode should be either "vector" or "circuit"')
@@ -15,7 +15,6 @@
 import logging
 
 import numpy as np
-from sklearn.utils.multiclass import _ovr_decision_function
 
 from qiskit.aqua.components.multiclass_extensions import MulticlassExtension
 
@@ -97,6 +96,8 @@ class AllPairs(MulticlassExtension):
         Returns:
             numpy.ndarray: predicted labels, Nx1 array
         """
+        from sklearn.utils.multiclass import _ovr_decision_function
+
         predictions = []
         confidences = []
         for i in self.estimators:
@@ -15,8 +15,6 @@
 import logging
 
 import numpy as np
-from sklearn.metrics.pairwise import euclidean_distances
-from sklearn.multiclass import _ConstantPredictor
 
 from qiskit.aqua import aqua_globals
 from qiskit.aqua.components.multiclass_extensions import MulticlassExtension
@@ -61,6 +59,8 @@ class ErrorCorrectingCode(MulticlassExtension):
             x (numpy.ndarray): input points
             y (numpy.ndarray): input labels
         """
+        from sklearn.multiclass import _ConstantPredictor
+
         self.estimators = []
         self.classes = np.unique(y)
         n_classes = self.classes.shape[0]
@@ -107,6 +107,8 @@ class ErrorCorrectingCode(MulticlassExtension):
         Returns:
             numpy.ndarray: predicted labels, Nx1 array
         """
+        from sklearn.metrics.pairwise import euclidean_distances
+
         confidences = []
         for e in self.estimators:
             confidence = np.ravel(e.decision_function(x))
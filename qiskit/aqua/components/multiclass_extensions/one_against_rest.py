@@ -14,8 +14,6 @@
 import logging
 
 import numpy as np
-from sklearn.utils.validation import _num_samples
-from sklearn.preprocessing import LabelBinarizer
 
 from qiskit.aqua.components.multiclass_extensions import MulticlassExtension
 
@@ -51,6 +49,8 @@ class OneAgainstRest(MulticlassExtension):
             X (numpy.ndarray): input points
             y (numpy.ndarray): input labels
         """
+        from sklearn.preprocessing import LabelBinarizer
+
         self.label_binarizer_ = LabelBinarizer(neg_label=0)
         Y = self.label_binarizer_.fit_transform(y)
         self.classes = self.label_binarizer_.classes_
@@ -88,6 +88,8 @@ class OneAgainstRest(MulticlassExtension):
         Returns:
             numpy.ndarray: predicted labels, Nx1 array
         """
+        from sklearn.utils.validation import _num_samples
+
         n_samples = _num_samples(x)
         maxima = np.empty(n_samples, dtype=float)
         maxima.fill(-np.inf)
@@ -77,7 +77,7 @@ class DiscriminatorNet():
             return sig
 
         def leaky_relu(z, slope=0.2):
-            return np.maximum(np.zeros(np.shape(z)), z) + slope * np.minimum(np.zeros(np.shape(z)), z)
+            return np.where(z < 0, slope * z, z)
 
         def single_layer_forward_propagation(x_old, w_new, activation="leaky_relu"):
             z_curr = np.dot(w_new, x_old)
@@ -130,12 +130,7 @@ class DiscriminatorNet():
             return da * sig * (1 - sig)
 
         def leaky_relu_backward(da, z, slope=0.2):
-            dz = np.array(da, copy=True)
-            for i, line in enumerate(z):
-                for j, element in enumerate(line):
-                    if element < 0:
-                        dz[i, j] = dz[i, j] * slope
-            return dz
+            return np.where(z < 0, slope * da, da)
 
         def single_layer_backward_propagation(da_curr, w_curr, z_curr, a_prev, activation="leaky_relu"):
             # m = a_prev.shape[1]
@@ -152,7 +147,7 @@ class DiscriminatorNet():
 
             return da_prev, dw_curr
 
-        grads_values = np.array([])
+        grads_values = []
         m = y.shape[1]
         y = y.reshape(np.shape(x))
         if weights is not None:
@@ -186,9 +181,9 @@ class DiscriminatorNet():
             da_prev, dw_curr = single_layer_backward_propagation(da_curr, np.array(w_curr), z_curr, a_prev,
                                                                  activ_function_curr)
 
-            grads_values = np.append([dw_curr], grads_values)
+            grads_values.append(dw_curr.flatten())
 
-        return grads_values
+        return np.concatenate(grads_values[::-1])
 
 
 class NumpyDiscriminator(DiscriminativeNetwork):
@@ -329,52 +324,84 @@ class NumpyDiscriminator(DiscriminativeNetwork):
                                   np.multiply(np.ones(np.shape(y))-y, np.log(np.maximum(np.ones(np.shape(x))*1e-4,
                                               np.ones(np.shape(x))-x))))
 
-    def _get_objective_function(self, data, weights):
+    def _get_forward_function(self, data):
+        """
+        Get the forward pass function
+        Args:
+            data: training and generated data
+
+        Returns: function computing, for given parameters, the labels and the layer activations of the training
+        resp. generated data. The result of the last parameters is cached, such that the objective and the gradient
+        at the same parameters share a single forward pass.
+
+        """
+        real_batch = data[0]
+        generated_batch = data[1]
+        cache = {}
+
+        def forward_function(params):
+            key = np.asarray(params).tobytes()
+            if cache.get('key') != key:
+                self._discriminator.parameters = params
+                self._discriminator.memory = {}
+                prediction_real = self.get_label(real_batch)
+                memory_real = self._discriminator.memory
+                self._discriminator.memory = {}
+                prediction_generated = self.get_label(generated_batch)
+                memory_generated = self._discriminator.memory
+                cache['key'] = key
+                cache['outputs'] = (prediction_real, memory_real, prediction_generated, memory_generated)
+            return cache['outputs']
+
+        return forward_function
+
+    def _get_objective_function(self, data, weights, forward_function=None):
         """
         Get the objective function
         Args:
             data: training and generated data
             weights: weights corresponding to training resp. generated data
+            forward_function: forward pass function shared with the gradient function, or None
 
         Returns: objective function for the optimization
 
         """
-        real_batch = data[0]
         real_prob = weights[0]
-        generated_batch = data[1]
         generated_prob = weights[1]
+        if forward_function is None:
+            forward_function = self._get_forward_function(data)
 
         def objective_function(params):
-            self._discriminator.parameters = params
             # Train on Real Data
-            prediction_real = self.get_label(real_batch)
+            prediction_real, _, prediction_fake, _ = forward_function(params)
             loss_real = self.loss(prediction_real, np.ones(np.shape(prediction_real)), real_prob)
-            prediction_fake = self.get_label(generated_batch)
             loss_fake = self.loss(prediction_fake, np.zeros(np.shape(prediction_fake)), generated_prob)
             return 0.5*(loss_real[0]+loss_fake[0])
 
         return objective_function
 
-    def _get_gradient_function(self, data, weights):
+    def _get_gradient_function(self, data, weights, forward_function=None):
         """
         Get the gradient function
         Args:
             data: training and generated data
             weights: weights corresponding to training resp. generated data
+            forward_function: forward pass function shared with the objective function, or None
 
         Returns: Gradient function for the optimization
 
         """
-        real_batch = data[0]
         real_prob = weights[0]
-        generated_batch = data[1]
         generated_prob = weights[1]
+        if forward_function is None:
+            forward_function = self._get_forward_function(data)
 
         def gradient_function(params):
+            prediction_real, memory_real, prediction_generated, memory_generated = forward_function(params)
             self._discriminator.parameters = params
-            prediction_real = self.get_label(real_batch)
+            self._discriminator.memory = memory_real
             grad_real = self._discriminator.backward(prediction_real, np.ones(np.shape(prediction_real)), real_prob)
-            prediction_generated = self.get_label(generated_batch)
+            self._discriminator.memory = memory_generated
             grad_generated = self._discriminator.backward(prediction_generated, np.zeros(np.shape(prediction_generated)),
                                                           generated_prob)
             return np.add(grad_real, grad_generated)
@@ -401,8 +428,9 @@ class NumpyDiscriminator(DiscriminativeNetwork):
         # Force single optimization iteration
         self._optimizer._maxiter = 1
         self._optimizer._t = 0
-        objective = self._get_objective_function(data, weights)
-        gradient = self._get_gradient_function(data, weights)
+        forward = self._get_forward_function(data)
+        objective = self._get_objective_function(data, weights, forward)
+        gradient = self._get_gradient_function(data, weights, forward)
         self._discriminator.parameters, loss, nfev = \
             self._optimizer.optimize(num_vars=len(self._discriminator.parameters), objective_function=objective,
                                      initial_point=np.array(self._discriminator.parameters), gradient_function=gradient)
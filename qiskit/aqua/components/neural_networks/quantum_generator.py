@@ -13,9 +13,11 @@
 # that they have been altered from the originals.
 
 
-import numpy as np
+from collections import OrderedDict
 from copy import deepcopy
 
+import numpy as np
+
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.aqua import aqua_globals
 from qiskit.aqua.components.optimizers import ADAM
@@ -32,6 +34,9 @@ class QuantumGenerator(GenerativeNetwork):
     """
     Generator
     """
+    # number of statevector outputs kept, keyed by the generator parameters
+    OUTPUT_CACHE_SIZE = 4
+
     CONFIGURATION = {
         'name': 'QuantumGenerator',
         'description': 'qGAN Generator Network',
@@ -164,6 +169,9 @@ class QuantumGenerator(GenerativeNetwork):
         self._shots = None
         self._discriminator = None
         self._ret = {}
+        self._output_cache = OrderedDict()
+        # the generator circuit and backend of the cached outputs
+        self._output_cache_owner = None
 
     @classmethod
     def init_params(cls, params):
@@ -247,58 +255,99 @@ class QuantumGenerator(GenerativeNetwork):
 
         Returns: array: generated samples, array: sample occurence in percentage
 
+        """
+        generated_samples, generated_samples_weights = self._get_outputs(quantum_instance, [params], shots)[0]
+        self.generator_circuit._probabilities = generated_samples_weights
+        return generated_samples, generated_samples_weights
+
+    def _get_outputs(self, quantum_instance, params_list, shots=None):
+        """
+        Get data samples from the generator for several parameter sets, running all circuits in a single execution.
+        The exact outputs of statevector simulations are cached per parameter set, such that parameters
+        evaluated again, e.g. by the sampling, the gradient and the relative entropy of the same
+        qGAN step, are not simulated again.
+        Args:
+            quantum_instance:  QuantumInstance, used to run the generator circuits.
+            params_list: list, parameter sets, where None stands for self._params
+            shots: int, if not None use a number of shots that is different from the number set in quantum_instance
+
+        Returns: list: (generated samples, sample occurence in percentage) of each parameter set
+
         """
         instance_shots = quantum_instance.run_config.shots
-        q = QuantumRegister(sum(self._num_qubits), name='q')
-        qc = QuantumCircuit(q)
-        qc.append(self.construct_circuit(params), q)
         if quantum_instance.is_statevector:
-            pass
-        else:
-            c = ClassicalRegister(sum(self._num_qubits), name='c')
-            qc.add_register(c)
-            qc.measure(q, c)
+            # the cached outputs hold for one generator circuit on one backend; the owner keeps a
+            # reference to both, compared by identity, so that a new circuit or backend clears them
+            owner = self._output_cache_owner
+            if owner is None or owner[0] is not self.generator_circuit or owner[1] is not quantum_instance.backend:
+                self._output_cache.clear()
+                self._output_cache_owner = (self.generator_circuit, quantum_instance.backend)
+        outputs = [None] * len(params_list)
+        pending = []
+        for idx, params in enumerate(params_list):
+            cache_key = None
+            if quantum_instance.is_statevector:
+                cache_key = np.asarray(self.generator_circuit.params if params is None else params,
+                                       dtype=float).tobytes()
+                if cache_key in self._output_cache:
+                    outputs[idx] = self._output_cache[cache_key]
+                    continue
+            q = QuantumRegister(sum(self._num_qubits), name='q')
+            qc = QuantumCircuit(q)
+            qc.append(self.construct_circuit(params), q)
+            if not quantum_instance.is_statevector:
+                c = ClassicalRegister(sum(self._num_qubits), name='c')
+                qc.add_register(c)
+                qc.measure(q, c)
+            pending.append((idx, cache_key, qc))
+
+        if not pending:
+            return outputs
 
         if shots is not None:
             quantum_instance.set_config(shots=shots)
 
-        result = quantum_instance.execute(qc)
+        result = quantum_instance.execute([qc for _, _, qc in pending])
 
-        generated_samples = []
-        if quantum_instance.is_statevector:
-            result = result.get_statevector(qc)
-            values = np.multiply(result, np.conj(result))
-            values = list(values.real)
-            keys = []
-            for j in range(len(values)):
-                keys.append(np.binary_repr(j, int(sum(self._num_qubits))))
-        else:
-            result = result.get_counts(qc)
-            keys = list(result)
-            values = list(result.values())
-            values = [float(v) / np.sum(values) for v in values]
-        generated_samples_weights = values
-        for i in range(len(keys)):
-            index = 0
-            temp = []
-            for k, p in enumerate(self._num_qubits):
-                bin_rep = 0
-                j = 0
-                while j < p:
-                    bin_rep += int(keys[i][index]) * 2 ** (int(p) - j - 1)
-                    j += 1
-                    index += 1
-                if len(self._num_qubits) > 1:
-                    temp.append(self._data_grid[k][int(bin_rep)])
-                else:
-                    temp.append(self._data_grid[int(bin_rep)])
-            generated_samples.append(temp)
+        for idx, cache_key, qc in pending:
+            if quantum_instance.is_statevector:
+                statevector = result.get_statevector(qc)
+                values = np.multiply(statevector, np.conj(statevector))
+                values = list(values.real)
+                keys = []
+                for j in range(len(values)):
+                    keys.append(np.binary_repr(j, int(sum(self._num_qubits))))
+            else:
+                counts = result.get_counts(qc)
+                keys = list(counts)
+                values = list(counts.values())
+                values = [float(v) / np.sum(values) for v in values]
+            generated_samples = []
+            for i in range(len(keys)):
+                index = 0
+                temp = []
+                for k, p in enumerate(self._num_qubits):
+                    bin_rep = 0
+                    j = 0
+                    while j < p:
+                        bin_rep += int(keys[i][index]) * 2 ** (int(p) - j - 1)
+                        j += 1
+                        index += 1
+                    if len(self._num_qubits) > 1:
+                        temp.append(self._data_grid[k][int(bin_rep)])
+                    else:
+                        temp.append(self._data_grid[int(bin_rep)])
+                generated_samples.append(temp)
+            outputs[idx] = (generated_samples, values)
+            if cache_key is not None:
+                self._output_cache[cache_key] = outputs[idx]
+                if len(self._output_cache) > self.OUTPUT_CACHE_SIZE:
+                    self._output_cache.popitem(last=False)
 
-        self.generator_circuit._probabilities = generated_samples_weights
         if shots is not None:
             # Restore the initial quantum_instance configuration
             quantum_instance.set_config(shots=instance_shots)
-        return generated_samples, generated_samples_weights
+        return outputs
 
     def loss(self, x, weights):
         """
@@ -330,14 +379,17 @@ class QuantumGenerator(GenerativeNetwork):
             """
             Objective function
             Args:
-                params: array, generator parameters
+                params: array, generator parameters, or several parameter sets concatenated
 
-            Returns: loss function
+            Returns: loss function, or list of the loss function of each parameter set
 
             """
-            generated_data, generated_prob = self.get_output(quantum_instance, params=params, shots=self._shots)
-            prediction_generated = discriminator.get_label(generated_data, detach=True)
-            return self.loss(prediction_generated, generated_prob)
+            params_list = np.split(np.asarray(params), len(params) // len(self.generator_circuit.params))
+            losses = []
+            for generated_data, generated_prob in self._get_outputs(quantum_instance, params_list, self._shots):
+                prediction_generated = discriminator.get_label(generated_data, detach=True)
+                losses.append(self.loss(prediction_generated, generated_prob))
+            return losses if len(losses) > 1 else losses[0]
         return objective_function
 
     def train(self, quantum_instance, shots=None):
@@ -354,6 +406,8 @@ class QuantumGenerator(GenerativeNetwork):
         # Force single optimization iteration
         self._optimizer._maxiter = 1
         self._optimizer._t = 0
+        # Evaluate the finite difference gradient of all parameters in a single execution
+        self._optimizer.set_max_evals_grouped(len(self.generator_circuit.params) + 1)
         objective = self._get_objective_function(quantum_instance, self._discriminator)
         self.generator_circuit.params, loss, nfev = \
             self._optimizer.optimize(num_vars=len(self.generator_circuit.params), objective_function=objective,
@@ -105,51 +105,52 @@ class Optimizer(Pluggable):
             self._options[name] = value
         logger.debug('options: {}'.format(self._options))
 
+    GRADIENT_METHODS = ['forward', 'central', 'parameter_shift']
+
     @staticmethod
-    def gradient_num_diff(x_center, f, epsilon, max_evals_grouped=1):
+    def gradient_num_diff(x_center, f, epsilon, max_evals_grouped=1, method='forward'):
         """
         We compute the gradient with the numeric differentiation in the parallel way, around the point x_center.
+
+        All the shifted points are built as the rows of one matrix and handed to f in groups of
+        max_evals_grouped points, such that a gradient costs a single call of f when max_evals_grouped
+        is at least the number of points.
+
         Args:
             x_center (ndarray): point around which we compute the gradient
             f (func): the function of which the gradient is to be computed.
             epsilon (float): the epsilon used in the numeric differentiation.
+            max_evals_grouped (int): max number of points evaluated by a single call of f.
+            method (str): 'forward' or 'central' finite differences, or 'parameter_shift' for
+                          functions of rotation angles, which shifts each angle by +-pi/2 and ignores epsilon.
         Returns:
             grad: the gradient computed
-
+        Raises:
+            ValueError: if the method is not supported
         """
-        forig = f(*((x_center,)))
-        grad = []
-        ei = np.zeros((len(x_center),), float)
-        todos = []
-        for k in range(len(x_center)):
-            ei[k] = 1.0
-            d = epsilon * ei
-            todos.append(x_center + d)
-            ei[k] = 0.0
-
-        counter = 0
-        chunk = []
-        chunks = []
-        length = len(todos)
-        for i in range(length):  # split all points to chunks, where each chunk has batch_size points
-            x = todos[i]
-            chunk.append(x)
-            counter += 1
-            if counter == max_evals_grouped or i == length-1:  # the last one does not have to reach batch_size
-                chunks.append(chunk)
-                chunk = []
-                counter = 0
-
-        for chunk in chunks:  # eval the chunks in order
-            parallel_parameters = np.concatenate(chunk)
-            todos_results = f(parallel_parameters)  # eval the points in a chunk (order preserved)
-            if isinstance(todos_results, float):
-                grad.append((todos_results - forig) / epsilon)
-            else:
-                for todor in todos_results:
-                    grad.append((todor - forig) / epsilon)
-
-        return np.array(grad)
+        if method not in Optimizer.GRADIENT_METHODS:
+            raise ValueError('Gradient method {} is not one of {}'.format(method, Optimizer.GRADIENT_METHODS))
+        x_center = np.asarray(x_center, dtype=float)
+        num_vars = len(x_center)
+        if method == 'parameter_shift':
+            epsilon = np.pi / 2
+        shifts = epsilon * np.eye(num_vars)
+        if method == 'forward':
+            points = np.vstack([x_center, x_center + shifts])
+        else:
+            points = np.vstack([x_center + shifts, x_center - shifts])
+
+        group = max(1, max_evals_grouped)
+        values = np.concatenate([
+            np.reshape(f(points[i:i + group].flatten()), -1) for i in range(0, len(points), group)
+        ])
+
+        if method == 'forward':
+            return (values[1:] - values[0]) / epsilon
+        elif method == 'central':
+            return (values[:num_vars] - values[num_vars:]) / (2 * epsilon)
+        else:
+            return (values[:num_vars] - values[num_vars:]) / 2
 
     @staticmethod
     def wrap_function(function, args):
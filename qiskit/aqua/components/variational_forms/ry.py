@@ -122,6 +122,8 @@ class RY(VariationalForm):
             self._num_parameters += len(self._entangler_map) * depth
 
         self._bounds = [(-np.pi, np.pi)] * self._num_parameters
+        # controlled rotations have three distinct eigenvalues and need more than two shifts
+        self._support_parameter_shift = entanglement_gate != 'crx'
 
     def construct_circuit(self, parameters, q=None):
         """
@@ -104,6 +104,7 @@ class RYRZ(VariationalForm):
         # for repeated block
         self._num_parameters += len(self._entangled_qubits) * depth * 2
         self._bounds = [(-np.pi, np.pi)] * self._num_parameters
+        self._support_parameter_shift = True
 
     def construct_circuit(self, parameters, q=None):
         """
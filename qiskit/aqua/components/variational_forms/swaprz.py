@@ -98,6 +98,9 @@ class SwapRZ(VariationalForm):
         # for repeated block
         self._num_parameters += (len(self._entangled_qubits) + len(self._entangler_map)) * depth
         self._bounds = [(-np.pi, np.pi)] * self._num_parameters
+        # each entangler parameter rotates both the XX and the YY parts of the swap, a generator
+        # with three distinct eigenvalues, which needs more than two shifts
+        self._support_parameter_shift = False
 
     def construct_circuit(self, parameters, q=None):
         """
@@ -40,6 +40,7 @@ class VariationalForm(Pluggable):
         self._num_parameters = 0
         self._num_qubits = 0
         self._bounds = list()
+        self._support_parameter_shift = False
         pass
 
     @classmethod
@@ -98,6 +99,19 @@ class VariationalForm(Pluggable):
         """
         return self._bounds
 
+    @property
+    def support_parameter_shift(self):
+        """Whether gradients can be computed with the parameter-shift rule.
+
+        True if each parameter is the angle of a single rotation exp(-i theta P / 2)
+        generated by a Pauli operator P, in which case the derivative of an expectation
+        value is half the difference of its values at theta + pi / 2 and theta - pi / 2.
+
+        Returns:
+            A boolean indicating the parameter-shift support.
+        """
+        return self._support_parameter_shift
+
     @property
     def setting(self):
         ret = "Variational Form: {}\n".format(self._configuration['name'])
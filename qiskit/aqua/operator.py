@@ -23,6 +23,7 @@ import sys
 import numpy as np
 from scipy import sparse as scisparse
 from scipy import linalg as scila
+from scipy.sparse.linalg import expm_multiply
 from qiskit import ClassicalRegister, QuantumCircuit
 from qiskit.quantum_info import Pauli
 from qiskit.qasm import pi
@@ -344,16 +345,22 @@ class Operator(object):
         elif mode == 'paulis' and self._paulis is not None:
             if self._paulis == []:
                 self._dia_matrix = None
+            elif any(np.any(pauli.x) for _, pauli in self._paulis):
+                self._dia_matrix = None
             else:
-                valid_dia_matrix_flag = True
-                dia_matrix = 0.0
-                for idx in range(len(self._paulis)):
-                    coeff, pauli = self._paulis[idx][0], self._paulis[idx][1]
-                    if not (np.all(np.logical_not(pauli.x))):
-                        valid_dia_matrix_flag = False
-                        break
-                    dia_matrix += coeff * pauli.to_spmatrix().diagonal()
-                self._dia_matrix = dia_matrix.copy() if valid_dia_matrix_flag else None
+                # the eigenvalue of a Z string on a basis state is the parity of the state bits on its support,
+                # evaluated for all the terms at once in chunks of bounded memory
+                num_qubits = self.num_qubits
+                coeffs = np.asarray([coeff for coeff, _ in self._paulis], dtype=complex)
+                z = np.asarray([pauli.z for _, pauli in self._paulis], dtype=np.int8)
+                bits = ((np.arange(2 ** num_qubits)[:, np.newaxis] >> np.arange(num_qubits)) & 1).astype(np.int8)
+                chunk_size = max(1, 2 ** 22 // 2 ** num_qubits)
+                dia_matrix = np.zeros(2 ** num_qubits, dtype=complex)
+                for start in range(0, len(coeffs), chunk_size):
+                    # the int8 product may wrap around, which preserves its parity
+                    parity = np.dot(bits, z[start:start + chunk_size].T) & 1
+                    dia_matrix += (1 - 2 * parity) @ coeffs[start:start + chunk_size]
+                self._dia_matrix = dia_matrix
 
         elif mode == 'grouped_paulis' and self._grouped_paulis is not None:
             self._grouped_paulis_to_paulis()
@@ -1186,12 +1193,80 @@ class Operator(object):
         Returns:
             QuantumCircuit: The Qiskit QuantumCircuit corresponding to specified evolution.
         """
+        qc_slice, _ = Operator._construct_evolution_slice(
+            slice_pauli_list, evo_time, num_time_slices, state_registers,
+            ancillary_registers=ancillary_registers, ctl_idx=ctl_idx, unitary_power=unitary_power,
+            use_basis_gates=use_basis_gates
+        )
+        return Operator._repeat_evolution_slice(qc_slice, num_time_slices, shallow_slicing)
+
+    @staticmethod
+    def construct_controlled_evolution_circuits(slice_pauli_list, evo_time, num_time_slices, state_registers,
+                                                ancillary_registers, unitary_powers=None, use_basis_gates=True,
+                                                shallow_slicing=False):
+        """
+        Construct the controlled evolution circuits for several control qubits and unitary powers at once.
+
+        The controlled slice is only built once, for the first control qubit and unitary power 1. The slice
+        for any other control qubit is derived from it by swapping the control qubit and scaling
+        the angles of the controlled rotations by the corresponding unitary power.
+
+        Args:
+            slice_pauli_list (list): The list of pauli terms corresponding to a single time slice to be evolved
+            evo_time (int): The evolution time
+            num_time_slices (int): The number of time slices for the expansion
+            state_registers (QuantumRegister): The Qiskit QuantumRegister corresponding to the qubits of the system
+            ancillary_registers (QuantumRegister): The Qiskit QuantumRegister corresponding to the control qubits
+            unitary_powers (list): The power to which the unitary operator is to be raised for each control qubit,
+                2 ** ctl_idx for control qubit ctl_idx of the ancillary_registers by default
+            use_basis_gates (bool): boolean flag for indicating only using basis gates when building circuit.
+            shallow_slicing (bool): boolean flag for indicating using shallow qc.data reference repetition for slicing
+
+        Returns:
+            list: The QuantumCircuit of the controlled evolution for each control qubit.
+        """
+        if unitary_powers is None:
+            unitary_powers = [2 ** ctl_idx for ctl_idx in range(len(ancillary_registers))]
+
+        skeleton, controlled_rotation_indices = Operator._construct_evolution_slice(
+            slice_pauli_list, evo_time, num_time_slices, state_registers,
+            ancillary_registers=ancillary_registers, ctl_idx=0, unitary_power=1,
+            use_basis_gates=use_basis_gates
+        )
+        skeleton_control = ancillary_registers[0]
+        controlled_rotation_indices = set(controlled_rotation_indices)
+
+        qcs = []
+        for ctl_idx, unitary_power in enumerate(unitary_powers):
+            control = ancillary_registers[ctl_idx]
+            qc_slice = QuantumCircuit(state_registers, ancillary_registers)
+            for idx, (instruction, qargs, cargs) in enumerate(skeleton.data):
+                # only the controlled rotations depend on the unitary power
+                if idx in controlled_rotation_indices:
+                    instruction = type(instruction)(*[param * unitary_power for param in instruction.params])
+                qargs = [control if qarg == skeleton_control else qarg for qarg in qargs]
+                qc_slice.data.append((instruction, qargs, cargs))
+            qcs.append(Operator._repeat_evolution_slice(qc_slice, num_time_slices, shallow_slicing))
+        return qcs
+
+    @staticmethod
+    def _construct_evolution_slice(slice_pauli_list, evo_time, num_time_slices, state_registers,
+                                   ancillary_registers=None, ctl_idx=0, unitary_power=None, use_basis_gates=True):
+        """
+        Construct a single time slice of the evolution circuit, see construct_evolution_circuit.
+
+        Returns:
+            QuantumCircuit: The circuit of the time slice.
+            list: The indices, in the circuit data, of the rotation gates whose angles scale with
+                the unitary power when ancillary_registers are given, empty otherwise.
+        """
         if state_registers is None:
             raise ValueError('Quantum state registers are required.')
 
         qc_slice = QuantumCircuit(state_registers)
         if ancillary_registers is not None:
             qc_slice.add_register(ancillary_registers)
+        controlled_rotation_indices = []
 
         # for each pauli [IXYZ]+, record the list of qubit pairs needing CX's
         cnot_qubit_pairs = [None] * len(slice_pauli_list)
@@ -1255,11 +1330,14 @@ class Operator(object):
                     lam = (2.0 * pauli[0] * evo_time / num_time_slices * unitary_power).real
 
                     if use_basis_gates:
+                        controlled_rotation_indices.append(len(qc_slice.data))
                         qc_slice.u1(lam / 2, state_registers[top_XYZ_pauli_indices[pauli_idx]])
                         qc_slice.cx(ancillary_registers[ctl_idx], state_registers[top_XYZ_pauli_indices[pauli_idx]])
+                        controlled_rotation_indices.append(len(qc_slice.data))
                         qc_slice.u1(-lam / 2, state_registers[top_XYZ_pauli_indices[pauli_idx]])
                         qc_slice.cx(ancillary_registers[ctl_idx], state_registers[top_XYZ_pauli_indices[pauli_idx]])
                     else:
+                        controlled_rotation_indices.append(len(qc_slice.data))
                         qc_slice.crz(lam, ancillary_registers[ctl_idx],
                                      state_registers[top_XYZ_pauli_indices[pauli_idx]])
 
@@ -1282,8 +1360,13 @@ class Operator(object):
                             qc_slice.u3(-pi / 2, -pi / 2, pi / 2, state_registers[qubit_idx])
                         else:
                             qc_slice.rx(-pi / 2, state_registers[qubit_idx])
+        return qc_slice, controlled_rotation_indices
 
-        # repeat the slice
+    @staticmethod
+    def _repeat_evolution_slice(qc_slice, num_time_slices, shallow_slicing=False):
+        """
+        Repeat a single time slice of the evolution circuit num_time_slices times.
+        """
         if shallow_slicing:
             logger.info('Under shallow slicing mode, the qc.data reference is repeated shallowly. '
                         'Thus, changing gates of one slice of the output circuit might affect other slices.')
@@ -1301,6 +1384,9 @@ class Operator(object):
         Compute the matrix for a single slice of the suzuki expansion following the paper
         https://arxiv.org/pdf/quant-ph/0508139.pdf
 
+        `evolve` no longer builds this matrix, applying the slice to the state instead; it is kept
+        as the dense reference the matrix-mode evolution is tested against.
+
         Args:
             pauli_list (list): The operator's complete list of pauli terms for the suzuki expansion
             lam (complex): The parameter lambda as defined in said paper
@@ -1360,6 +1446,50 @@ class Operator(object):
             )
             return side + middle + side
 
+    @staticmethod
+    def _apply_pauli_to_state(pauli, state):
+        """
+        Apply a pauli to a state vector without building the pauli's matrix.
+
+        Qubit i corresponds to bit i of the basis state index, consistent with `Pauli.to_spmatrix`.
+
+        Args:
+            pauli (Pauli): the pauli to apply
+            state (numpy.ndarray): the state vector, of length 2 ** num_qubits
+
+        Returns:
+            numpy.ndarray: the state vector P|state>
+        """
+        weights = 1 << np.arange(len(pauli.z))
+        x_mask = int(np.sum(weights[np.asarray(pauli.x, dtype=bool)]))
+        num_y = int(np.sum(np.logical_and(pauli.x, pauli.z)))
+        source = np.arange(state.shape[0]) ^ x_mask
+        sign = np.ones(state.shape[0])
+        for qubit in np.nonzero(pauli.z)[0]:
+            sign *= 1 - 2 * ((source >> qubit) & 1)
+        return (1j ** num_y) * sign * state[source]
+
+    @staticmethod
+    def _evolve_state_with_pauli_list(pauli_list, lam, state):
+        """
+        Apply the product of exponentials, exp(lam * c_1 * P_1) ... exp(lam * c_k * P_k), to a state vector
+        without building any operator matrix, i.e. the rightmost term is applied first.
+        Since every pauli squares to the identity, exp(a * P) = cosh(a) * I + sinh(a) * P,
+        which for a = -i * theta is the familiar cos(theta) * I - i * sin(theta) * P.
+
+        Args:
+            pauli_list (list): The list of [coeff, Pauli] terms
+            lam (complex): The common scaling factor of the exponents
+            state (numpy.ndarray): The state vector to evolve
+
+        Returns:
+            numpy.ndarray: The evolved state vector
+        """
+        for c, p in reversed(pauli_list):
+            a = lam * c
+            state = np.cosh(a) * state + np.sinh(a) * Operator._apply_pauli_to_state(p, state)
+        return state
+
     def evolve(
             self,
             state_in=None,
@@ -1398,39 +1528,35 @@ class Operator(object):
         if not (expansion_mode == 'trotter' or expansion_mode == 'suzuki'):
             raise NotImplementedError('Expansion mode {} not supported.'.format(expansion_mode))
 
-        pauli_list = self.get_flat_pauli_list()
-
         if evo_mode == 'matrix':
-            self._check_representation("matrix")
-
+            state_in = np.asarray(state_in, dtype=complex)
             if num_time_slices == 0:
-                return scila.expm(-1.j * evo_time * self._matrix.tocsc()) @ state_in
+                self._check_representation("matrix")
+                return expm_multiply(-1.j * evo_time * self._matrix.tocsc(), state_in)
             else:
-                if len(pauli_list) == 1:
-                    approx_matrix_slice = scila.expm(
-                        -1.j * evo_time / num_time_slices * pauli_list[0][0] * pauli_list[0][1].to_spmatrix().tocsc()
+                pauli_list = self.get_flat_pauli_list()
+                if len(pauli_list) == 1 or expansion_mode == 'trotter':
+                    slice_pauli_list = pauli_list
+                # suzuki expansion
+                elif expansion_mode == 'suzuki':
+                    slice_pauli_list = Operator._suzuki_expansion_slice_pauli_list(
+                        pauli_list,
+                        1,
+                        expansion_order
                     )
                 else:
-                    if expansion_mode == 'trotter':
-                        approx_matrix_slice = reduce(
-                            lambda x, y: x @ y,
-                            [
-                                scila.expm(-1.j * evo_time / num_time_slices * c * p.to_spmatrix().tocsc())
-                                for c, p in pauli_list
-                            ]
-                        )
-                    # suzuki expansion
-                    elif expansion_mode == 'suzuki':
-                        approx_matrix_slice = Operator._suzuki_expansion_slice_matrix(
-                            pauli_list,
-                            -1.j * evo_time / num_time_slices,
-                            expansion_order
-                        )
-                    else:
-                        raise ValueError('Unrecognized expansion mode {}.'.format(expansion_mode))
-                return reduce(lambda x, y: x @ y, [approx_matrix_slice] * num_time_slices) @ state_in
+                    raise ValueError('Unrecognized expansion mode {}.'.format(expansion_mode))
+                state_out = state_in
+                for _ in range(num_time_slices):
+                    state_out = Operator._evolve_state_with_pauli_list(
+                        slice_pauli_list,
+                        -1.j * evo_time / num_time_slices,
+                        state_out
+                    )
+                return state_out
 
         elif evo_mode == 'circuit':
+            pauli_list = self.get_flat_pauli_list()
             if num_time_slices == 0:
                 raise ValueError('Number of time slices should be a positive integer for {} mode.'.format(evo_mode))
             else:
@@ -1514,6 +1640,75 @@ class Operator(object):
                 '"targeted_representation" should be one of "paulis", "grouped_paulis" and "matrix".'
             )
 
+    @staticmethod
+    def _pack_F2(matrix):
+        """
+        Packs the rows of a binary matrix into 64-bit words, the column j being
+        the bit 7 - j % 8 of the byte j // 8 of a row.
+
+        Args:
+            matrix (numpy.ndarray): binary matrix
+
+        Returns:
+            numpy.ndarray: the packed matrix, of dtype uint64
+        """
+        matrix = np.asarray(matrix).astype(np.bool)
+        num_words = -(-matrix.shape[1] // 64)
+        packed = np.zeros((matrix.shape[0], 8 * num_words), dtype=np.uint8)
+        packed[:, :-(-matrix.shape[1] // 8)] = np.packbits(matrix, axis=1)
+        return packed.view(np.uint64)
+
+    @staticmethod
+    def _unpack_F2(words, num_cols):
+        """
+        Unpacks a matrix packed by `_pack_F2`.
+
+        Args:
+            words (numpy.ndarray): the packed matrix
+            num_cols (int): number of columns of the binary matrix
+
+        Returns:
+            numpy.ndarray: the binary matrix, of dtype int
+        """
+        bits = np.unpackbits(np.ascontiguousarray(words).view(np.uint8), axis=1)
+        return bits[:, :num_cols].astype(int)
+
+    @staticmethod
+    def _row_echelon_packed_F2(words):
+        """
+        Gauss-Jordan elimination on a packed binary matrix, XORing whole words of
+        all the rows having a bit set on the pivot column at once.
+
+        Each row, in order, eliminates its first non-zero column from all the other
+        rows; the zero rows, but the last one, are then moved to the bottom.
+
+        Args:
+            words (numpy.ndarray): the packed matrix, modified in place
+
+        Returns:
+            numpy.ndarray: the packed matrix in Echelon row form
+        """
+        num_rows = words.shape[0]
+        if num_rows == 0:
+            return words
+        bytes_view = words.view(np.uint8)
+        for i in range(num_rows):
+            nonzero_bytes = np.flatnonzero(bytes_view[i])
+            if len(nonzero_bytes) == 0:
+                continue
+            byte_index = nonzero_bytes[0]
+            # the pivot is the most significant set bit of the first non-zero byte
+            shift = int(bytes_view[i, byte_index]).bit_length() - 1
+            has_pivot = (bytes_view[:, byte_index] >> shift) & 1 == 1
+            has_pivot[i] = False
+            words[has_pivot] ^= words[i]
+
+        keep = np.any(words != 0, axis=1)
+        keep[-1] = True
+        matrix_out = np.zeros_like(words)
+        matrix_out[:np.count_nonzero(keep)] = words[keep]
+        return matrix_out
+
     @staticmethod
     def row_echelon_F2(matrix_in):
         """
@@ -1526,33 +1721,8 @@ class Operator(object):
         Returns:
             numpy.ndarray : matrix_in in Echelon row form
         """
-
-        size = matrix_in.shape
-
-        for i in range(size[0]):
-            pivot_index = 0
-            for j in range(size[1]):
-                if matrix_in[i, j] == 1:
-                    pivot_index = j
-                    break
-            for k in range(size[0]):
-                if k != i and matrix_in[k, pivot_index] == 1:
-                    matrix_in[k, :] = np.mod(matrix_in[k, :] + matrix_in[i, :], 2)
-
-        matrix_out_temp = copy.deepcopy(matrix_in)
-        indices = []
-        matrix_out = np.zeros(size)
-
-        for i in range(size[0] - 1):
-            if np.array_equal(matrix_out_temp[i, :], np.zeros(size[1])):
-                indices.append(i)
-        for row in np.sort(indices)[::-1]:
-            matrix_out_temp = np.delete(matrix_out_temp, (row), axis=0)
-
-        matrix_out[0:size[0] - len(indices), :] = matrix_out_temp
-        matrix_out = matrix_out.astype(int)
-
-        return matrix_out
+        words = Operator._row_echelon_packed_F2(Operator._pack_F2(matrix_in))
+        return Operator._unpack_F2(words, matrix_in.shape[1])
 
     @staticmethod
     def kernel_F2(matrix_in):
@@ -1567,16 +1737,16 @@ class Operator(object):
         """
 
         size = matrix_in.shape
-        kernel = []
-        matrix_in_id = np.vstack((matrix_in, np.identity(size[1])))
-        matrix_in_id_ech = (Operator.row_echelon_F2(matrix_in_id.transpose())).transpose()
+        # rows of [matrix_in^T | I] whose left block is eliminated hold the kernel vectors
+        matrix_in_id = np.hstack((np.asarray(matrix_in, dtype=np.bool).transpose(),
+                                  np.identity(size[1], dtype=np.bool)))
+        words = Operator._row_echelon_packed_F2(Operator._pack_F2(matrix_in_id))
 
-        for col in range(size[1]):
-            if (np.array_equal(matrix_in_id_ech[0:size[0], col], np.zeros(size[0])) and not
-                    np.array_equal(matrix_in_id_ech[size[0]:, col], np.zeros(size[1]))):
-                kernel.append(matrix_in_id_ech[size[0]:, col])
+        left_block = Operator._pack_F2(np.arange(size[0] + size[1])[np.newaxis, :] < size[0])[0]
+        in_kernel = ~np.any(words & left_block, axis=1) & np.any(words & ~left_block, axis=1)
+        kernel = Operator._unpack_F2(words[in_kernel], size[0] + size[1])[:, size[0]:]
 
-        return kernel
+        return list(kernel)
 
     def find_Z2_symmetries(self):
         """
@@ -1594,87 +1764,54 @@ class Operator(object):
         cliffords = []
         sq_list = []
 
-        stacked_paulis = []
-
         if self.is_empty():
             logger.info("Operator is empty.")
             return [], [], [], []
 
         self._check_representation("paulis")
 
-        for pauli in self._paulis:
-            stacked_paulis.append(np.concatenate((pauli[1].x, pauli[1].z), axis=0).astype(np.int))
-
-        stacked_matrix = np.array(np.stack(stacked_paulis))
+        stacked_matrix = np.hstack((np.asarray([pauli[1].x for pauli in self._paulis], dtype=np.bool),
+                                    np.asarray([pauli[1].z for pauli in self._paulis], dtype=np.bool)))
         symmetries = Operator.kernel_F2(stacked_matrix)
 
         if len(symmetries) == 0:
             logger.info("No symmetry is found.")
             return [], [], [], []
 
-        stacked_symmetries = np.stack(symmetries)
-        symm_shape = stacked_symmetries.shape
-
-        for row in range(symm_shape[0]):
-
-            Pauli_symmetries.append(Pauli(stacked_symmetries[row, : symm_shape[1] // 2],
-                                          stacked_symmetries[row, symm_shape[1] // 2:]))
-
-            stacked_symm_del = np.delete(stacked_symmetries, (row), axis=0)
-            for col in range(symm_shape[1] // 2):
-                # case symmetries other than one at (row) have Z or I on col qubit
-                Z_or_I = True
-                for symm_idx in range(symm_shape[0] - 1):
-                    if not (stacked_symm_del[symm_idx, col] == 0
-                            and stacked_symm_del[symm_idx, col + symm_shape[1] // 2] in (0, 1)):
-                        Z_or_I = False
-                if Z_or_I:
-                    if ((stacked_symmetries[row, col] == 1 and
-                         stacked_symmetries[row, col + symm_shape[1] // 2] == 0) or
-                        (stacked_symmetries[row, col] == 1 and
-                         stacked_symmetries[row, col + symm_shape[1] // 2] == 1)):
-                        sq_paulis.append(Pauli(np.zeros(symm_shape[1] // 2),
-                                               np.zeros(symm_shape[1] // 2)))
-                        sq_paulis[row].z[col] = False
-                        sq_paulis[row].x[col] = True
-                        sq_list.append(col)
-                        break
-
-                # case symmetries other than one at (row) have X or I on col qubit
-                X_or_I = True
-                for symm_idx in range(symm_shape[0] - 1):
-                    if not (stacked_symm_del[symm_idx, col] in (0, 1) and
-                            stacked_symm_del[symm_idx, col + symm_shape[1] // 2] == 0):
-                        X_or_I = False
-                if X_or_I:
-                    if ((stacked_symmetries[row, col] == 0 and
-                         stacked_symmetries[row, col + symm_shape[1] // 2] == 1) or
-                        (stacked_symmetries[row, col] == 1 and
-                         stacked_symmetries[row, col + symm_shape[1] // 2] == 1)):
-                        sq_paulis.append(Pauli(np.zeros(symm_shape[1] // 2), np.zeros(symm_shape[1] // 2)))
-                        sq_paulis[row].z[col] = True
-                        sq_paulis[row].x[col] = False
-                        sq_list.append(col)
-                        break
-
-                # case symmetries other than one at (row)  have Y or I on col qubit
-                Y_or_I = True
-                for symm_idx in range(symm_shape[0] - 1):
-                    if not ((stacked_symm_del[symm_idx, col] == 1 and
-                             stacked_symm_del[symm_idx, col + symm_shape[1] // 2] == 1)
-                            or (stacked_symm_del[symm_idx, col] == 0 and
-                                stacked_symm_del[symm_idx, col + symm_shape[1] // 2] == 0)):
-                        Y_or_I = False
-                if Y_or_I:
-                    if ((stacked_symmetries[row, col] == 0 and
-                         stacked_symmetries[row, col + symm_shape[1] // 2] == 1) or
-                        (stacked_symmetries[row, col] == 1 and
-                         stacked_symmetries[row, col + symm_shape[1] // 2] == 0)):
-                        sq_paulis.append(Pauli(np.zeros(symm_shape[1] // 2), np.zeros(symm_shape[1] // 2)))
-                        sq_paulis[row].z[col] = True
-                        sq_paulis[row].x[col] = True
-                        sq_list.append(col)
-                        break
+        stacked_symmetries = np.stack(symmetries).astype(np.bool)
+        num_qubits = stacked_symmetries.shape[1] // 2
+        symm_z = stacked_symmetries[:, :num_qubits]
+        symm_x = stacked_symmetries[:, num_qubits:]
+        # number of symmetries having a Z, X or a (Z or X but not Y) component on each qubit
+        count_z = np.sum(symm_z, axis=0)
+        count_x = np.sum(symm_x, axis=0)
+        count_z_xor_x = np.sum(symm_z ^ symm_x, axis=0)
+
+        for row in range(stacked_symmetries.shape[0]):
+
+            Pauli_symmetries.append(Pauli(symm_z[row], symm_x[row]))
+
+            # case symmetries other than one at (row) have X or I on col qubit, and (row) has Z or Y
+            anticommute_x = (count_z - symm_z[row] == 0) & symm_z[row]
+            # case symmetries other than one at (row) have Z or I on col qubit, and (row) has X or Y
+            anticommute_z = (count_x - symm_x[row] == 0) & symm_x[row]
+            # case symmetries other than one at (row) have Y or I on col qubit, and (row) has X or Z
+            anticommute_y = (count_z_xor_x - (symm_z[row] ^ symm_x[row]) == 0) & (symm_z[row] ^ symm_x[row])
+            candidates = np.flatnonzero(anticommute_x | anticommute_z | anticommute_y)
+            if len(candidates) == 0:
+                continue
+            col = candidates[0]
+            z_p = np.zeros(num_qubits, dtype=np.bool)
+            x_p = np.zeros(num_qubits, dtype=np.bool)
+            if anticommute_x[col]:
+                x_p[col] = True
+            elif anticommute_z[col]:
+                z_p[col] = True
+            else:
+                z_p[col] = True
+                x_p[col] = True
+            sq_paulis.append(Pauli(z_p, x_p))
+            sq_list.append(col)
 
         for symm_idx, Pauli_symm in enumerate(Pauli_symmetries):
             cliffords.append(Operator([[1 / np.sqrt(2), Pauli_symm], [1 / np.sqrt(2), sq_paulis[symm_idx]]]))
@@ -1721,24 +1858,173 @@ class Operator(object):
             logger.warning("The operator is empty, return the empty operator directly.")
             return operator
 
+        _, tapered_ops, _ = Operator.qubit_tapering_sectors(operator, cliffords, sq_list, [tapering_values])
+        return tapered_ops[0]
+
+    @staticmethod
+    def qubit_tapering_sectors(operator, cliffords, sq_list, sectors=None, min_eigenvalues=False):
+        """
+        Builds the tapered Operators of several symmetry sectors at once.
+
+        The Clifford conjugation is applied only once to the table of Paulis of the operator;
+        each sector's tapered operator is then obtained by flipping the signs of the coefficients
+        of the Paulis acting on the tapered qubits.
+
+        Args:
+            operator (Operator): the target operator to be tapered
+            cliffords ([Operator]): list of unitary Clifford transformation
+            sq_list ([int]): position of the single-qubit operators that anticommute
+            with the cliffords
+            sectors ([[int]]): list of tapering values, each an array of +/- 1 selecting a subspace,
+            defaults to all the 2 ** len(sq_list) sectors
+            min_eigenvalues (bool): whether to compute the lowest eigenvalue of each tapered
+            operator, in parallel over the sectors
+
+        Returns:
+            [[int]]: the tapering values of each sector
+            [Operator]: the tapered operator of each sector
+            [float]: the lowest eigenvalue of each tapered operator, or None if not requested
+
+        Raises:
+            AquaError: if the cliffords, sq_list and tapering values do not have the same length.
+        """
+        if sectors is None:
+            sectors = [list(values) for values in itertools.product([1, -1], repeat=len(sq_list))]
+        if len(cliffords) != len(sq_list) or any(len(values) != len(sq_list) for values in sectors):
+            raise AquaError("Number of Clifford unitaries has to be the same as length of single "
+                            "qubit list and tapering values.")
+
         operator.to_paulis()
+        z = np.asarray([pauli.z for _, pauli in operator.paulis], dtype=np.bool)
+        x = np.asarray([pauli.x for _, pauli in operator.paulis], dtype=np.bool)
+        coeffs = np.asarray([coeff for coeff, _ in operator.paulis], dtype=np.complex128)
 
         for clifford in cliffords:
-            operator = clifford * operator * clifford
+            z, x, coeffs = Operator._conjugate_pauli_table(z, x, coeffs, clifford)
+
+        # every Pauli acting on a tapered qubit picks the tapering value of that qubit
+        sq_list = np.asarray(sq_list, dtype=int)
+        on_sq = (z | x)[:, sq_list]
+        sector_signs = np.prod(np.where(on_sq[np.newaxis, :, :],
+                                        np.asarray(sectors)[:, np.newaxis, :], 1), axis=2)
+        z, x, sector_coeffs = Operator._merge_pauli_table(np.delete(z, sq_list, axis=1),
+                                                          np.delete(x, sq_list, axis=1),
+                                                          sector_signs * coeffs)
+
+        tapered_ops = []
+        for coeffs in sector_coeffs:
+            nonzero = np.flatnonzero(coeffs != 0)
+            tapered_ops.append(Operator(paulis=[[coeffs[i], Pauli(z[i], x[i])] for i in nonzero]))
+
+        eigenvalues = None
+        if min_eigenvalues:
+            eigenvalues = parallel_map(Operator._min_eigenvalue, tapered_ops,
+                                       num_processes=aqua_globals.num_processes)
+        return [list(values) for values in sectors], tapered_ops, eigenvalues
 
-        operator_out = Operator(paulis=[])
-        for pauli_term in operator.paulis:
-            coeff_out = pauli_term[0]
-            for idx, qubit_idx in enumerate(sq_list):
-                if not (not pauli_term[1].z[qubit_idx] and not pauli_term[1].x[qubit_idx]):
-                    coeff_out = tapering_values[idx] * coeff_out
-            z_temp = np.delete(pauli_term[1].z.copy(), np.asarray(sq_list))
-            x_temp = np.delete(pauli_term[1].x.copy(), np.asarray(sq_list))
-            pauli_term_out = [coeff_out, Pauli(z_temp, x_temp)]
-            operator_out += Operator(paulis=[pauli_term_out])
-
-        operator_out.zeros_coeff_elimination()
-        return operator_out
+    @staticmethod
+    def _multiply_pauli_tables(z_1, x_1, z_2, x_2):
+        """
+        Multiplies two tables of Paulis, with broadcasting over the rows.
+
+        Args:
+            z_1 (numpy.ndarray): z of the left Paulis
+            x_1 (numpy.ndarray): x of the left Paulis
+            z_2 (numpy.ndarray): z of the right Paulis
+            x_2 (numpy.ndarray): x of the right Paulis
+
+        Returns:
+            numpy.ndarray: z of the products
+            numpy.ndarray: x of the products
+            numpy.ndarray: the phase of each product
+        """
+        z = z_1 ^ z_2
+        x = x_1 ^ x_2
+        # a Pauli (z, x) is i^(z.x) X^x Z^z, and Z^z_1 X^x_2 = (-1)^(z_1.x_2) X^x_2 Z^z_1
+        exponent = np.sum(z_1 & x_1, axis=-1) + np.sum(z_2 & x_2, axis=-1) \
+            + 2 * np.sum(z_1 & x_2, axis=-1) - np.sum(z & x, axis=-1)
+        return z, x, np.asarray([1, 1j, -1, -1j])[exponent % 4]
+
+    @staticmethod
+    def _merge_pauli_table(z, x, coeffs):
+        """
+        Sums the coefficients of the duplicated Paulis of a table, keeping the order of
+        their first appearance.
+
+        Args:
+            z (numpy.ndarray): z of the Paulis
+            x (numpy.ndarray): x of the Paulis
+            coeffs (numpy.ndarray): coefficients, the last axis running over the Paulis
+
+        Returns:
+            numpy.ndarray: z of the distinct Paulis
+            numpy.ndarray: x of the distinct Paulis
+            numpy.ndarray: the summed coefficients
+        """
+        # the trailing set bit keeps the keys non-empty when the Paulis have no qubit left
+        bits = np.hstack((z, x, np.ones((z.shape[0], 1), dtype=np.bool)))
+        keys = np.ascontiguousarray(np.packbits(bits, axis=1))
+        keys = keys.view(np.dtype((np.void, keys.shape[1]))).ravel()
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        merged = np.zeros((len(first),) + coeffs.shape[:-1], dtype=coeffs.dtype)
+        np.add.at(merged, rank[inverse], np.moveaxis(coeffs, -1, 0))
+        return z[first[order]], x[first[order]], np.moveaxis(merged, 0, -1)
+
+    @staticmethod
+    def _conjugate_pauli_table(z, x, coeffs, clifford):
+        """
+        Computes clifford * P * clifford for a table of Paulis P, as done by the multiplication
+        of Operators.
+
+        Args:
+            z (numpy.ndarray): z of the Paulis
+            x (numpy.ndarray): x of the Paulis
+            coeffs (numpy.ndarray): coefficients of the Paulis
+            clifford (Operator): the Clifford unitary
+
+        Returns:
+            numpy.ndarray: z of the conjugated Paulis
+            numpy.ndarray: x of the conjugated Paulis
+            numpy.ndarray: coefficients of the conjugated Paulis
+        """
+        clifford.to_paulis()
+        terms_z, terms_x, terms_coeffs = [], [], []
+        for coeff_1, pauli_1 in clifford.paulis:
+            z_1, x_1, phase_1 = Operator._multiply_pauli_tables(pauli_1.z, pauli_1.x, z, x)
+            for coeff_2, pauli_2 in clifford.paulis:
+                z_2, x_2, phase_2 = Operator._multiply_pauli_tables(z_1, x_1, pauli_2.z, pauli_2.x)
+                terms_z.append(z_2)
+                terms_x.append(x_2)
+                terms_coeffs.append(coeff_1 * coeffs * coeff_2 * phase_1 * phase_2)
+        z, x, coeffs = Operator._merge_pauli_table(np.vstack(terms_z), np.vstack(terms_x),
+                                                   np.concatenate(terms_coeffs))
+        nonzero = coeffs != 0
+        return z[nonzero], x[nonzero], coeffs[nonzero]
+
+    @staticmethod
+    def _min_eigenvalue(operator):
+        """
+        Computes the lowest eigenvalue of an operator from its matrix.
+
+        Args:
+            operator (Operator): the operator
+
+        Returns:
+            float: the lowest eigenvalue
+        """
+        if operator.is_empty():
+            return 0.0
+        operator = Operator(paulis=operator.paulis)
+        operator.to_matrix()
+        matrix = operator.matrix
+        if matrix.ndim == 1:
+            return float(np.min(np.real(matrix)))
+        if matrix.shape[0] <= 2:
+            return float(np.min(np.linalg.eigvalsh(matrix.toarray())))
+        return float(np.real(scisparse.linalg.eigsh(matrix, k=1, which='SA', return_eigenvectors=False)[0]))
 
     def zeros_coeff_elimination(self):
         """
@@ -19,11 +19,14 @@ import time
 from qiskit import __version__ as terra_version
 from qiskit.assembler.run_config import RunConfig
 from qiskit.transpiler import Layout, CouplingMap
+from qiskit.ignis.mitigation.measurement import TensoredMeasFitter
 
 from .aqua_error import AquaError
 from .utils import (run_qobj, compile_circuits, CircuitCache,
                     get_measured_qubits_from_qobj,
-                    build_measurement_error_mitigation_qobj)
+                    build_measurement_error_mitigation_qobj,
+                    TensoredMeasurementFilter)
+from .utils.run_report import RunReport, report_stage
 from .utils.backend_utils import (is_ibmq_provider,
                                   is_statevector_backend,
                                   is_simulator_backend,
@@ -65,7 +68,7 @@ class QuantumInstance:
                  skip_qobj_validation=True,
                  measurement_error_mitigation_cls=None, cals_matrix_refresh_period=30,
                  measurement_error_mitigation_shots=None,
-                 job_callback=None):
+                 job_callback=None, measurement_error_mitigation_pattern=None):
         """Constructor.
 
         Args:
@@ -98,6 +101,9 @@ class QuantumInstance:
             job_callback (Callable, optional): callback used in querying info of the submitted job, and
                                                providing the following arguments: job_id, job_status,
                                                queue_position, job
+            measurement_error_mitigation_pattern (list[list[int]], optional): the blocks of qubits calibrated
+                                                                together by TensoredMeasFitter, if None,
+                                                                each measured qubit is calibrated alone
 
         Raises:
             AquaError: the shots exceeds the maximum number of shots
@@ -176,8 +182,16 @@ class QuantumInstance:
         self._measurement_error_mitigation_method = 'least_squares'
         self._cals_matrix_refresh_period = cals_matrix_refresh_period
         self._measurement_error_mitigation_shots = measurement_error_mitigation_shots
-
-        if self._measurement_error_mitigation_cls is not None:
+        self._measurement_error_mitigation_pattern = measurement_error_mitigation_pattern
+        # calibration matrix and timestamp of each block of qubits, for TensoredMeasFitter
+        self._tensored_cals_matrices = {}
+
+        if self._measurement_error_mitigation_cls is TensoredMeasFitter:
+            logger.info("The tensored measurement error mitigation is enabled. "
+                        "The calibration circuits of the blocks of measured qubits are added to the jobs "
+                        "whose blocks have no calibration matrix, or one older than {} minutes.".format(
+                            self._cals_matrix_refresh_period))
+        elif self._measurement_error_mitigation_cls is not None:
             logger.info("The measurement error mitigation is enable. "
                         "It will automatically submit an additional job to help calibrate the result of other jobs. "
                         "The current approach will submit a job with 2^N circuits to build the calibration matrix, "
@@ -195,6 +209,7 @@ class QuantumInstance:
         self._skip_qobj_validation = skip_qobj_validation
         self._circuit_summary = False
         self._job_callback = job_callback
+        self._run_report = None
         logger.info(self)
 
     def __str__(self):
@@ -221,11 +236,14 @@ class QuantumInstance:
         Returns:
             Result: Result object
         """
+        start = self._run_report.now() if self._run_report is not None else None
         qobj = compile_circuits(circuits, self._backend, self._backend_config, self._compile_config, self._run_config,
                                 show_circuit_summary=self._circuit_summary, circuit_cache=self._circuit_cache,
-                                **kwargs)
+                                run_report=self._run_report, **kwargs)
 
-        if self._measurement_error_mitigation_cls is not None:
+        if self._measurement_error_mitigation_cls is TensoredMeasFitter:
+            result = self._run_with_tensored_mitigation(qobj)
+        elif self._measurement_error_mitigation_cls is not None:
             qubit_index = get_measured_qubits_from_qobj(qobj)
             qubit_index_str = '_'.join([str(x) for x in qubit_index]) + "_{}".format(self._measurement_error_mitigation_shots or self._run_config.shots)
             measurement_error_mitigation_fitter, timestamp = self._measurement_error_mitigation_fitters.get(qubit_index_str, (None, 0))
@@ -265,38 +283,135 @@ class QuantumInstance:
                 if use_different_shots:
                     cals_result = run_qobj(cals_qobj, self._backend, self._qjob_config, self._backend_options,
                                            self._noise_config,
-                                           self._skip_qobj_validation, self._job_callback)
+                                           self._skip_qobj_validation, self._job_callback,
+                                           run_report=self._run_report)
                     result = run_qobj(qobj, self._backend, self._qjob_config, self._backend_options, self._noise_config,
-                                      self._skip_qobj_validation, self._job_callback)
+                                      self._skip_qobj_validation, self._job_callback,
+                                      run_report=self._run_report)
                 else:
                     qobj.experiments[0:0] = cals_qobj.experiments
                     result = run_qobj(qobj, self._backend, self._qjob_config, self._backend_options, self._noise_config,
-                                      self._skip_qobj_validation, self._job_callback)
+                                      self._skip_qobj_validation, self._job_callback,
+                                      run_report=self._run_report)
                     cals_result = result
 
                 logger.info("Building calibration matrix for measurement error mitigation.")
-                measurement_error_mitigation_fitter = self._measurement_error_mitigation_cls(cals_result,
-                                                                                             state_labels,
-                                                                                             qubit_list=qubit_index,
-                                                                                             circlabel=circuit_labels)
+                with report_stage(self._run_report, 'calibration'):
+                    measurement_error_mitigation_fitter = \
+                        self._measurement_error_mitigation_cls(cals_result,
+                                                               state_labels,
+                                                               qubit_list=qubit_index,
+                                                               circlabel=circuit_labels)
                 self._measurement_error_mitigation_fitters[qubit_index_str] = (measurement_error_mitigation_fitter, time.time())
             else:
                 result = run_qobj(qobj, self._backend, self._qjob_config, self._backend_options, self._noise_config,
-                                  self._skip_qobj_validation, self._job_callback)
+                                  self._skip_qobj_validation, self._job_callback,
+                                  run_report=self._run_report)
 
             if measurement_error_mitigation_fitter is not None:
                 logger.info("Performing measurement error mitigation.")
-                result = measurement_error_mitigation_fitter.filter.apply(result,
-                                                                          self._measurement_error_mitigation_method)
+                with report_stage(self._run_report, 'mitigation'):
+                    result = measurement_error_mitigation_fitter.filter.apply(
+                        result, self._measurement_error_mitigation_method)
         else:
             result = run_qobj(qobj, self._backend, self._qjob_config, self._backend_options, self._noise_config,
-                              self._skip_qobj_validation, self._job_callback)
+                              self._skip_qobj_validation, self._job_callback,
+                              run_report=self._run_report)
 
         if self._circuit_summary:
             self._circuit_summary = False
 
+        if self._run_report is not None:
+            self._run_report.add_record('execute', start, self._run_report.now() - start,
+                                        num_experiments=len(qobj.experiments))
         return result
 
+    def _mitigation_blocks(self, qubit_index):
+        """
+        Split the measured qubits into the blocks of the mitigation pattern.
+
+        Args:
+            qubit_index (list[int]): the measured qubits
+
+        Returns:
+            list[list[int]]: the blocks of the pattern restricted to the measured qubits, and a block
+                             per measured qubit which is not in the pattern
+        """
+        blocks = []
+        for block in self._measurement_error_mitigation_pattern or []:
+            block = [qubit for qubit in block if qubit in qubit_index]
+            if len(block) > 0:
+                blocks.append(block)
+        in_blocks = [qubit for block in blocks for qubit in block]
+        blocks.extend([[qubit] for qubit in qubit_index if qubit not in in_blocks])
+        return blocks
+
+    def _run_with_tensored_mitigation(self, qobj):
+        """
+        Run a qobj, adding the calibration circuits of the out-of-date blocks of measured qubits
+        to it, and mitigate its counts with the calibration matrices of the blocks.
+
+        Args:
+            qobj (QasmQobj): the qobj of the circuits
+
+        Returns:
+            Result: the mitigated result, without the calibration experiments
+        """
+        qubit_index = get_measured_qubits_from_qobj(qobj)
+        shots = self._measurement_error_mitigation_shots or self._run_config.shots
+        blocks = self._mitigation_blocks(qubit_index)
+        stale_blocks = [block for block in blocks
+                        if self.maybe_refresh_cals_matrix(
+                            self._tensored_cals_matrices.get((tuple(block), shots), (None, 0))[1])]
+
+        if len(stale_blocks) > 0:
+            logger.info("Updating qobj with the calibration circuits of the blocks {}.".format(stale_blocks))
+            use_different_shots = shots != self._run_config.shots
+            temp_run_config = copy.deepcopy(self._run_config)
+            temp_run_config.shots = shots
+            cals_qobj, mit_pattern, circuit_labels = \
+                build_measurement_error_mitigation_qobj([qubit for block in stale_blocks for qubit in block],
+                                                        TensoredMeasFitter,
+                                                        self._backend,
+                                                        self._backend_config,
+                                                        self._compile_config,
+                                                        temp_run_config,
+                                                        mit_pattern=stale_blocks)
+            if use_different_shots:
+                cals_result = run_qobj(cals_qobj, self._backend, self._qjob_config, self._backend_options,
+                                       self._noise_config, self._skip_qobj_validation, self._job_callback,
+                                       run_report=self._run_report)
+                result = run_qobj(qobj, self._backend, self._qjob_config, self._backend_options, self._noise_config,
+                                  self._skip_qobj_validation, self._job_callback,
+                                  run_report=self._run_report)
+            else:
+                num_cals = len(cals_qobj.experiments)
+                qobj.experiments[0:0] = cals_qobj.experiments
+                result = run_qobj(qobj, self._backend, self._qjob_config, self._backend_options, self._noise_config,
+                                  self._skip_qobj_validation, self._job_callback,
+                                  run_report=self._run_report)
+                del qobj.experiments[0:num_cals]
+                cals_result = copy.copy(result)
+                cals_result.results = result.results[:num_cals]
+                result.results = result.results[num_cals:]
+
+            logger.info("Building calibration matrices for measurement error mitigation.")
+            with report_stage(self._run_report, 'calibration'):
+                fitter = TensoredMeasFitter(cals_result, mit_pattern, circlabel=circuit_labels)
+            timestamp = time.time()
+            for block, cal_matrix in zip(mit_pattern, fitter.cal_matrices):
+                self._tensored_cals_matrices[(tuple(block), shots)] = (cal_matrix, timestamp)
+        else:
+            result = run_qobj(qobj, self._backend, self._qjob_config, self._backend_options, self._noise_config,
+                              self._skip_qobj_validation, self._job_callback,
+                              run_report=self._run_report)
+
+        logger.info("Performing measurement error mitigation.")
+        cal_matrices = [self._tensored_cals_matrices[(tuple(block), shots)][0] for block in blocks]
+        mitigation_filter = TensoredMeasurementFilter(cal_matrices, blocks, qubit_index)
+        with report_stage(self._run_report, 'mitigation'):
+            return mitigation_filter.apply(result, self._measurement_error_mitigation_method)
+
     def set_config(self, **kwargs):
         """Set configurations for the quantum instance."""
         for k, v in kwargs.items():
@@ -370,6 +485,29 @@ class QuantumInstance:
     def circuit_summary(self, new_value):
         self._circuit_summary = new_value
 
+    @property
+    def run_report(self):
+        """ Returns the RunReport recording the executions, or None """
+        return self._run_report
+
+    @run_report.setter
+    def run_report(self, new_value):
+        """ Sets a RunReport recording the executions, or None to stop recording """
+        self._run_report = new_value
+
+    def enable_run_report(self, callback=None):
+        """
+        Starts recording the executions in a new RunReport.
+
+        Args:
+            callback (Callable, optional): called with the record of each stage when it ends
+
+        Returns:
+            RunReport: the report
+        """
+        self._run_report = RunReport(callback=callback)
+        return self._run_report
+
     @property
     def measurement_error_mitigation_cls(self):
         return self._measurement_error_mitigation_cls
@@ -462,10 +600,21 @@ class QuantumInstance:
         Returns:
             tuple(np.ndarray, int): the calibration matrix and the creation timestamp if qubit_index is not None.
                                     otherwise, return all matrices and their timestamp in a dictionary.
+                                    With TensoredMeasFitter, the calibration matrix is the list of the
+                                    matrices of the blocks of qubit_index, with the oldest timestamp.
         """
         ret = None
         shots = self._measurement_error_mitigation_shots or self._run_config.shots
-        if qubit_index:
+        if self._measurement_error_mitigation_cls is TensoredMeasFitter:
+            if qubit_index:
+                keys = [(tuple(block), shots) for block in self._mitigation_blocks(qubit_index)]
+                if all(key in self._tensored_cals_matrices for key in keys):
+                    ret = ([self._tensored_cals_matrices[key][0] for key in keys],
+                           min([self._tensored_cals_matrices[key][1] for key in keys]))
+            else:
+                ret = {'_'.join([str(x) for x in block]) + "_{}".format(shots): value
+                       for (block, shots), value in self._tensored_cals_matrices.items()}
+        elif qubit_index:
             qubit_index_str = '_'.join([str(x) for x in qubit_index]) + "_{}".format(shots)
             fitter, timestamp = self._measurement_error_mitigation_fitters.get(qubit_index_str, None)
             if fitter is not None:
@@ -15,12 +15,14 @@
 from abc import ABC, abstractmethod
 import logging
 import copy
+import hashlib
 from enum import Enum
 
 import numpy as np
 import fastdtw
+from qiskit.tools import parallel_map
 
-from qiskit.aqua import AquaError
+from qiskit.aqua import AquaError, aqua_globals
 from qiskit.aqua.parser import JSONSchema
 
 logger = logging.getLogger(__name__)
@@ -71,6 +73,8 @@ class BaseDataProvider(ABC):
         self._configuration = copy.deepcopy(self.CONFIGURATION)
         self._data = None
         self._n = 0
+        # DTW distances keyed by the hashes of the two time series
+        self._dtw_cache = {}
 
     @property
     def configuration(self):
@@ -117,14 +121,40 @@ class BaseDataProvider(ABC):
         pass
 
     # it does not have to be overridden in non-abstract derived classes.
-    def get_mean_vector(self):
-        """ Returns a vector containing the mean value of each asset.
+    def save_data(self, file):
+        """ Saves the loaded time series as one numpy array, with one row per asset.
 
-        Returns:
-            mean (numpy.ndarray) : a per-asset mean vector.
+        Args:
+            file (str or file): file name or file object, see numpy.save
         """
+        np.save(file, self._get_data_matrix())
+
+    # it does not have to be overridden in non-abstract derived classes.
+    def load_data(self, file):
+        """ Loads the time series saved by save_data instead of running the provider.
+
+        The array is memory-mapped, such that the series are only read from disk when used.
+
+        Args:
+            file (str): file name
+        """
+        self._data = np.load(file, mmap_mode='r')
+        self._n = len(self._data)
+
+    @property
+    def _data(self):
+        return self.__data
+
+    @_data.setter
+    def _data(self, data):
+        # statistics are computed once per loaded data
+        self.__data = data
+        self._data_matrix = None
+        self._statistics = {}
+
+    def _check_data_loaded(self):
         try:
-            if not self._data:
+            if self._data is None or len(self._data) == 0:
                 raise QiskitFinanceError(
                     'No data loaded, yet. Please run the method run() first to load the data.'
                 )
@@ -132,7 +162,33 @@ class BaseDataProvider(ABC):
             raise QiskitFinanceError(
                 'No data loaded, yet. Please run the method run() first to load the data.'
             )
-        self.mean = np.mean(self._data, axis=1)
+
+    def _get_data_matrix(self):
+        """ Returns the time series as a (number of assets, number of points) array, stacked once per load. """
+        self._check_data_loaded()
+        if self._data_matrix is None:
+            self._data_matrix = np.asarray(self._data, dtype=float)
+        return self._data_matrix
+
+    def _get_statistic(self, name, compute):
+        if name not in self._statistics:
+            self._statistics[name] = compute()
+        return self._statistics[name].copy()
+
+    def _get_period_returns(self):
+        if 'period_returns' not in self._statistics:
+            data = self._get_data_matrix()
+            self._statistics['period_returns'] = data[:, 1:] / data[:, :-1] - 1
+        return self._statistics['period_returns']
+
+    # it does not have to be overridden in non-abstract derived classes.
+    def get_mean_vector(self):
+        """ Returns a vector containing the mean value of each asset.
+
+        Returns:
+            mean (numpy.ndarray) : a per-asset mean vector.
+        """
+        self.mean = self._get_statistic('mean', lambda: np.mean(self._get_data_matrix(), axis=1))
         return self.mean
 
     # it does not have to be overridden in non-abstract derived classes.
@@ -142,19 +198,8 @@ class BaseDataProvider(ABC):
     Returns:
         mean (numpy.ndarray) : a per-asset mean vector.
         """
-        try:
-            if not self._data:
-                raise QiskitFinanceError(
-                    'No data loaded, yet. Please run the method run() first to load the data.'
-                )
-        except AttributeError:
-            raise QiskitFinanceError(
-                'No data loaded, yet. Please run the method run() first to load the data.'
-            )
-
-        period_returns = np.array(self._data)[:, 1:] / np.array(self._data)[:, :-1] - 1
-
-        self.period_return_mean = np.mean(period_returns, axis=1)
+        self.period_return_mean = self._get_statistic('period_return_mean',
+                                                      lambda: np.mean(self._get_period_returns(), axis=1))
         return self.period_return_mean
 
     # it does not have to be overridden in non-abstract derived classes.
@@ -164,16 +209,7 @@ class BaseDataProvider(ABC):
         Returns:
             rho (numpy.ndarray) : an asset-to-asset covariance matrix.
         """
-        try:
-            if not self._data:
-                raise QiskitFinanceError(
-                    'No data loaded, yet. Please run the method run() first to load the data.'
-                )
-        except AttributeError:
-            raise QiskitFinanceError(
-                'No data loaded, yet. Please run the method run() first to load the data.'
-            )
-        self.cov = np.cov(self._data, rowvar=True)
+        self.cov = self._get_statistic('cov', lambda: np.cov(self._get_data_matrix(), rowvar=True))
         return self.cov
 
     # it does not have to be overridden in non-abstract derived classes.
@@ -183,47 +219,43 @@ class BaseDataProvider(ABC):
     Returns:
         mean (numpy.ndarray) : a per-asset mean vector.
         """
-        try:
-            if not self._data:
-                raise QiskitFinanceError(
-                    'No data loaded, yet. Please run the method run() first to load the data.'
-                )
-        except AttributeError:
-            raise QiskitFinanceError(
-                'No data loaded, yet. Please run the method run() first to load the data.'
-            )
-
-        period_returns = np.array(self._data)[:, 1:] / np.array(self._data)[:, :-1] - 1
-
-        self.period_return_cov = np.cov(period_returns)
+        self.period_return_cov = self._get_statistic('period_return_cov',
+                                                     lambda: np.cov(self._get_period_returns()))
         return self.period_return_cov
 
-    # it does not have to be overridden in non-abstract derived classes.
     def get_similarity_matrix(self):
         """ Returns time-series similarity matrix computed using dynamic time warping.
 
         Returns:
             rho (numpy.ndarray) : an asset-to-asset similarity matrix.
         """
-        try:
-            if not self._data:
-                raise QiskitFinanceError(
-                    'No data loaded, yet. Please run the method run() first to load the data.'
-                )
-        except AttributeError:
-            raise QiskitFinanceError(
-                'No data loaded, yet. Please run the method run() first to load the data.'
-            )
-        self.rho = np.zeros((self._n, self._n))
+        self._check_data_loaded()
+        # the distances of pairs of series seen before, e.g. before adding tickers, are reused
+        hashes = [hashlib.sha1(np.asarray(series, dtype=float).tobytes()).hexdigest() for series in self._data]
+        pairs = [(ii, jj) for ii in range(self._n) for jj in range(ii + 1, self._n)
+                 if (hashes[ii], hashes[jj]) not in self._dtw_cache]
+        if len(pairs) > 0:
+            # distribute chunks of pairs, such that each process receives a few large tasks
+            num_chunks = min(len(pairs), 4 * aqua_globals.num_processes)
+            chunks = [[(self._data[ii], self._data[jj]) for ii, jj in chunk]
+                      for chunk in np.array_split(pairs, num_chunks)]
+            distances = parallel_map(BaseDataProvider._dtw_distances, chunks,
+                                     num_processes=aqua_globals.num_processes)
+            for (ii, jj), distance in zip(pairs, np.concatenate(distances)):
+                self._dtw_cache[(hashes[ii], hashes[jj])] = distance
+
+        self.rho = np.eye(self._n)
         for ii in range(0, self._n):
-            self.rho[ii, ii] = 1.
             for jj in range(ii + 1, self._n):
-                thisRho, path = fastdtw.fastdtw(self._data[ii], self._data[jj])
-                thisRho = 1.0 / thisRho
+                thisRho = 1.0 / self._dtw_cache[(hashes[ii], hashes[jj])]
                 self.rho[ii, jj] = thisRho
                 self.rho[jj, ii] = thisRho
         return self.rho
 
+    @staticmethod
+    def _dtw_distances(pairs):
+        return [fastdtw.fastdtw(series_i, series_j)[0] for series_i, series_j in pairs]
+
     # gets coordinates suitable for plotting
     # it does not have to be overridden in non-abstract derived classes.
     def get_coordinates(self):
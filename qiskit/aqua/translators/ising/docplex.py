@@ -52,15 +52,15 @@ print('tsp objective:', result['energy'] + offset)
 """
 
 import logging
-from collections import OrderedDict
 from math import fsum
 
 import numpy as np
 from docplex.mp.constants import ComparisonType
 from docplex.mp.model import Model
-from qiskit.quantum_info import Pauli
+from scipy import sparse as scisparse
 
-from qiskit.aqua import Operator, AquaError
+from qiskit.aqua import AquaError
+from qiskit.aqua.translators.ising.ising_model import IsingModel, sample_most_likely
 
 logger = logging.getLogger(__name__)
 
@@ -102,98 +102,42 @@ def get_qubitops(mdl, auto_penalty=True, default_penalty=1e5):
         qd[i] = index
         index += 1
 
-    # initialize Hamiltonian.
+    # accumulate the QUBO coefficients of the object function and the penalty terms.
     num_nodes = len(qd)
-    pauli_list = []
-    shift = 0
-    zero = np.zeros(num_nodes, dtype=np.bool)
-
-    # convert a constant part of the object function into Hamiltonian.
-    shift += mdl.get_objective_expr().get_constant() * sign
-
-    # convert linear parts of the object function into Hamiltonian.
-    l_itr = mdl.get_objective_expr().iter_terms()
-    for j in l_itr:
-        zp = np.zeros(num_nodes, dtype=np.bool)
-        index = qd[j[0]]
-        weight = j[1] * sign / 2
-        zp[index] = True
-
-        pauli_list.append([-weight, Pauli(zp, zero)])
-        shift += weight
-
-    # convert quadratic parts of the object function into Hamiltonian.
-    q_itr = mdl.get_objective_expr().iter_quads()
-    for i in q_itr:
-        index1 = qd[i[0][0]]
-        index2 = qd[i[0][1]]
-        weight = i[1] * sign / 4
-
-        if index1 == index2:
-            shift += weight
-        else:
-            zp = np.zeros(num_nodes, dtype=np.bool)
-            zp[index1] = True
-            zp[index2] = True
-            pauli_list.append([weight, Pauli(zp, zero)])
-
-        zp = np.zeros(num_nodes, dtype=np.bool)
-        zp[index1] = True
-        pauli_list.append([-weight, Pauli(zp, zero)])
-
-        zp = np.zeros(num_nodes, dtype=np.bool)
-        zp[index2] = True
-        pauli_list.append([-weight, Pauli(zp, zero)])
-
-        shift += weight
-
-    # convert constraints into penalty terms.
+    objective = mdl.get_objective_expr()
+    constant = objective.get_constant() * sign
+    linear = np.zeros(num_nodes)
+    rows, cols, values = [], [], []
+
+    # convert linear parts of the object function.
+    terms = list(objective.iter_terms())
+    np.add.at(linear, np.asarray([qd[var] for var, _ in terms], dtype=int), [coeff * sign for _, coeff in terms])
+
+    # convert quadratic parts of the object function.
+    quads = list(objective.iter_quads())
+    rows.append(np.asarray([qd[pair[0]] for pair, _ in quads], dtype=int))
+    cols.append(np.asarray([qd[pair[1]] for pair, _ in quads], dtype=int))
+    values.append(np.asarray([coeff * sign for _, coeff in quads], dtype=float))
+
+    # convert constraints into penalty terms: penalty*(Constant-func)**2
     for constraint in mdl.iter_constraints():
-        constant = constraint.right_expr.get_constant()
-
-        # constant parts of penalty*(Constant-func)**2: penalty*(Constant**2)
-        shift += penalty * constant ** 2
-
-        # linear parts of penalty*(Constant-func)**2: penalty*(-2*Constant*func)
-        for l in constraint.left_expr.iter_terms():
-            zp = np.zeros(num_nodes, dtype=np.bool)
-            index = qd[l[0]]
-            weight = l[1]
-            zp[index] = True
-
-            pauli_list.append([penalty * constant * weight, Pauli(zp, zero)])
-            shift += -penalty * constant * weight
-
-        # quadratic parts of penalty*(Constant-func)**2: penalty*(func**2)
-        for l in constraint.left_expr.iter_terms():
-            for l2 in constraint.left_expr.iter_terms():
-                index1 = qd[l[0]]
-                index2 = qd[l2[0]]
-                weight1 = l[1]
-                weight2 = l2[1]
-                penalty_weight1_weight2 = penalty * weight1 * weight2 / 4
-
-                if index1 == index2:
-                    shift += penalty_weight1_weight2
-                else:
-                    zp = np.zeros(num_nodes, dtype=np.bool)
-                    zp[index1] = True
-                    zp[index2] = True
-                    pauli_list.append([penalty_weight1_weight2, Pauli(zp, zero)])
-
-                zp = np.zeros(num_nodes, dtype=np.bool)
-                zp[index1] = True
-                pauli_list.append([-penalty_weight1_weight2, Pauli(zp, zero)])
-
-                zp = np.zeros(num_nodes, dtype=np.bool)
-                zp[index2] = True
-                pauli_list.append([-penalty_weight1_weight2, Pauli(zp, zero)])
-
-                shift += penalty_weight1_weight2
-
-    # Remove paulis whose coefficients are zeros.
-    qubitOp = Operator(paulis=pauli_list)
-    qubitOp.zeros_coeff_elimination()
+        constant_value = constraint.right_expr.get_constant()
+        terms = list(constraint.left_expr.iter_terms())
+        indices = np.asarray([qd[var] for var, _ in terms], dtype=int)
+        weights = np.asarray([coeff for _, coeff in terms], dtype=float)
+
+        # constant parts: penalty*(Constant**2)
+        constant += penalty * constant_value ** 2
+        # linear parts: penalty*(-2*Constant*func)
+        np.add.at(linear, indices, -2 * penalty * constant_value * weights)
+        # quadratic parts: penalty*(func**2)
+        rows.append(np.repeat(indices, len(indices)))
+        cols.append(np.tile(indices, len(indices)))
+        values.append(penalty * np.outer(weights, weights).ravel())
+
+    quadratic = scisparse.coo_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+                                     shape=(num_nodes, num_nodes))
+    qubitOp, shift = IsingModel.from_qubo(quadratic, linear, constant).to_operator()
 
     return qubitOp, shift
 
@@ -259,27 +203,3 @@ def _auto_define_penalty(mdl, default_penalty=1e5):
     penalties.extend(abs(i[1]) for i in mdl.get_objective_expr().iter_quads())
 
     return fsum(penalties)
-
-
-def sample_most_likely(state_vector):
-    """Compute the most likely binary string from state vector.
-
-    Args:
-        state_vector (numpy.ndarray or dict): state vector or counts.
-
-    Returns:
-        numpy.ndarray: binary string as numpy.ndarray of ints.
-    """
-    if isinstance(state_vector, dict) or isinstance(state_vector, OrderedDict):
-        # get the binary string with the largest count
-        binary_string = sorted(state_vector.items(), key=lambda kv: kv[1])[-1][0]
-        x = np.asarray([int(y) for y in reversed(list(binary_string))])
-        return x
-    else:
-        n = int(np.log2(state_vector.shape[0]))
-        k = np.argmax(np.abs(state_vector))
-        x = np.zeros(n)
-        for i in range(n):
-            x[i] = k % 2
-            k >>= 1
-        return x
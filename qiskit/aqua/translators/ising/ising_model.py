@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Diagonal Ising Hamiltonians stored as a sparse quadratic form over the qubit spins.
+"""
+
+import logging
+
+import numpy as np
+from scipy import sparse as scisparse
+from qiskit.quantum_info import Pauli
+
+from qiskit.aqua import AquaError, Operator
+
+logger = logging.getLogger(__name__)
+
+
+class IsingModel:
+    """
+    Ising Hamiltonian H = offset + sum_i h_i Z_i + sum_{i<j} J_ij Z_i Z_j.
+
+    The model is stored as the vector h and the sparse COO matrix J, and never allocates
+    2 ** num_qubits sized arrays unless the full diagonal is explicitly requested.
+    A binary string x, with x[i] the measured value of qubit i, has the energy of the
+    basis state whose spins are s_i = 1 - 2 x_i.
+    """
+
+    def __init__(self, linear, quadratic=None, offset=0.0):
+        """
+        Args:
+            linear (numpy.ndarray): coefficients h of the single Z terms, one per qubit
+            quadratic (scipy.sparse.spmatrix or numpy.ndarray): coefficients J of the ZZ terms;
+                entries (i, j) and (j, i) are merged and diagonal entries are added to the offset
+            offset (float): coefficient of the identity term
+        """
+        self._linear = np.asarray(linear, dtype=float)
+        num_qubits = len(self._linear)
+        if quadratic is None:
+            quadratic = scisparse.coo_matrix((num_qubits, num_qubits))
+        quadratic = scisparse.coo_matrix(quadratic, dtype=float)
+        if quadratic.shape != (num_qubits, num_qubits):
+            raise AquaError('Shape of the quadratic coefficients {} does not match {} qubits.'.format(
+                quadratic.shape, num_qubits))
+        # Z_i Z_i is the identity
+        on_diagonal = quadratic.row == quadratic.col
+        self._offset = float(offset) + quadratic.data[on_diagonal].sum()
+        rows = np.minimum(quadratic.row, quadratic.col)[~on_diagonal]
+        cols = np.maximum(quadratic.row, quadratic.col)[~on_diagonal]
+        quadratic = scisparse.coo_matrix((quadratic.data[~on_diagonal], (rows, cols)),
+                                         shape=(num_qubits, num_qubits)).tocsr()
+        quadratic.eliminate_zeros()
+        self._quadratic = quadratic.tocoo()
+        self._diagonal = None
+
+    @classmethod
+    def from_operator(cls, operator):
+        """
+        Build the model of an operator made of Z and ZZ Paulis only.
+
+        Args:
+            operator (Operator): the operator, in paulis or grouped_paulis representation
+
+        Returns:
+            IsingModel: the Ising model of the operator
+
+        Raises:
+            AquaError: if the operator has a Pauli with X or Y components, more than two Z components
+                or a coefficient with an imaginary part.
+        """
+        operator._check_representation('paulis')
+        num_qubits = operator.num_qubits
+        paulis = operator.paulis
+        if len(paulis) == 0:
+            return cls(np.zeros(num_qubits))
+        coeffs = np.asarray([coeff for coeff, _ in paulis])
+        if np.any(np.iscomplex(coeffs)):
+            raise AquaError('Operator has complex coefficients, it is not an Ising Hamiltonian.')
+        coeffs = np.real(coeffs)
+        z = np.asarray([pauli.z for _, pauli in paulis], dtype=bool)
+        x = np.asarray([pauli.x for _, pauli in paulis], dtype=bool)
+        weights = z.sum(axis=1)
+        if np.any(x) or np.any(weights > 2):
+            raise AquaError('Operator is not diagonal or has more than two-body terms.')
+
+        offset = coeffs[weights == 0].sum()
+        linear = coeffs[weights == 1] @ z[weights == 1]
+        terms, qubits = np.nonzero(z[weights == 2])
+        quadratic = scisparse.coo_matrix((coeffs[weights == 2], (qubits[0::2], qubits[1::2])),
+                                         shape=(num_qubits, num_qubits))
+        return cls(linear, quadratic, offset)
+
+    @classmethod
+    def from_qubo(cls, quadratic, linear=None, constant=0.0):
+        """
+        Build the model of the QUBO f(x) = constant + linear . x + x^T quadratic x over binary x.
+
+        The substitution x_i = (1 - Z_i) / 2 is applied to the whole coefficient arrays at once,
+        such that duplicated terms are merged by construction.
+
+        Args:
+            quadratic (scipy.sparse.spmatrix or numpy.ndarray): quadratic coefficients, which may be
+                non-symmetric and have duplicated COO entries; diagonal entries act as linear terms
+            linear (numpy.ndarray): linear coefficients
+            constant (float): constant term
+
+        Returns:
+            IsingModel: the Ising model whose energies are the QUBO values
+        """
+        quadratic = scisparse.coo_matrix(quadratic, dtype=float)
+        num_qubits = quadratic.shape[0]
+        linear = np.zeros(num_qubits) if linear is None else np.asarray(linear, dtype=float)
+        on_diagonal = quadratic.row == quadratic.col
+        # x_i x_i = x_i
+        linear = linear + np.bincount(quadratic.row[on_diagonal], weights=quadratic.data[on_diagonal],
+                                      minlength=num_qubits)
+        off_diagonal = scisparse.coo_matrix(
+            (quadratic.data[~on_diagonal], (quadratic.row[~on_diagonal], quadratic.col[~on_diagonal])),
+            shape=quadratic.shape
+        ).tocsr()
+        # x_i x_j = (1 - Z_i - Z_j + Z_i Z_j) / 4
+        coupling = np.asarray(off_diagonal.sum(axis=0)).ravel() + np.asarray(off_diagonal.sum(axis=1)).ravel()
+        offset = constant + linear.sum() / 2 + off_diagonal.sum() / 4
+        return cls(-linear / 2 - coupling / 4, off_diagonal / 4, offset)
+
+    @property
+    def num_qubits(self):
+        """ Returns the number of qubits """
+        return len(self._linear)
+
+    @property
+    def linear(self):
+        """ Returns the coefficients of the single Z terms """
+        return self._linear
+
+    @property
+    def quadratic(self):
+        """ Returns the coefficients of the ZZ terms, as an upper triangular COO matrix """
+        return self._quadratic
+
+    @property
+    def offset(self):
+        """ Returns the coefficient of the identity term """
+        return self._offset
+
+    def to_operator(self):
+        """
+        Build the Pauli representation of the model.
+
+        Returns:
+            Operator: operator with one Pauli per non-zero coefficient
+            float: the offset, which is not included in the operator
+        """
+        num_qubits = self.num_qubits
+        pauli_list = []
+        for i in np.nonzero(self._linear)[0]:
+            z_p = np.zeros(num_qubits, dtype=np.bool)
+            z_p[i] = True
+            pauli_list.append([self._linear[i], Pauli(z_p, np.zeros(num_qubits, dtype=np.bool))])
+        for i, j, coeff in zip(self._quadratic.row, self._quadratic.col, self._quadratic.data):
+            z_p = np.zeros(num_qubits, dtype=np.bool)
+            z_p[i] = True
+            z_p[j] = True
+            pauli_list.append([coeff, Pauli(z_p, np.zeros(num_qubits, dtype=np.bool))])
+        return Operator(paulis=pauli_list), self._offset
+
+    def evaluate(self, x):
+        """
+        Compute the energies of a batch of binary strings.
+
+        Args:
+            x (numpy.ndarray): binary string of shape (num_qubits,) or batch of shape (m, num_qubits)
+
+        Returns:
+            float or numpy.ndarray: the energy of each binary string
+        """
+        spins = 1 - 2 * np.asarray(x, dtype=float)
+        pairs = spins[..., self._quadratic.row] * spins[..., self._quadratic.col]
+        return self._offset + spins @ self._linear + pairs @ self._quadratic.data
+
+    def evaluate_counts(self, counts):
+        """
+        Compute the energy expectation from measurement counts, evaluating all the keys at once.
+
+        Args:
+            counts (dict): counts of the measured bitstrings
+
+        Returns:
+            float: mean energy
+            float: standard deviation of the mean
+        """
+        x, frequencies = bitstrings_from_counts(counts, self.num_qubits)
+        num_shots = frequencies.sum()
+        energies = self.evaluate(x)
+        mean = energies @ frequencies / num_shots
+        variance = (energies - mean) ** 2 @ frequencies / num_shots
+        return mean, np.sqrt(variance / num_shots)
+
+    def to_diagonal(self):
+        """
+        Compute the energies of all the basis states; the result is cached.
+
+        Returns:
+            numpy.ndarray: read-only array of length 2 ** num_qubits, the energy of each basis state
+        """
+        if self._diagonal is None:
+            diagonal = self.evaluate(
+                (np.arange(2 ** self.num_qubits)[:, np.newaxis] >> np.arange(self.num_qubits)) & 1
+            )
+            diagonal.setflags(write=False)
+            self._diagonal = diagonal
+        return self._diagonal
+
+    def evaluate_statevector(self, statevector):
+        """
+        Compute the energy expectation of a statevector.
+
+        Args:
+            statevector (numpy.ndarray): the statevector
+
+        Returns:
+            float: mean energy
+        """
+        return np.abs(statevector) ** 2 @ self.to_diagonal()
+
+
+def bitstrings_from_counts(counts, num_bits=None):
+    """
+    Convert the keys of measurement counts to binary strings.
+
+    Args:
+        counts (dict): counts of the measured bitstrings, in the Qiskit ordering
+            where the rightmost character is the bit 0
+        num_bits (int): number of bits, defaults to the length of the keys
+
+    Returns:
+        numpy.ndarray: binary strings of shape (len(counts), num_bits), x[k, i] being the bit i of the kth key
+        numpy.ndarray: the count of each key
+    """
+    keys = [key.replace(' ', '') for key in counts.keys()]
+    num_bits = len(keys[0]) if num_bits is None else num_bits
+    chars = np.frombuffer(''.join(keys).encode(), dtype=np.uint8).reshape(len(keys), -1)
+    x = (chars[:, ::-1][:, :num_bits] - ord('0')).astype(int)
+    return x, np.asarray(list(counts.values()), dtype=float)
+
+
+def sample_most_likely(state_vector):
+    """Compute the most likely binary string from state vector.
+
+    Args:
+        state_vector (numpy.ndarray or dict): state vector or counts.
+
+    Returns:
+        numpy.ndarray: binary string as numpy.ndarray of ints.
+    """
+    if isinstance(state_vector, dict):
+        x, frequencies = bitstrings_from_counts(state_vector)
+        return x[np.argmax(frequencies)]
+    else:
+        n = int(np.log2(state_vector.shape[0]))
+        k = np.argmax(np.abs(state_vector))
+        return (k >> np.arange(n)) & 1
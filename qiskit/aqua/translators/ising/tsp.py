@@ -22,13 +22,12 @@ Note that the weights are symmetric, i.e., w[j, i] = x always holds.
 """
 
 import logging
-from collections import OrderedDict, namedtuple
+from collections import namedtuple
 
 import numpy as np
 import numpy.random as rand
-from qiskit.quantum_info import Pauli
 
-from qiskit.aqua import Operator
+from qiskit.aqua.translators.ising.ising_model import IsingModel, sample_most_likely
 
 logger = logging.getLogger(__name__)
 
@@ -137,74 +136,20 @@ def get_tsp_qubitops(ins, penalty=1e5):
     """
     num_nodes = ins.dim
     num_qubits = num_nodes ** 2
-    zero = np.zeros(num_qubits, dtype=np.bool)
-    pauli_list = []
-    shift = 0
-    for i in range(num_nodes):
-        for j in range(num_nodes):
-            if i == j:
-                continue
-            for p in range(num_nodes):
-                q = (p + 1) % num_nodes
-                shift += ins.w[i, j] / 4
-
-                zp = np.zeros(num_qubits, dtype=np.bool)
-                zp[i * num_nodes + p] = True
-                pauli_list.append([-ins.w[i, j] / 4, Pauli(zp, zero)])
-
-                zp = np.zeros(num_qubits, dtype=np.bool)
-                zp[j * num_nodes + q] = True
-                pauli_list.append([-ins.w[i, j] / 4, Pauli(zp, zero)])
-
-                zp = np.zeros(num_qubits, dtype=np.bool)
-                zp[i * num_nodes + p] = True
-                zp[j * num_nodes + q] = True
-                pauli_list.append([ins.w[i, j] / 4, Pauli(zp, zero)])
-
-    for i in range(num_nodes):
-        for p in range(num_nodes):
-            zp = np.zeros(num_qubits, dtype=np.bool)
-            zp[i * num_nodes + p] = True
-            pauli_list.append([penalty, Pauli(zp, zero)])
-            shift += -penalty
-
+    # QUBO over x[i, p], which is 1 iff city i is visited at position p
+    quadratic = np.zeros((num_nodes, num_nodes, num_nodes, num_nodes))
+    weights = ins.w * (1 - np.eye(num_nodes))
     for p in range(num_nodes):
-        for i in range(num_nodes):
-            for j in range(i):
-                shift += penalty / 2
-
-                zp = np.zeros(num_qubits, dtype=np.bool)
-                zp[i * num_nodes + p] = True
-                pauli_list.append([-penalty / 2, Pauli(zp, zero)])
-
-                zp = np.zeros(num_qubits, dtype=np.bool)
-                zp[j * num_nodes + p] = True
-                pauli_list.append([-penalty / 2, Pauli(zp, zero)])
-
-                zp = np.zeros(num_qubits, dtype=np.bool)
-                zp[i * num_nodes + p] = True
-                zp[j * num_nodes + p] = True
-                pauli_list.append([penalty / 2, Pauli(zp, zero)])
+        quadratic[:, p, :, (p + 1) % num_nodes] += weights
 
-    for i in range(num_nodes):
-        for p in range(num_nodes):
-            for q in range(p):
-                shift += penalty / 2
+    # penalty*(1-sum_i x[i, p])**2 for each position p and penalty*(1-sum_p x[i, p])**2 for each city i
+    identity = np.eye(num_nodes)
+    quadratic += penalty * identity[np.newaxis, :, np.newaxis, :]
+    quadratic += penalty * identity[:, np.newaxis, :, np.newaxis]
+    linear = np.full(num_qubits, -4 * penalty)
+    constant = 2 * penalty * num_nodes
 
-                zp = np.zeros(num_qubits, dtype=np.bool)
-                zp[i * num_nodes + p] = True
-                pauli_list.append([-penalty / 2, Pauli(zp, zero)])
-
-                zp = np.zeros(num_qubits, dtype=np.bool)
-                zp[i * num_nodes + q] = True
-                pauli_list.append([-penalty / 2, Pauli(zp, zero)])
-
-                zp = np.zeros(num_qubits, dtype=np.bool)
-                zp[i * num_nodes + p] = True
-                zp[i * num_nodes + q] = True
-                pauli_list.append([penalty / 2, Pauli(zp, zero)])
-    shift += 2 * penalty * num_nodes
-    return Operator(paulis=pauli_list), shift
+    return IsingModel.from_qubo(quadratic.reshape(num_qubits, num_qubits), linear, constant).to_operator()
 
 
 def tsp_value(z, w):
@@ -264,27 +209,3 @@ def get_tsp_solution(x):
                 assert len(z) == p
                 z.append(i)
     return z
-
-
-def sample_most_likely(state_vector):
-    """Compute the most likely binary string from state vector.
-
-    Args:
-        state_vector (numpy.ndarray or dict): state vector or counts.
-
-    Returns:
-        numpy.ndarray: binary string as numpy.ndarray of ints.
-    """
-    if isinstance(state_vector, dict) or isinstance(state_vector, OrderedDict):
-        # get the binary string with the largest count
-        binary_string = sorted(state_vector.items(), key=lambda kv: kv[1])[-1][0]
-        x = np.asarray([int(y) for y in reversed(list(binary_string))])
-        return x
-    else:
-        n = int(np.log2(state_vector.shape[0]))
-        k = np.argmax(np.abs(state_vector))
-        x = np.zeros(n)
-        for i in range(n):
-            x[i] = k % 2
-            k >>= 1
-        return x
@@ -127,20 +127,14 @@ def get_vehiclerouting_qubitops(instance, n, K):
     # Getting the Hamiltonian in the form of a list of Pauli terms
 
     pauli_list = []
-    for i in range(N):
-        if gz[i] != 0:
-            wp = np.zeros(N)
-            vp = np.zeros(N)
-            vp[i] = 1
-            pauli_list.append((gz[i], Pauli(vp, wp)))
-    for i in range(N):
-        for j in range(i):
-            if Qz[i, j] != 0:
-                wp = np.zeros(N)
-                vp = np.zeros(N)
-                vp[i] = 1
-                vp[j] = 1
-                pauli_list.append((2 * Qz[i, j], Pauli(vp, wp)))
+    for i in np.nonzero(gz)[0]:
+        vp = np.zeros(N, dtype=np.bool)
+        vp[i] = True
+        pauli_list.append((gz[i], Pauli(vp, np.zeros(N, dtype=np.bool))))
+    for i, j in zip(*np.nonzero(np.tril(Qz, -1))):
+        vp = np.zeros(N, dtype=np.bool)
+        vp[[i, j]] = True
+        pauli_list.append((2 * Qz[i, j], Pauli(vp, np.zeros(N, dtype=np.bool))))
 
     pauli_list.append((cz, Pauli(np.zeros(N), np.zeros(N))))
     return Operator(paulis=pauli_list)
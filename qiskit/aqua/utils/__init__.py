@@ -20,18 +20,21 @@ from .random_matrix_generator import (random_unitary, random_h2_body,
                                       random_non_hermitian)
 from .decimal_to_binary import decimal_to_binary
 from .circuit_utils import summarize_circuits
-from .subsystem import get_subsystem_density_matrix, get_subsystems_counts
+from .subsystem import get_subsystem_density_matrix, get_subsystem_probabilities, get_subsystems_counts
 from .entangler_map import get_entangler_map, validate_entangler_map
 from .dataset_helper import (get_feature_dimension, get_num_classes,
                              split_dataset_to_data_and_labels,
                              map_label_to_class_name, reduce_dim_to_via_pca)
 from .qp_solver import optimize_svm
 from .circuit_factory import CircuitFactory
+from .cached_circuit_factory import CachedCircuitFactory
 from .run_circuits import compile_and_run_circuits, compile_circuits, run_qobj, find_regs_by_name
 from .circuit_cache import CircuitCache
+from .run_report import RunReport
 from .backend_utils import has_ibmq, has_aer
 from .measurement_error_mitigation import (get_measured_qubits_from_qobj,
-                                           build_measurement_error_mitigation_qobj)
+                                           build_measurement_error_mitigation_qobj,
+                                           TensoredMeasurementFilter)
 
 __all__ = [
     'tensorproduct',
@@ -46,6 +49,7 @@ __all__ = [
     'decimal_to_binary',
     'summarize_circuits',
     'get_subsystem_density_matrix',
+    'get_subsystem_probabilities',
     'get_subsystems_counts',
     'get_entangler_map',
     'validate_entangler_map',
@@ -56,13 +60,16 @@ __all__ = [
     'reduce_dim_to_via_pca',
     'optimize_svm',
     'CircuitFactory',
+    'CachedCircuitFactory',
     'compile_and_run_circuits',
     'compile_circuits',
     'run_qobj',
     'find_regs_by_name',
     'CircuitCache',
+    'RunReport',
     'has_ibmq',
     'has_aer',
     'get_measured_qubits_from_qobj',
-    'build_measurement_error_mitigation_qobj'
+    'build_measurement_error_mitigation_qobj',
+    'TensoredMeasurementFilter'
 ]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+CircuitFactory wrapper memoizing the controlled powers of the wrapped factory's circuit.
+"""
+
+from qiskit import QuantumCircuit
+
+from qiskit.aqua.utils.circuit_factory import CircuitFactory
+
+
+class CachedCircuitFactory(CircuitFactory):
+
+    """
+    Wraps a CircuitFactory and memoizes the sub-circuits built by its `build_controlled_power`.
+
+    Sub-circuits are cached per power, target and ancilla qubits, and reused for any control qubit.
+    If the wrapped factory does not override `build_controlled_power`, a power 2k is derived
+    from the cached power k by repetition, such that the successive powers 1, 2, 4, ...
+    used by phase estimation only require a single controlled build.
+    """
+
+    def __init__(self, circuit_factory):
+        super().__init__(circuit_factory.num_target_qubits)
+        self._circuit_factory = circuit_factory
+        self._controlled_power_cache = {}
+        self._derive_powers = \
+            type(circuit_factory).build_controlled_power is CircuitFactory.build_controlled_power
+
+    @property
+    def circuit_factory(self):
+        """ Returns the wrapped CircuitFactory """
+        return self._circuit_factory
+
+    def required_ancillas(self):
+        return self._circuit_factory.required_ancillas()
+
+    def required_ancillas_controlled(self):
+        return self._circuit_factory.required_ancillas_controlled()
+
+    def build(self, qc, q, q_ancillas=None):
+        self._circuit_factory.build(qc, q, q_ancillas)
+
+    def build_inverse(self, qc, q, q_ancillas=None):
+        self._circuit_factory.build_inverse(qc, q, q_ancillas)
+
+    def build_controlled(self, qc, q, q_control, q_ancillas=None, use_basis_gates=True):
+        self._circuit_factory.build_controlled(qc, q, q_control, q_ancillas, use_basis_gates)
+
+    def build_controlled_inverse(self, qc, q, q_control, q_ancillas=None, use_basis_gates=True):
+        self._circuit_factory.build_controlled_inverse(qc, q, q_control, q_ancillas, use_basis_gates)
+
+    def build_power(self, qc, q, power, q_ancillas=None):
+        self._circuit_factory.build_power(qc, q, power, q_ancillas)
+
+    def build_inverse_power(self, qc, q, power, q_ancillas=None):
+        self._circuit_factory.build_inverse_power(qc, q, power, q_ancillas)
+
+    def build_controlled_inverse_power(self, qc, q, q_control, power, q_ancillas=None, use_basis_gates=True):
+        self._circuit_factory.build_controlled_inverse_power(qc, q, q_control, power, q_ancillas, use_basis_gates)
+
+    def build_controlled_power(self, qc, q, q_control, power, q_ancillas=None, use_basis_gates=True):
+        cached_control, data = self._get_controlled_power_data(qc, q, q_control, power, q_ancillas, use_basis_gates)
+        for instruction, qargs, cargs in data:
+            qc.append(instruction, [q_control if qarg == cached_control else qarg for qarg in qargs], cargs)
+
+    def _get_controlled_power_data(self, qc, q, q_control, power, q_ancillas, use_basis_gates):
+        key = (tuple(q), None if q_ancillas is None else tuple(q_ancillas), use_basis_gates, power)
+        if key not in self._controlled_power_cache:
+            if self._derive_powers and power > 1 and power % 2 == 0:
+                cached_control, data = self._get_controlled_power_data(
+                    qc, q, q_control, power // 2, q_ancillas, use_basis_gates
+                )
+                self._controlled_power_cache[key] = (cached_control, data * 2)
+            else:
+                qc_ = QuantumCircuit(*qc.qregs)
+                self._circuit_factory.build_controlled_power(qc_, q, q_control, power, q_ancillas, use_basis_gates)
+                self._controlled_power_cache[key] = (q_control, qc_.data)
+        return self._controlled_power_cache[key]
@@ -15,7 +15,6 @@
 import operator
 
 import numpy as np
-from sklearn.decomposition import PCA
 
 
 def get_num_classes(dataset):
@@ -124,5 +123,7 @@ def reduce_dim_to_via_pca(x, dim):
         numpy.ndarray: NxD' array
 
     """
+    from sklearn.decomposition import PCA
+
     x_reduced = PCA(n_components=dim).fit_transform(x)
     return x_reduced
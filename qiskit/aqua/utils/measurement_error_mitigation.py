@@ -12,10 +12,15 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import copy
 import logging
 
+import numpy as np
+from scipy import sparse as scisparse
+from scipy.sparse.linalg import gmres
 from qiskit.ignis.mitigation.measurement import (complete_meas_cal, tensored_meas_cal,
                                                  CompleteMeasFitter, TensoredMeasFitter)
+from qiskit.validation.base import Obj
 
 from .run_circuits import compile_circuits
 from ..aqua_error import AquaError
@@ -81,7 +86,7 @@ def get_measured_qubits_from_qobj(qobj):
 
 def build_measurement_error_mitigation_qobj(qubit_list, fitter_cls, backend,
                                             backend_config=None, compile_config=None,
-                                            run_config=None):
+                                            run_config=None, mit_pattern=None):
     """
         Args:
             qubit_list (list[int]): list of qubits used in the algorithm
@@ -90,10 +95,12 @@ def build_measurement_error_mitigation_qobj(qubit_list, fitter_cls, backend,
             backend_config (dict, optional): configuration for backend
             compile_config (dict, optional): configuration for compilation
             run_config (RunConfig, optional): configuration for running a circuit
+            mit_pattern (list[list[int]], optional): blocks of qubits calibrated together by
+                                                     TensoredMeasFitter, defaults to one block per qubit
 
         Returns:
             QasmQobj: the Qobj with calibration circuits at the beginning
-            list[str]: the state labels for build MeasFitter
+            list[str]: the state labels for build MeasFitter, or the mit_pattern for TensoredMeasFitter
             list[str]: the labels of the calibration circuits
 
         Raises:
@@ -108,11 +115,140 @@ def build_measurement_error_mitigation_qobj(qubit_list, fitter_cls, backend,
     if fitter_cls == CompleteMeasFitter:
         meas_calibs_circuits, state_labels = complete_meas_cal(qubit_list=qubit_list, circlabel=circlabel)
     elif fitter_cls == TensoredMeasFitter:
-        # TODO support different calibration
-        raise AquaError("Does not support TensoredMeasFitter yet.")
+        if mit_pattern is None:
+            mit_pattern = [[qubit] for qubit in qubit_list]
+        meas_calibs_circuits, state_labels = tensored_meas_cal(mit_pattern=mit_pattern, circlabel=circlabel)
     else:
         raise AquaError("Unknown fitter {}".format(fitter_cls))
 
     cals_qobj = compile_circuits(meas_calibs_circuits, backend, backend_config, compile_config, run_config)
 
     return cals_qobj, state_labels, circlabel
+
+
+class TensoredMeasurementFilter:
+    """
+    Measurement error mitigation with a calibration matrix per block of qubits.
+
+    The calibration matrix of all the measured qubits is the Kronecker product of the block
+    matrices; it is only evaluated between the observed bitstrings, as a sparse matrix keeping the
+    entries above a cutoff, and the corrected counts are solved for iteratively, so that the cost
+    depends on the number of distinct outcomes rather than on 2^N.
+    """
+
+    def __init__(self, cal_matrices, mit_pattern, qubit_list, cutoff=1e-8):
+        """
+        Args:
+            cal_matrices (list[numpy.ndarray]): calibration matrix of each block, the entry (i, j)
+                                                being the probability to measure i having prepared j
+            mit_pattern (list[list[int]]): the qubits of each block, bit k of the index of a block
+                                           state being the value of its k-th qubit
+            qubit_list (list[int]): the measured qubits, the qubit qubit_list[k] being read in the
+                                    k-th rightmost bit of the counts
+            cutoff (float): entries of the reduced calibration matrix below it are dropped
+        """
+        self._cal_matrices = [np.asarray(cal_matrix, dtype=float) for cal_matrix in cal_matrices]
+        self._mit_pattern = mit_pattern
+        self._qubit_list = list(qubit_list)
+        self._cutoff = cutoff
+
+    @property
+    def cal_matrices(self):
+        """ Returns the calibration matrix of each block """
+        return self._cal_matrices
+
+    def apply(self, raw_data, method='least_squares'):
+        """
+        Apply the calibration matrices to results.
+
+        Args:
+            raw_data (dict or Result): counts dictionary, or a Result whose counts are all corrected
+            method (str): 'least_squares' returns the nearest probability distribution to the solution,
+                          scaled to the number of shots; 'pseudo_inverse' returns the solution as is,
+                          which may have negative entries
+
+        Returns:
+            dict or Result: the corrected data, in the same form as raw_data
+
+        Raises:
+            AquaError: if the method is unknown
+        """
+        if method not in ['least_squares', 'pseudo_inverse']:
+            raise AquaError("Unknown method {}".format(method))
+
+        if isinstance(raw_data, dict):
+            return self._apply_counts(raw_data, method)
+
+        new_result = copy.deepcopy(raw_data)
+        for idx, experiment in enumerate(new_result.results):
+            counts = self._apply_counts(raw_data.get_counts(idx), method)
+            experiment.data.counts = Obj(**{hex(int(key, 2)): value for key, value in counts.items()})
+        return new_result
+
+    def _apply_counts(self, counts, method):
+        keys = [key.replace(' ', '') for key in counts.keys()]
+        num_bits = len(keys[0])
+        frequencies = np.asarray(list(counts.values()), dtype=float)
+        # bits[k, i] is the i-th rightmost bit of the k-th observed bitstring
+        chars = np.frombuffer(''.join(keys).encode(), dtype=np.uint8).reshape(len(keys), num_bits)
+        bits = (chars[:, ::-1] - ord('0')).astype(int)
+
+        block_states = []
+        for block in self._mit_pattern:
+            positions = [self._qubit_list.index(qubit) for qubit in block]
+            block_states.append(bits[:, positions] @ (1 << np.arange(len(block))))
+
+        cal_matrix = self._reduced_cal_matrix(block_states)
+        solution, info = gmres(cal_matrix, frequencies, tol=1e-10, atol=0)
+        if info != 0:
+            logger.warning("The mitigated counts did not converge, gmres returned {}.".format(info))
+
+        if method == 'least_squares':
+            solution = _nearest_distribution(solution, np.sum(frequencies))
+        return {key: value for key, value in zip(keys, solution) if value != 0}
+
+    def _reduced_cal_matrix(self, block_states, chunk_size=1000000):
+        """
+        Builds the calibration matrix restricted to the observed bitstrings, with normalized columns.
+
+        Args:
+            block_states (list[numpy.ndarray]): the state of each block in each observed bitstring
+            chunk_size (int): number of entries evaluated at once
+
+        Returns:
+            scipy.sparse.csr_matrix: the reduced calibration matrix
+        """
+        num_states = len(block_states[0])
+        rows, cols, values = [], [], []
+        num_rows = max(1, chunk_size // num_states)
+        for start in range(0, num_states, num_rows):
+            stop = min(start + num_rows, num_states)
+            chunk = np.ones((stop - start, num_states))
+            for cal_matrix, states in zip(self._cal_matrices, block_states):
+                chunk *= cal_matrix[np.ix_(states[start:stop], states)]
+            chunk_rows, chunk_cols = np.nonzero(chunk > self._cutoff)
+            rows.append(chunk_rows + start)
+            cols.append(chunk_cols)
+            values.append(chunk[chunk_rows, chunk_cols])
+        cal_matrix = scisparse.csc_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+                                          shape=(num_states, num_states))
+        # the probability leaking out of the observed bitstrings is not accounted for
+        column_sums = np.asarray(cal_matrix.sum(axis=0)).ravel()
+        return (cal_matrix @ scisparse.diags(1 / column_sums)).tocsr()
+
+
+def _nearest_distribution(quasi_counts, shots):
+    """
+    Projects quasi counts on the nearest, in the euclidean norm, non-negative counts summing to shots.
+
+    Args:
+        quasi_counts (numpy.ndarray): counts that may have negative entries
+        shots (float): total of the counts
+
+    Returns:
+        numpy.ndarray: the projected counts
+    """
+    sorted_counts = np.sort(quasi_counts)[::-1]
+    thresholds = (np.cumsum(sorted_counts) - shots) / np.arange(1, len(quasi_counts) + 1)
+    num_positive = np.count_nonzero(sorted_counts - thresholds > 0)
+    return np.maximum(quasi_counts - thresholds[num_positive - 1], 0)
@@ -15,12 +15,12 @@
 import logging
 
 import numpy as np
-from cvxopt import matrix, solvers
 
 logger = logging.getLogger(__name__)
 
 
-def optimize_svm(kernel_matrix, y, scaling=None, max_iters=500, show_progress=False):
+def optimize_svm(kernel_matrix, y, scaling=None, max_iters=500, show_progress=False,
+                 solver='cvxopt', initial_alpha=None):
     """
     Solving quadratic programming problem for SVM; thus, some constraints are fixed.
 
@@ -32,36 +32,54 @@ def optimize_svm(kernel_matrix, y, scaling=None, max_iters=500, show_progress=Fa
         y (numpy.ndarray): Nx1 array
         scaling (float): the scaling factor to renormalize the `y`, if it is None,
                             use L2-norm of `y` for normalization
-        max_iters (int): number of iterations for QP solver
+        max_iters (int): number of iterations for QP solver, the 'smo' solver runs at most
+                            max_iters * N pair updates
         show_progress (bool): showing the progress of QP solver
+        solver (str): 'cvxopt' for the dense interior-point solver, or 'smo' for sequential minimal
+                            optimization, which only reads the kernel rows of the updated pairs, such that
+                            the kernel matrix may be a memory-mapped array
+        initial_alpha (numpy.ndarray): N array, starting point of the 'smo' solver, e.g. the alphas of
+                            a previous training
 
     Returns:
         numpy.ndarray: Sx1 array, where S is the number of supports
         numpy.ndarray: Sx1 array, where S is the number of supports
         numpy.ndarray: Sx1 array, where S is the number of supports
+
+    Raises:
+        ValueError: if the solver is unknown
     """
     if y.ndim == 1:
         y = y[:, np.newaxis]
-    H = np.outer(y, y) * kernel_matrix
-    f = -np.ones(y.shape)
-    if scaling is None:
-        scaling = np.sum(np.sqrt(f * f))
-    f /= scaling
-
     tolerance = 1e-2
     n = kernel_matrix.shape[1]
 
-    P = matrix(H)
-    q = matrix(f)
-    G = matrix(-np.eye(n))
-    h = matrix(np.zeros(n))
-    A = matrix(y, y.T.shape)
-    b = matrix(np.zeros(1), (1, 1))
-    solvers.options['maxiters'] = max_iters
-    solvers.options['show_progress'] = show_progress
-
-    ret = solvers.qp(P, q, G, h, A, b, kktsolver='ldl')
-    alpha = np.asarray(ret['x']) * scaling
+    if solver == 'cvxopt':
+        from cvxopt import matrix, solvers
+
+        H = np.outer(y, y) * kernel_matrix
+        f = -np.ones(y.shape)
+        if scaling is None:
+            scaling = np.sum(np.sqrt(f * f))
+        f /= scaling
+
+        P = matrix(H)
+        q = matrix(f)
+        G = matrix(-np.eye(n))
+        h = matrix(np.zeros(n))
+        A = matrix(y, y.T.shape)
+        b = matrix(np.zeros(1), (1, 1))
+        solvers.options['maxiters'] = max_iters
+        solvers.options['show_progress'] = show_progress
+
+        ret = solvers.qp(P, q, G, h, A, b, kktsolver='ldl')
+        alpha = np.asarray(ret['x']) * scaling
+    elif solver == 'smo':
+        # the scaling does not change the minimizer of the dual problem
+        alpha = _smo(kernel_matrix, y.flatten(), max_iters * n, initial_alpha)[:, np.newaxis]
+    else:
+        raise ValueError('Unknown solver {}, use cvxopt or smo.'.format(solver))
+
     avg_y = np.sum(y)
     avg_mat = (alpha * y).T.dot(kernel_matrix.dot(np.ones(y.shape)))
     b = (avg_y - avg_mat) / n
@@ -69,3 +87,61 @@ def optimize_svm(kernel_matrix, y, scaling=None, max_iters=500, show_progress=Fa
     support = alpha > tolerance
     logger.debug('Solving QP problem is completed.')
     return alpha.flatten(), b.flatten(), support.flatten()
+
+
+def _smo(kernel_matrix, y, max_iters, initial_alpha=None, eps=1e-3, tau=1e-12):
+    """
+    Sequential minimal optimization of the hard margin dual problem
+    min_a 0.5 a^T Q a - sum(a), with Q = y y^T K, subject to a >= 0 and y^T a = 0.
+
+    The working pairs are selected with second order information, see
+    R.-E. Fan, P.-H. Chen and C.-J. Lin, JMLR 6, 1889 (2005).
+
+    Args:
+        kernel_matrix (numpy.ndarray): NxN array, only the rows of the working pairs are read
+        y (numpy.ndarray): N array of labels, -1 or 1
+        max_iters (int): maximum number of pair updates
+        initial_alpha (numpy.ndarray): N array, feasible starting point, defaults to zeros
+        eps (float): stopping tolerance of the maximal violation of the optimality conditions
+        tau (float): lower bound of the curvature of the pair objective
+
+    Returns:
+        numpy.ndarray: N array, the alphas
+    """
+    n = len(y)
+    diagonal = np.asarray(np.diagonal(kernel_matrix), dtype=float)
+    if initial_alpha is None:
+        alpha = np.zeros(n)
+        gradient = -np.ones(n)
+    else:
+        alpha = np.maximum(np.asarray(initial_alpha, dtype=float).flatten(), 0)
+        gradient = y * np.asarray(kernel_matrix.dot(alpha * y), dtype=float) - 1
+    for num_iters in range(max_iters + 1):
+        # without upper bound, a_t can increase along y_t, and decrease against y_t if it is positive
+        violation = -y * gradient
+        up = (y > 0) | (alpha > 0)
+        low = (y < 0) | (alpha > 0)
+        i = np.flatnonzero(up)[np.argmax(violation[up])]
+        candidates = low & (violation < violation[i])
+        if not np.any(candidates) or violation[i] - np.min(violation[candidates]) < eps:
+            break
+        if num_iters == max_iters:
+            logger.warning('SMO did not converge within {} iterations.'.format(max_iters))
+            break
+        kernel_i = np.asarray(kernel_matrix[i], dtype=float)
+        curvature = np.maximum(diagonal[i] + diagonal - 2 * kernel_i, tau)
+        decrease = (violation[i] - violation) ** 2 / curvature
+        j = np.flatnonzero(candidates)[np.argmax(decrease[candidates])]
+        kernel_j = np.asarray(kernel_matrix[j], dtype=float)
+
+        # move along y_i e_i - y_j e_j, keeping both alphas non-negative
+        step = (violation[i] - violation[j]) / curvature[j]
+        if y[i] < 0:
+            step = min(step, alpha[i])
+        if y[j] > 0:
+            step = min(step, alpha[j])
+        alpha[i] = max(alpha[i] + y[i] * step, 0)
+        alpha[j] = max(alpha[j] - y[j] * step, 0)
+        gradient += y * step * (kernel_i - kernel_j)
+    logger.debug('SMO finished after {} iterations.'.format(num_iters))
+    return alpha
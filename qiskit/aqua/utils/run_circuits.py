@@ -28,6 +28,7 @@ from qiskit.providers.basicaer import BasicAerJob
 from qiskit.qobj import QobjHeader, QasmQobj
 from qiskit.aqua.aqua_error import AquaError
 from qiskit.aqua.utils import summarize_circuits
+from qiskit.aqua.utils.run_report import report_stage
 from qiskit.aqua.utils.backend_utils import (is_aer_provider,
                                              is_basicaer_provider,
                                              is_ibmq_provider,
@@ -116,13 +117,15 @@ def _maybe_add_aer_expectation_instruction(qobj, options):
     return qobj
 
 
-def _compile_wrapper(circuits, backend, backend_config, compile_config, run_config):
-    transpiled_circuits = compiler.transpile(circuits, backend, **backend_config, **compile_config)
+def _compile_wrapper(circuits, backend, backend_config, compile_config, run_config, run_report=None):
+    with report_stage(run_report, 'transpile', num_circuits=len(circuits)):
+        transpiled_circuits = compiler.transpile(circuits, backend, **backend_config, **compile_config)
     if not isinstance(transpiled_circuits, list):
         transpiled_circuits = [transpiled_circuits]
 
-    qobj = assemble_circuits(transpiled_circuits, qobj_id=str(uuid.uuid4()), qobj_header=QobjHeader(),
-                             run_config=run_config)
+    with report_stage(run_report, 'assemble', num_circuits=len(transpiled_circuits)):
+        qobj = assemble_circuits(transpiled_circuits, qobj_id=str(uuid.uuid4()), qobj_header=QobjHeader(),
+                                 run_config=run_config)
     return qobj, transpiled_circuits
 
 
@@ -146,7 +149,7 @@ def _split_qobj_to_qobjs(qobj, chunk_size):
 
 
 def compile_circuits(circuits, backend, backend_config=None, compile_config=None, run_config=None,
-                     show_circuit_summary=False, circuit_cache=None, **kwargs):
+                     show_circuit_summary=False, circuit_cache=None, run_report=None, **kwargs):
     """
     An execution wrapper with Qiskit-Terra, with job auto recover capability.
 
@@ -161,6 +164,7 @@ def compile_circuits(circuits, backend, backend_config=None, compile_config=None
         run_config (RunConfig, optional): configuration for running a circuit
         show_circuit_summary (bool, optional): showing the summary of submitted circuits.
         circuit_cache (CircuitCache, optional): A CircuitCache to use when calling compile_and_run_circuits
+        run_report (RunReport, optional): report recording the stages of the compilation and the circuits
         kwargs (optional): special aer instructions to evaluation the expectation of a hamiltonian
 
     Returns:
@@ -195,7 +199,8 @@ def compile_circuits(circuits, backend, backend_config=None, compile_config=None
         else:  # Try setting up the reusable qobj
             # Compile and cache first circuit if cache is empty. The load method will try to reuse it
             if circuit_cache.qobjs is None:
-                qobj, _ = _compile_wrapper([circuits[0]], backend, backend_config, compile_config, run_config)
+                qobj, _ = _compile_wrapper([circuits[0]], backend, backend_config, compile_config, run_config,
+                                           run_report)
 
                 if is_aer_provider(backend):
                     qobj = _maybe_add_aer_expectation_instruction(qobj, kwargs)
@@ -205,16 +210,23 @@ def compile_circuits(circuits, backend, backend_config=None, compile_config=None
     if circuit_cache is not None and circuit_cache.misses < circuit_cache.allowed_misses:
         try:
             if circuit_cache.cache_transpiled_circuits:
-                transpiled_circuits = compiler.transpile(circuits, backend, **backend_config,
-                                                         **compile_config)
-                qobj = circuit_cache.load_qobj_from_cache(transpiled_circuits, 0, run_config=run_config)
+                with report_stage(run_report, 'transpile', num_circuits=len(circuits)):
+                    transpiled_circuits = compiler.transpile(circuits, backend, **backend_config,
+                                                             **compile_config)
+                with report_stage(run_report, 'circuit_cache', num_circuits=len(circuits)):
+                    qobj = circuit_cache.load_qobj_from_cache(transpiled_circuits, 0, run_config=run_config)
             else:
-                qobj = circuit_cache.load_qobj_from_cache(circuits, 0, run_config=run_config)
+                with report_stage(run_report, 'circuit_cache', num_circuits=len(circuits)):
+                    qobj = circuit_cache.load_qobj_from_cache(circuits, 0, run_config=run_config)
+            if run_report is not None:
+                run_report.add_cache_lookup(hit=True)
 
             if is_aer_provider(backend):
                 qobj = _maybe_add_aer_expectation_instruction(qobj, kwargs)
         # cache miss, fail gracefully
         except (TypeError, IndexError, FileNotFoundError, EOFError, AquaError, AttributeError) as e:
+            if run_report is not None:
+                run_report.add_cache_lookup(hit=False)
             circuit_cache.try_reusing_qobjs = False  # Reusing Qobj didn't work
             if len(circuit_cache.qobjs) > 0:
                 logger.info('Circuit cache miss, recompiling. Cache miss reason: ' + repr(e))
@@ -224,7 +236,7 @@ def compile_circuits(circuits, backend, backend_config=None, compile_config=None
             circuit_cache.clear_cache()
 
             qobj, transpiled_circuits = _compile_wrapper(circuits, backend, backend_config,
-                                                         compile_config, run_config)
+                                                         compile_config, run_config, run_report)
             if is_aer_provider(backend):
                 qobj = _maybe_add_aer_expectation_instruction(qobj, kwargs)
             try:
@@ -239,7 +251,7 @@ def compile_circuits(circuits, backend, backend_config=None, compile_config=None
 
     else:
         qobj, transpiled_circuits = _compile_wrapper(circuits, backend, backend_config, compile_config,
-                                                     run_config)
+                                                     run_config, run_report)
         if is_aer_provider(backend):
             qobj = _maybe_add_aer_expectation_instruction(qobj, kwargs)
 
@@ -250,6 +262,9 @@ def compile_circuits(circuits, backend, backend_config=None, compile_config=None
             logger.debug("====  After transpiler ====")
             logger.debug(summarize_circuits(transpiled_circuits))
 
+    if run_report is not None:
+        run_report.add_circuits(transpiled_circuits if transpiled_circuits is not None else circuits)
+
     return qobj
 
 
@@ -290,7 +305,7 @@ def _safe_get_job_status(job, job_id):
 
 
 def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
-             noise_config=None, skip_qobj_validation=False, job_callback=None):
+             noise_config=None, skip_qobj_validation=False, job_callback=None, run_report=None):
     """
     An execution wrapper with Qiskit-Terra, with job auto recover capability.
 
@@ -307,6 +322,7 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
                                                only works for Aer and BasicAer providers
         job_callback (Callable, optional): callback used in querying info of the submitted job, and
                                            providing the following arguments: job_id, job_status, queue_position, job
+        run_report (RunReport, optional): report recording the submission, queueing, run and result stages
 
     Returns:
         Result: Result object
@@ -336,10 +352,13 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
     qobjs = _split_qobj_to_qobjs(qobj, max_circuits_per_job)
     jobs = []
     job_ids = []
+    submit_times = []
     for qobj in qobjs:
-        job, job_id = _safe_submit_qobj(qobj, backend, backend_options, noise_config, skip_qobj_validation)
+        with report_stage(run_report, 'submit', num_experiments=len(qobj.experiments)):
+            job, job_id = _safe_submit_qobj(qobj, backend, backend_options, noise_config, skip_qobj_validation)
         job_ids.append(job_id)
         jobs.append(job)
+        submit_times.append(run_report.now() if run_report is not None else None)
 
     results = []
     if with_autorecover:
@@ -351,11 +370,20 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
             job_id = job_ids[idx]
             while True:
                 logger.info("Running {}-th qobj, job id: {}".format(idx, job_id))
+                # the job is seen as queued until its first status other than QUEUED
+                queue_end = None
                 # try to get result if possible
                 while True:
                     job_status = _safe_get_job_status(job, job_id)
                     queue_position = 0
+                    if run_report is not None and queue_end is None and job_status != JobStatus.QUEUED:
+                        queue_end = run_report.now()
+                        run_report.add_record('queue', submit_times[idx], queue_end - submit_times[idx],
+                                              job_id=job_id)
                     if job_status in JOB_FINAL_STATES:
+                        if run_report is not None:
+                            run_report.add_record('run', queue_end, run_report.now() - queue_end, job_id=job_id,
+                                                  status=str(job_status))
                         # do callback again after the job is in the final states
                         if job_callback is not None:
                             job_callback(job_id, job_status, queue_position, job)
@@ -372,7 +400,8 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
                 # get result after the status is DONE
                 if job_status == JobStatus.DONE:
                     while True:
-                        result = job.result(**qjob_config)
+                        with report_stage(run_report, 'result', job_id=job_id):
+                            result = job.result(**qjob_config)
                         if result.success:
                             results.append(result)
                             logger.info("COMPLETED the {}-th qobj, job id: {}".format(idx, job_id))
@@ -397,15 +426,21 @@ def run_qobj(qobj, backend, qjob_config=None, backend_options=None,
                         logging.warning("FAILURE: Job id: {}. Unknown status: {}. "
                                         "Re-submit the Qobj.".format(job_id, job_status))
 
-                    job, job_id = _safe_submit_qobj(qobj, backend, backend_options, noise_config, skip_qobj_validation)
+                    with report_stage(run_report, 'submit', num_experiments=len(qobj.experiments)):
+                        job, job_id = _safe_submit_qobj(qobj, backend, backend_options, noise_config,
+                                                        skip_qobj_validation)
                     jobs[idx] = job
                     job_ids[idx] = job_id
+                    submit_times[idx] = run_report.now() if run_report is not None else None
     else:
         results = []
-        for job in jobs:
-            results.append(job.result(**qjob_config))
+        for job, job_id in zip(jobs, job_ids):
+            # local simulators run the job while the result is awaited
+            with report_stage(run_report, 'run', job_id=job_id):
+                results.append(job.result(**qjob_config))
 
-    result = _combine_result_objects(results) if len(results) != 0 else None
+    with report_stage(run_report, 'combine_results', num_results=len(results)):
+        result = _combine_result_objects(results) if len(results) != 0 else None
 
     return result
 
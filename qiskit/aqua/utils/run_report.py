@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+A lightweight report of where the time of the circuit executions goes.
+
+A RunReport attached to a QuantumInstance records the duration of each stage of
+QuantumInstance.execute and run_qobj, i.e. the transpilation, the CircuitCache lookup,
+the Qobj assembly, the job submission, the queueing, the run, the combination of the
+results and the measurement error mitigation, together with the number, depths and
+widths of the executed circuits and the hit rate of the CircuitCache.
+"""
+
+from contextlib import contextmanager, ExitStack
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RunReport:
+    """ Records the per-stage timings and circuit statistics of circuit executions. """
+
+    def __init__(self, callback=None):
+        """
+        Args:
+            callback (Callable, optional): called with the record of each stage when it ends, a dict with
+                                           the name, start and duration in seconds and args of the stage
+        """
+        self._callback = callback
+        self._origin = time.perf_counter()
+        self._records = []
+        self._circuits = []
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @property
+    def records(self):
+        """ Returns the record of each stage, in the order they ended """
+        return self._records
+
+    @property
+    def circuits(self):
+        """ Returns the statistics of each executed circuit: number of qubits, depth and size """
+        return self._circuits
+
+    def reset(self):
+        """ Clears the records """
+        self._origin = time.perf_counter()
+        self._records = []
+        self._circuits = []
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @contextmanager
+    def stage(self, name, **kwargs):
+        """
+        Context manager timing a stage.
+
+        Args:
+            name (str): name of the stage
+            kwargs: extra information stored in the args of the record
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_record(name, start - self._origin, time.perf_counter() - start, **kwargs)
+
+    def add_record(self, name, start, duration, **kwargs):
+        """
+        Records a stage timed by the caller.
+
+        Args:
+            name (str): name of the stage
+            start (float): start of the stage, in seconds since the creation or the reset of the report
+            duration (float): duration of the stage, in seconds
+            kwargs: extra information stored in the args of the record
+        """
+        record = {'name': name, 'start': start, 'duration': duration,
+                  'thread': threading.get_ident(), 'args': kwargs}
+        self._records.append(record)
+        if self._callback is not None:
+            self._callback(record)
+
+    def now(self):
+        """ Returns the time in seconds since the creation or the reset of the report """
+        return time.perf_counter() - self._origin
+
+    def add_circuits(self, circuits):
+        """
+        Records the statistics of executed circuits.
+
+        Args:
+            circuits (list[QuantumCircuit]): the circuits
+        """
+        for circuit in circuits:
+            self._circuits.append({'name': circuit.name, 'width': circuit.width(),
+                                   'depth': circuit.depth(), 'size': circuit.size()})
+
+    def add_cache_lookup(self, hit):
+        """
+        Records a CircuitCache lookup.
+
+        Args:
+            hit (bool): whether the Qobj was loaded from the cache
+        """
+        if hit:
+            self._cache_hits += 1
+        else:
+            self._cache_misses += 1
+
+    def summary(self):
+        """
+        Aggregates the records.
+
+        Returns:
+            dict: the number of calls, total and maximum duration of each stage, the number of circuits
+                  with their mean and maximum depth and width, and the CircuitCache hits, misses and hit rate
+        """
+        stages = {}
+        for record in self._records:
+            stage = stages.setdefault(record['name'], {'count': 0, 'total_time': 0.0, 'max_time': 0.0})
+            stage['count'] += 1
+            stage['total_time'] += record['duration']
+            stage['max_time'] = max(stage['max_time'], record['duration'])
+
+        circuits = {'count': len(self._circuits)}
+        for key in ['depth', 'width']:
+            values = [circuit[key] for circuit in self._circuits]
+            circuits['mean_' + key] = sum(values) / len(values) if values else 0
+            circuits['max_' + key] = max(values) if values else 0
+
+        lookups = self._cache_hits + self._cache_misses
+        cache = {'hits': self._cache_hits, 'misses': self._cache_misses,
+                 'hit_rate': self._cache_hits / lookups if lookups > 0 else None}
+        return {'stages': stages, 'circuits': circuits, 'circuit_cache': cache}
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: the summary and all the records of the report
+        """
+        return {'summary': self.summary(), 'records': self._records, 'circuits': self._circuits}
+
+    def save_json(self, file_name):
+        """
+        Saves the report as json.
+
+        Args:
+            file_name (str): the file
+        """
+        with open(file_name, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def save_chrome_trace(self, file_name):
+        """
+        Saves the records in the Chrome trace event format, which chrome://tracing and Perfetto display.
+
+        Args:
+            file_name (str): the file
+        """
+        pid = os.getpid()
+        events = [{'name': record['name'], 'ph': 'X', 'pid': pid, 'tid': record['thread'],
+                   'ts': record['start'] * 1e6, 'dur': record['duration'] * 1e6, 'args': record['args']}
+                  for record in self._records]
+        with open(file_name, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+def report_stage(run_report, name, **kwargs):
+    """
+    Times a stage in a report, if any.
+
+    Args:
+        run_report (RunReport): the report, or None
+        name (str): name of the stage
+        kwargs: extra information stored in the args of the record
+
+    Returns:
+        the context manager of the stage, which does nothing if run_report is None
+    """
+    if run_report is None:
+        return ExitStack()
+    return run_report.stage(name, **kwargs)
@@ -35,6 +35,26 @@ def get_subsystem_density_matrix(statevector, trace_systems):
     return rho_sub
 
 
+def get_subsystem_probabilities(statevector, trace_systems):
+    """
+    Compute the measurement probabilities of a quantum subsystem,
+    i.e. the diagonal of its reduced density matrix, without forming any density matrix.
+
+    Args:
+        statevector (list|array): The state vector of the complete system
+        trace_systems (list|range): The indices of the qubits to be traced out.
+
+    Returns:
+        numpy.ndarray: The probabilities of the basis states of the desired subsystem,
+            in the same order as the diagonal of `get_subsystem_density_matrix`
+    """
+    probabilities = np.abs(np.asarray(statevector)) ** 2
+    num_qubits = int(np.log2(probabilities.shape[0]))
+    # axis j of the qubit tensor corresponds to qubit num_qubits - 1 - j
+    traced_axes = tuple(num_qubits - 1 - q for q in trace_systems)
+    return probabilities.reshape([2] * num_qubits).sum(axis=traced_axes).reshape(-1)
+
+
 def get_subsystem_fidelity(statevector, trace_systems, subsystem_state):
     """
     Compute the fidelity of the quantum subsystem.
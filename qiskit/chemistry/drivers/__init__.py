@@ -12,7 +12,7 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-from ._basedriver import BaseDriver, UnitsType, HFMethodType
+from ._basedriver import BaseDriver, UnitsType, HFMethodType, QMoleculeCache
 from ._discover_driver import (DRIVERS_ENTRY_POINT,
                                refresh_drivers,
                                register_driver,
@@ -29,6 +29,7 @@ from .pyscfd import PySCFDriver, InitialGuess
 __all__ = ['BaseDriver',
            'UnitsType',
            'HFMethodType',
+           'QMoleculeCache',
            'DRIVERS_ENTRY_POINT',
            'refresh_drivers',
            'register_driver',
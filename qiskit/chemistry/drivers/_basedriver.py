@@ -21,7 +21,14 @@ Doing so requires that the required driver interface is implemented.
 
 from abc import ABC, abstractmethod
 import copy
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import time
 from qiskit.aqua.parser import JSONSchema
+from qiskit.chemistry.qmolecule import QMolecule
 from enum import Enum
 import logging
 
@@ -39,6 +46,85 @@ class HFMethodType(Enum):
     UHF = 'uhf'
 
 
+class QMoleculeCache(object):
+    """
+    On-disk cache of driver results, with one HDF5 file per driver configuration.
+
+    The least recently used files are removed when the number of files exceeds max_size.
+    """
+
+    def __init__(self, directory, max_size=100):
+        """
+        Initializer
+        Args:
+            directory (str): directory of the HDF5 files, created if missing
+            max_size (int): maximum number of cached molecules
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def _path(self, key):
+        return os.path.join(self._directory, '{}.hdf5'.format(key))
+
+    def _paths(self):
+        """ Returns the cached files, from the least to the most recently used """
+        return sorted(glob.glob(os.path.join(self._directory, '*.hdf5')), key=lambda p: os.stat(p).st_mtime_ns)
+
+    def _touch(self, path):
+        """ Marks a file as the most recently used, also within the coarse clock of the file system """
+        mtime = max([int(time.time() * 1e9)] + [os.stat(p).st_mtime_ns + 1 for p in self._paths()])
+        os.utime(path, ns=(mtime, mtime))
+
+    def get(self, key):
+        """
+        Loads a cached molecule.
+
+        Args:
+            key (str): hash of the driver configuration
+
+        Returns:
+            QMolecule: the molecule, or None if it is not cached
+        """
+        path = self._path(key)
+        if not os.path.isfile(path):
+            self.misses += 1
+            return None
+        # the modification time orders the files for the eviction
+        self._touch(path)
+        molecule = QMolecule(path)
+        molecule.load()
+        self.hits += 1
+        return molecule
+
+    def put(self, key, molecule):
+        """
+        Saves a molecule and evicts the least recently used ones beyond the maximum size.
+
+        Args:
+            key (str): hash of the driver configuration
+            molecule (QMolecule): the molecule
+        """
+        # write to a temporary file first, such that readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=self._directory)
+        os.close(fd)
+        molecule.save(tmp_path)
+        os.replace(tmp_path, self._path(key))
+        self._touch(self._path(key))
+        paths = self._paths()
+        for path in paths[:max(len(paths) - self._max_size, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
 class BaseDriver(ABC):
     """
     Base class for Drivers.
@@ -55,6 +141,7 @@ class BaseDriver(ABC):
         self.check_driver_valid()
         self._configuration = copy.deepcopy(self.CONFIGURATION)
         self._work_path = None
+        self._cache = None
 
     @property
     def configuration(self):
@@ -101,6 +188,56 @@ class BaseDriver(ABC):
     def work_path(self, new_work_path):
         self._work_path = new_work_path
 
+    @property
+    def cache(self):
+        """ Returns the QMoleculeCache of the driver results, None if the driver always runs """
+        return self._cache
+
+    @cache.setter
+    def cache(self, new_cache):
+        self._cache = new_cache
+
+    def _library_version(self):
+        """ Returns the version of the library computing the molecule, None if it is unknown """
+        return None
+
+    @staticmethod
+    def _executable_version(path):
+        """ Returns the path and modification time of an executable, None if it was not found """
+        if path is None or not os.path.exists(path):
+            return None
+        return [os.path.realpath(path), os.path.getmtime(path)]
+
+    def _cache_key(self):
+        """
+        Returns the hash of the driver name and its configuration, with normalized white space
+        within each line, together with the QMolecule format and the driver library versions.
+        """
+        state = {k: '\n'.join(' '.join(line.split()) for line in v.splitlines()) if isinstance(v, str) else v
+                 for k, v in vars(self).items() if k not in ('_configuration', '_work_path', '_cache')}
+        text = json.dumps([self.configuration['name'], QMolecule.QMOLECULE_VERSION, self._library_version(), state],
+                          sort_keys=True, default=str)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _run_cached(self, run):
+        """
+        Runs the driver through the cache, if any.
+
+        Args:
+            run (callable): computes the molecule
+
+        Returns:
+            QMolecule: the cached or computed molecule
+        """
+        if self._cache is None:
+            return run()
+        key = self._cache_key()
+        molecule = self._cache.get(key)
+        if molecule is None:
+            molecule = run()
+            self._cache.put(key, molecule)
+        return molecule
+
     @abstractmethod
     def run(self):
         pass
@@ -90,7 +90,13 @@ class GaussianDriver(BaseDriver):
         logger.debug('init_from_input: {}'.format(kwargs))
         return cls(**kwargs)
 
+    def _library_version(self):
+        return self._executable_version(g16prog)
+
     def run(self):
+        return self._run_cached(self._run)
+
+    def _run(self):
         cfg = self._config
         while not cfg.endswith('\n\n'):
             cfg += '\n'
@@ -81,7 +81,13 @@ class PSI4Driver(BaseDriver):
         logger.debug('init_from_input: {}'.format(kwargs))
         return cls(**kwargs)
 
+    def _library_version(self):
+        return self._executable_version(psi4)
+
     def run(self):
+        return self._run_cached(self._run)
+
+    def _run(self):
         # create input
         psi4d_directory = os.path.dirname(os.path.realpath(__file__))
         template_file = psi4d_directory + '/_template.txt'
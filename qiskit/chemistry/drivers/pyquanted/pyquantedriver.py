@@ -180,6 +180,9 @@ class PyQuanteDriver(BaseDriver):
         return cls(**kwargs)
 
     def run(self):
+        return self._run_cached(self._run)
+
+    def _run(self):
         q_mol = compute_integrals(atoms=self._atoms,
                                   units=self._units,
                                   charge=self._charge,
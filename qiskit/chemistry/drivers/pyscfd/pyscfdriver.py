@@ -191,7 +191,17 @@ class PySCFDriver(BaseDriver):
         logger.debug('init_from_input: {}'.format(kwargs))
         return cls(**kwargs)
 
+    def _library_version(self):
+        try:
+            from pyscf import __version__
+        except ImportError:
+            return None
+        return __version__
+
     def run(self):
+        return self._run_cached(self._run)
+
+    def _run(self):
         q_mol = compute_integrals(atom=self._atom,
                                   unit=self._unit,
                                   charge=self._charge,
@@ -24,11 +24,76 @@ with warnings.catch_warnings():
 logger = logging.getLogger(__name__)
 
 
+class _Unloaded(object):
+    """Marks an integral array which is not read from the file yet."""
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return '_UNLOADED'
+
+
+_UNLOADED = _Unloaded()
+
+
+class _LazyDataset(object):
+    """Integral array attribute, read from the HDF5 file on first access after a lazy load."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = obj.__dict__.get(self._name)
+        if value is _UNLOADED:
+            value = obj._read_dataset(self._name)
+            obj.__dict__[self._name] = value
+        return value
+
+    def __set__(self, obj, value):
+        obj.__dict__[self._name] = value
+
+
 class QMolecule(object):
     """Molecule data class with driver information."""
 
     QMOLECULE_VERSION = 2
 
+    # HDF5 group of the integral arrays, which a lazy load reads on first access
+    _DATASET_GROUPS = {
+        'hcore': 'integrals', 'hcore_B': 'integrals', 'kinetic': 'integrals', 'overlap': 'integrals',
+        'eri': 'integrals', 'mo_onee_ints': 'integrals', 'mo_onee_ints_B': 'integrals',
+        'mo_eri_ints': 'integrals', 'mo_eri_ints_BB': 'integrals', 'mo_eri_ints_BA': 'integrals',
+        'x_dip_ints': 'dipole', 'y_dip_ints': 'dipole', 'z_dip_ints': 'dipole',
+        'x_dip_mo_ints': 'dipole', 'x_dip_mo_ints_B': 'dipole', 'y_dip_mo_ints': 'dipole',
+        'y_dip_mo_ints_B': 'dipole', 'z_dip_mo_ints': 'dipole', 'z_dip_mo_ints_B': 'dipole'
+    }
+
+    hcore = _LazyDataset('hcore')
+    hcore_B = _LazyDataset('hcore_B')
+    kinetic = _LazyDataset('kinetic')
+    overlap = _LazyDataset('overlap')
+    eri = _LazyDataset('eri')
+    mo_onee_ints = _LazyDataset('mo_onee_ints')
+    mo_onee_ints_B = _LazyDataset('mo_onee_ints_B')
+    mo_eri_ints = _LazyDataset('mo_eri_ints')
+    mo_eri_ints_BB = _LazyDataset('mo_eri_ints_BB')
+    mo_eri_ints_BA = _LazyDataset('mo_eri_ints_BA')
+    x_dip_ints = _LazyDataset('x_dip_ints')
+    y_dip_ints = _LazyDataset('y_dip_ints')
+    z_dip_ints = _LazyDataset('z_dip_ints')
+    x_dip_mo_ints = _LazyDataset('x_dip_mo_ints')
+    x_dip_mo_ints_B = _LazyDataset('x_dip_mo_ints_B')
+    y_dip_mo_ints = _LazyDataset('y_dip_mo_ints')
+    y_dip_mo_ints_B = _LazyDataset('y_dip_mo_ints_B')
+    z_dip_mo_ints = _LazyDataset('z_dip_mo_ints')
+    z_dip_mo_ints_B = _LazyDataset('z_dip_mo_ints_B')
+
     def __init__(self, filename=None):
         self._filename = filename
 
@@ -154,18 +219,52 @@ class QMolecule(object):
 
         return self._filename
 
-    def load(self):
-        """loads info saved."""
+    @staticmethod
+    def _read_array(f, name, key=Ellipsis):
+        _data = f[name][key]
+        if isinstance(_data, numpy.ndarray) and _data.dtype == numpy.bool and _data.size == 1 and not _data:
+            _data = None
+        return _data
+
+    def _read_dataset(self, name, key=Ellipsis):
+        with h5py.File(self._filename, "r") as f:
+            return QMolecule._read_array(f, '{}/{}'.format(QMolecule._DATASET_GROUPS[name], name), key)
+
+    def read_slice(self, name, key):
+        """
+        Reads a slice of an integral array. If the array is not loaded yet, only the
+        slice is read from the file, and the array stays unloaded.
+
+        Args:
+            name (str): attribute name of the array, e.g. 'mo_eri_ints'
+            key (tuple or slice): numpy basic slicing key
+
+        Returns:
+            numpy.ndarray: the slice, or None if the array is None
+        """
+        if self.__dict__.get(name) is _UNLOADED:
+            return self._read_dataset(name, key)
+        value = getattr(self, name)
+        return value[key] if value is not None else None
+
+    def load(self, lazy=False):
+        """
+        loads info saved.
+
+        Args:
+            lazy (bool): if True, the integral arrays are only read from the file on their first access,
+                         such that the file must be kept until then
+        """
         try:
             if self._filename is None:
                 return
 
             with h5py.File(self._filename, "r") as f:
                 def read_array(name):
-                    _data = f[name][...]
-                    if _data.dtype == numpy.bool and _data.size == 1 and not _data:
-                        _data = None
-                    return _data
+                    return QMolecule._read_array(f, name)
+
+                def read_integrals(name):
+                    return _UNLOADED if lazy else read_array(name)
 
                 # A version field was added to save format from version 2 so if
                 # there is no version then we have original (version 1) format
@@ -214,39 +313,51 @@ class QMolecule(object):
                 self.atom_xyz = f["geometry/atom_xyz"][...]
 
                 # 1 and 2 electron integrals in AO basis
-                self.hcore = read_array("integrals/hcore") if version > 1 else None
-                self.hcore_B = read_array("integrals/hcore_B") if version > 1 else None
-                self.kinetic = read_array("integrals/kinetic") if version > 1 else None
-                self.overlap = read_array("integrals/overlap") if version > 1 else None
-                self.eri = read_array("integrals/eri") if version > 1 else None
+                self.hcore = read_integrals("integrals/hcore") if version > 1 else None
+                self.hcore_B = read_integrals("integrals/hcore_B") if version > 1 else None
+                self.kinetic = read_integrals("integrals/kinetic") if version > 1 else None
+                self.overlap = read_integrals("integrals/overlap") if version > 1 else None
+                self.eri = read_integrals("integrals/eri") if version > 1 else None
 
                 # 1 and 2 electron integrals in MO basis
-                self.mo_onee_ints = read_array("integrals/mo_onee_ints")
-                self.mo_onee_ints_B = read_array("integrals/mo_onee_ints_B") if version > 1 else None
-                self.mo_eri_ints = read_array("integrals/mo_eri_ints")
-                self.mo_eri_ints_BB = read_array("integrals/mo_eri_ints_BB") if version > 1 else None
-                self.mo_eri_ints_BA = read_array("integrals/mo_eri_ints_BA") if version > 1 else None
+                self.mo_onee_ints = read_integrals("integrals/mo_onee_ints")
+                self.mo_onee_ints_B = read_integrals("integrals/mo_onee_ints_B") if version > 1 else None
+                self.mo_eri_ints = read_integrals("integrals/mo_eri_ints")
+                self.mo_eri_ints_BB = read_integrals("integrals/mo_eri_ints_BB") if version > 1 else None
+                self.mo_eri_ints_BA = read_integrals("integrals/mo_eri_ints_BA") if version > 1 else None
 
                 # dipole integrals in AO basis
-                self.x_dip_ints = read_array("dipole/x_dip_ints") if version > 1 else None
-                self.y_dip_ints = read_array("dipole/y_dip_ints") if version > 1 else None
-                self.z_dip_ints = read_array("dipole/z_dip_ints") if version > 1 else None
+                self.x_dip_ints = read_integrals("dipole/x_dip_ints") if version > 1 else None
+                self.y_dip_ints = read_integrals("dipole/y_dip_ints") if version > 1 else None
+                self.z_dip_ints = read_integrals("dipole/z_dip_ints") if version > 1 else None
 
                 # dipole integrals in MO basis
-                self.x_dip_mo_ints = read_array("dipole/x_dip_mo_ints")
-                self.x_dip_mo_ints_B = read_array("dipole/x_dip_mo_ints_B") if version > 1 else None
-                self.y_dip_mo_ints = read_array("dipole/y_dip_mo_ints")
-                self.y_dip_mo_ints_B = read_array("dipole/y_dip_mo_ints_B") if version > 1 else None
-                self.z_dip_mo_ints = read_array("dipole/z_dip_mo_ints")
-                self.z_dip_mo_ints_B = read_array("dipole/z_dip_mo_ints_B") if version > 1 else None
+                self.x_dip_mo_ints = read_integrals("dipole/x_dip_mo_ints")
+                self.x_dip_mo_ints_B = read_integrals("dipole/x_dip_mo_ints_B") if version > 1 else None
+                self.y_dip_mo_ints = read_integrals("dipole/y_dip_mo_ints")
+                self.y_dip_mo_ints_B = read_integrals("dipole/y_dip_mo_ints_B") if version > 1 else None
+                self.z_dip_mo_ints = read_integrals("dipole/z_dip_mo_ints")
+                self.z_dip_mo_ints_B = read_integrals("dipole/z_dip_mo_ints_B") if version > 1 else None
                 self.nuclear_dipole_moment = f["dipole/nuclear_dipole_moment"][...]
                 self.reverse_dipole_sign = f["dipole/reverse_dipole_sign"][...]
 
         except OSError:
             pass
 
-    def save(self, file_name=None):
-        """Saves the info from the driver."""
+    def save(self, file_name=None, chunked=False, compression=None):
+        """
+        Saves the info from the driver.
+
+        Args:
+            file_name (str): file name, defaults to the file of the molecule
+            chunked (bool): if True, the arrays of two or more dimensions are written in chunks,
+                            such that slices of them are read without reading the whole arrays
+            compression (str): h5py compression filter of the chunked arrays, e.g. 'gzip'
+        """
+        # the arrays of a lazy load are read before their file may be replaced
+        for name in QMolecule._DATASET_GROUPS:
+            getattr(self, name)
+
         file = None
         if file_name is not None:
             self.remove_file(file_name)
@@ -257,7 +368,10 @@ class QMolecule(object):
 
         with h5py.File(file, "w") as f:
             def create_dataset(group, name, value):
-                group.create_dataset(name, data=(value if value is not None else False))
+                if chunked and isinstance(value, numpy.ndarray) and value.ndim > 1:
+                    group.create_dataset(name, data=value, chunks=True, compression=compression)
+                else:
+                    group.create_dataset(name, data=(value if value is not None else False))
 
             f.create_dataset("version", data=(self.QMOLECULE_VERSION,))
 
@@ -29,7 +29,7 @@ from qiskit.aqua.components.uncertainty_problems import EuropeanCallExpectedValu
 from qiskit.aqua.components.uncertainty_problems import UnivariatePiecewiseLinearObjective as PwlObjective
 from qiskit.aqua.components.uncertainty_problems import MultivariateProblem
 from qiskit.aqua.circuits import WeightedSumOperator
-from qiskit.aqua.algorithms import AmplitudeEstimation
+from qiskit.aqua.algorithms import AmplitudeEstimation, MaximumLikelihoodAmplitudeEstimation
 
 
 class TestEuropeanCallOption(QiskitAquaTestCase):
@@ -270,5 +270,43 @@ class TestCreditRiskAnalysis(QiskitAquaTestCase):
         self.assertEqual(0.0, np.round(normalized_value - 3.3796, decimals=4))
 
 
+class TestMaximumLikelihoodAmplitudeEstimation(QiskitAquaTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        # log-normal distribution of the spot price, as in TestEuropeanCallOption
+        mu = (0.05 - 0.5 * 0.4 ** 2) * 40 / 365 + np.log(2.0)
+        sigma = 0.4 * np.sqrt(40 / 365)
+        mean = np.exp(mu + sigma ** 2 / 2)
+        stddev = np.sqrt((np.exp(sigma ** 2) - 1) * np.exp(2 * mu + sigma ** 2))
+        low = np.maximum(0, mean - 3 * stddev)
+        high = mean + 3 * stddev
+        uncertainty_model = LogNormalDistribution(3, mu=mu, sigma=sigma, low=low, high=high)
+        self.european_call = EuropeanCallExpectedValue(uncertainty_model, strike_price=2, c_approx=0.5)
+
+    @parameterized.expand([
+        ['statevector_simulator', 1e-7],
+        ['qasm_simulator', 5e-3]
+    ])
+    def test_expected_value(self, simulator, delta):
+        ae = MaximumLikelihoodAmplitudeEstimation(4, self.european_call)
+        quantum_instance = QuantumInstance(BasicAer.get_backend(simulator), shots=1000,
+                                           seed_simulator=2, seed_transpiler=2)
+        result = ae.run(quantum_instance=quantum_instance)
+
+        # compare to the exact amplitude, which lies between the grid points of AmplitudeEstimation(3)
+        self.assertAlmostEqual(result['value'], 0.26770808, delta=delta)
+        self.assertAlmostEqual(result['estimation'], self.european_call.value_to_estimation(result['value']))
+        np.testing.assert_array_equal(result['evaluation_schedule'], [0, 1, 2, 4])
+
+    def test_likelihood(self):
+        ae = MaximumLikelihoodAmplitudeEstimation(3, self.european_call)
+        theta = 0.3
+        shots = np.asarray([1000, 1000, 1000])
+        good_counts = np.round(shots * np.sin((2 * ae.evaluation_schedule + 1) * theta) ** 2)
+        self.assertAlmostEqual(ae._compute_mle(good_counts, shots), theta, places=3)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import unittest
+
+from test.aqua.common import QiskitAquaTestCase
+
+from unittest.mock import patch
+
+import numpy as np
+
+from qiskit import QuantumRegister, QuantumCircuit, BasicAer, execute
+from qiskit.aqua.circuits import LinearYRotation
+from qiskit.aqua.utils import CachedCircuitFactory
+from qiskit.aqua.algorithms import AmplitudeEstimation
+
+
+class TestCachedCircuitFactory(QiskitAquaTestCase):
+
+    def _build_controlled_powers(self, factory):
+        q = QuantumRegister(factory.num_target_qubits, name='q')
+        a = QuantumRegister(3, name='a')
+        qc = QuantumCircuit(q, a)
+        for i in range(len(a)):
+            factory.build_controlled_power(qc, q, a[i], 2 ** i)
+        return qc
+
+    def test_controlled_powers(self):
+        factory = LinearYRotation(0.3, 0.2, 2)
+        cached_factory = CachedCircuitFactory(factory)
+
+        qc = self._build_controlled_powers(factory)
+        qc_cached = self._build_controlled_powers(cached_factory)
+        self.assertEqual(qc.count_ops(), qc_cached.count_ops())
+
+        backend = BasicAer.get_backend('unitary_simulator')
+        unitary = execute(qc, backend).result().get_unitary(qc)
+        unitary_cached = execute(qc_cached, backend).result().get_unitary(qc_cached)
+        np.testing.assert_array_almost_equal(unitary_cached, unitary)
+
+    def test_controlled_power_cache_hit(self):
+        factory = LinearYRotation(0.3, 0.2, 2)
+        cached_factory = CachedCircuitFactory(factory)
+        qc = self._build_controlled_powers(cached_factory)
+        num_cached = len(cached_factory._controlled_power_cache)
+        qc_repeated = self._build_controlled_powers(cached_factory)
+        self.assertEqual(num_cached, len(cached_factory._controlled_power_cache))
+        self.assertEqual(qc.count_ops(), qc_repeated.count_ops())
+
+    def test_construct_circuit_reuses_cache(self):
+        ae = AmplitudeEstimation(3, LinearYRotation(0.3, 0.2, 1))
+        q_factory = ae.q_factory
+        with patch.object(q_factory, 'build_controlled', wraps=q_factory.build_controlled) as build_controlled:
+            ae.construct_circuit()
+            # the powers 2 and 4 are derived from the single controlled Q
+            self.assertEqual(build_controlled.call_count, 1)
+            ae.construct_circuit(measurement=True)
+            self.assertEqual(build_controlled.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,15 +12,21 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import os
 import datetime
-import numpy as np
+import tempfile
 import warnings
+from unittest.mock import patch
+import numpy as np
+import fastdtw
+from qiskit.tools import parallel_map
 from qiskit.aqua.translators.data_providers import (RandomDataProvider,
                                                     QiskitFinanceError,
                                                     WikipediaDataProvider,
                                                     StockMarket,
                                                     DataOnDemandProvider,
                                                     ExchangeDataProvider)
+from qiskit.aqua.translators.data_providers import _base_data_provider
 from test.aqua.common import QiskitAquaTestCase
 
 
@@ -65,6 +71,49 @@ class TestDataProviders(QiskitAquaTestCase):
         np.testing.assert_array_almost_equal(rnd.get_covariance_matrix(), covariance, decimal=3)
         np.testing.assert_array_almost_equal(rnd.get_similarity_matrix(), similarity, decimal=3)
 
+    def test_similarity_matrix_cache(self):
+        rnd = RandomDataProvider(tickers=['TICKER1', 'TICKER2', 'TICKER3'], seed=1)
+        rnd.run()
+        expected = np.eye(3)
+        for ii in range(3):
+            for jj in range(ii + 1, 3):
+                distance, _ = fastdtw.fastdtw(rnd._data[ii], rnd._data[jj])
+                expected[ii, jj] = expected[jj, ii] = 1.0 / distance
+        np.testing.assert_array_almost_equal(rnd.get_similarity_matrix(), expected)
+        # a ticker is added: only the distances to the new series are computed
+        rnd._data.append(list(np.asarray(rnd._data[0]) + 1.0))
+        rnd._n = 4
+        with patch.object(_base_data_provider, 'parallel_map', wraps=parallel_map) as dtw_map:
+            similarity = rnd.get_similarity_matrix()
+            self.assertEqual(sum(len(chunk) for chunk in dtw_map.call_args[0][1]), 3)
+        np.testing.assert_array_almost_equal(similarity[:3, :3], expected)
+        distance, _ = fastdtw.fastdtw(rnd._data[0], rnd._data[3])
+        self.assertAlmostEqual(similarity[0, 3], 1.0 / distance)
+        with patch.object(_base_data_provider, 'parallel_map', wraps=parallel_map) as dtw_map:
+            np.testing.assert_array_almost_equal(rnd.get_similarity_matrix(), similarity)
+            dtw_map.assert_not_called()
+
+    def test_save_load_data(self):
+        rnd = RandomDataProvider(tickers=['TICKER1', 'TICKER2', 'TICKER3'], seed=1)
+        rnd.run()
+        mean = rnd.get_mean_vector()
+        mean[0] = 0.
+        np.testing.assert_array_equal(rnd.get_mean_vector(), np.mean(rnd._data, axis=1))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, 'random.npy')
+            rnd.save_data(file)
+            stored = RandomDataProvider(tickers=['TICKER1', 'TICKER2', 'TICKER3'])
+            stored.load_data(file)
+            self.assertIsInstance(stored._data, np.memmap)
+            np.testing.assert_array_almost_equal(stored.get_mean_vector(), rnd.get_mean_vector())
+            np.testing.assert_array_almost_equal(stored.get_covariance_matrix(), rnd.get_covariance_matrix())
+            np.testing.assert_array_almost_equal(stored.get_period_return_mean_vector(),
+                                                 rnd.get_period_return_mean_vector())
+            np.testing.assert_array_almost_equal(stored.get_period_return_covariance_matrix(),
+                                                 rnd.get_period_return_covariance_matrix())
+            np.testing.assert_array_almost_equal(stored.get_similarity_matrix(), rnd.get_similarity_matrix())
+            del stored
+
     def test_wikipedia(self):
         wiki = WikipediaDataProvider(
             token="",
@@ -20,6 +20,7 @@ from qiskit import QuantumRegister, QuantumCircuit
 from qiskit import BasicAer
 from qiskit import execute as q_execute
 from qiskit.quantum_info import state_fidelity
+from scipy import linalg as scila
 
 from test.aqua.common import QiskitAquaTestCase
 from qiskit.aqua import Operator
@@ -122,6 +123,52 @@ class TestEvolution(QiskitAquaTestCase):
                     'The fidelity between matrix and circuit: {}'.format(f_mc))
                 self.assertAlmostEqual(f_mc, 1)
 
+    def test_evolution_matrix_mode_state_only(self):
+        num_qubits = 3
+        temp = np.random.random((2 ** num_qubits, 2 ** num_qubits))
+        qubit_op = Operator(matrix=temp + temp.T)
+        pauli_list = qubit_op.get_flat_pauli_list()
+        state_in = Custom(num_qubits, state='random').construct_circuit('vector')
+
+        evo_time = 1
+        num_time_slices = 2
+        lam = -1.j * evo_time / num_time_slices
+        for expansion_mode, expansion_order in [('trotter', 1), ('suzuki', 1), ('suzuki', 2)]:
+            if expansion_mode == 'trotter':
+                approx_matrix_slice = np.eye(2 ** num_qubits)
+                for c, p in pauli_list:
+                    approx_matrix_slice = approx_matrix_slice @ scila.expm(lam * c * p.to_matrix())
+            else:
+                approx_matrix_slice = Operator._suzuki_expansion_slice_matrix(
+                    pauli_list, lam, expansion_order).toarray()
+            state_out_reference = np.linalg.matrix_power(approx_matrix_slice, num_time_slices) @ state_in
+
+            state_out = copy.deepcopy(qubit_op).evolve(
+                state_in=state_in,
+                evo_time=evo_time,
+                evo_mode='matrix',
+                num_time_slices=num_time_slices,
+                expansion_mode=expansion_mode,
+                expansion_order=expansion_order
+            )
+            np.testing.assert_array_almost_equal(state_out, state_out_reference)
+
+    def test_controlled_evolution_circuits(self):
+        temp = np.random.random((4, 4))
+        qubit_op = Operator(matrix=temp + temp.T)
+        slice_pauli_list = qubit_op.get_flat_pauli_list()
+        q = QuantumRegister(qubit_op.num_qubits, name='q')
+        a = QuantumRegister(3, name='a')
+        qcs = Operator.construct_controlled_evolution_circuits(slice_pauli_list, -1.5, 2, q, a)
+        self.assertEqual(len(qcs), 3)
+        for ctl_idx, qc in enumerate(qcs):
+            qc_reference = Operator.construct_evolution_circuit(slice_pauli_list, -1.5, 2, q, a, ctl_idx=ctl_idx)
+            self.assertEqual(len(qc.data), len(qc_reference.data))
+            for (inst, qargs, _), (inst_ref, qargs_ref, _) in zip(qc.data, qc_reference.data):
+                self.assertEqual(inst.name, inst_ref.name)
+                self.assertEqual(qargs, qargs_ref)
+                np.testing.assert_array_almost_equal(inst.params, inst_ref.params)
+
 
 if __name__ == '__main__':
     unittest.main()
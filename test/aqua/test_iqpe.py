@@ -64,8 +64,9 @@ class TestIQPE(QiskitAquaTestCase):
         [qubitOp_simple, 'qasm_simulator'],
         [qubitOp_zz, 'statevector_simulator'],
         [qubitOp_h2_with_2_qubit_reduction, 'statevector_simulator'],
+        [qubitOp_h2_with_2_qubit_reduction, 'qasm_simulator', True],
     ])
-    def test_iqpe(self, qubitOp, simulator):
+    def test_iqpe(self, qubitOp, simulator, speculative_execution=False):
         self.algorithm = 'IQPE'
         self.log.debug('Testing IQPE')
 
@@ -96,7 +97,8 @@ class TestIQPE(QiskitAquaTestCase):
         num_iterations = 6
         state_in = Custom(self.qubitOp.num_qubits, state_vector=self.ref_eigenvec)
         iqpe = IQPE(self.qubitOp, state_in, num_time_slices, num_iterations,
-                    expansion_mode='suzuki', expansion_order=2, shallow_circuit_concat=True)
+                    expansion_mode='suzuki', expansion_order=2, shallow_circuit_concat=True,
+                    speculative_execution=speculative_execution)
 
         backend = BasicAer.get_backend(simulator)
         quantum_instance = QuantumInstance(backend, shots=100, pass_manager=PassManager())
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import unittest
+
+import numpy as np
+from qiskit.quantum_info import Pauli
+
+from test.aqua.common import QiskitAquaTestCase
+from qiskit.aqua import AquaError, Operator
+from qiskit.aqua.translators.ising import max_cut
+from qiskit.aqua.translators.ising.ising_model import IsingModel, sample_most_likely
+
+
+class TestIsingModel(QiskitAquaTestCase):
+    """Ising model tests."""
+
+    def setUp(self):
+        super().setUp()
+        self.w = max_cut.random_graph(5, seed=123)
+        self.qubit_op, self.offset = max_cut.get_max_cut_qubitops(self.w)
+        self.qubit_op += Operator(paulis=[[0.5, Pauli.from_label('IIIII')], [-0.25, Pauli.from_label('IIZII')]])
+        self.model = IsingModel.from_operator(self.qubit_op)
+
+    def test_diagonal(self):
+        expected = np.sum([coeff * pauli.to_spmatrix().diagonal() for coeff, pauli in self.qubit_op.paulis], axis=0)
+        np.testing.assert_array_almost_equal(self.model.to_diagonal(), expected)
+        self.qubit_op._to_dia_matrix('paulis')
+        np.testing.assert_array_almost_equal(self.qubit_op.matrix, expected)
+        operator, offset = self.model.to_operator()
+        operator._to_dia_matrix('paulis')
+        np.testing.assert_array_almost_equal(operator.matrix + offset, expected)
+
+    def test_evaluate(self):
+        x = np.random.randint(2, size=(10, 5))
+        objectives = [max_cut.max_cut_value(xi, self.w) for xi in x]
+        np.testing.assert_array_almost_equal(-(self.model.evaluate(x) - 0.5 + 0.25 * (1 - 2 * x[:, 2])) - self.offset,
+                                             objectives)
+
+    def test_evaluate_counts(self):
+        counts = {'00110': 10, '10101': 30, '11111': 60}
+        diagonal = self.model.to_diagonal()
+        energies = np.asarray([diagonal[0b00110], diagonal[0b10101], diagonal[0b11111]])
+        mean, std = self.model.evaluate_counts(counts)
+        self.assertAlmostEqual(mean, energies @ [0.1, 0.3, 0.6])
+        self.assertAlmostEqual(std, np.sqrt((energies - mean) ** 2 @ [0.1, 0.3, 0.6] / 100))
+
+    def test_sample_most_likely(self):
+        np.testing.assert_array_equal(sample_most_likely({'00110': 10, '10101': 30, '11111': 20}), [1, 0, 1, 0, 1])
+        np.testing.assert_array_equal(sample_most_likely(np.eye(32)[0b00110]), [0, 1, 1, 0, 0])
+
+    def test_from_qubo(self):
+        quadratic = np.random.randint(-5, 5, size=(4, 4))
+        linear = np.random.randint(-5, 5, size=4)
+        model = IsingModel.from_qubo(quadratic, linear, 2.5)
+        x = (np.arange(16)[:, np.newaxis] >> np.arange(4)) & 1
+        expected = [2.5 + linear @ xi + xi @ quadratic @ xi for xi in x]
+        np.testing.assert_array_almost_equal(model.to_diagonal(), expected)
+
+    def test_not_ising(self):
+        qubit_op = Operator(paulis=[[1.0, Pauli.from_label('ZZZ')]])
+        self.assertRaises(AquaError, IsingModel.from_operator, qubit_op)
+        qubit_op = Operator(paulis=[[1.0, Pauli.from_label('XZI')]])
+        self.assertRaises(AquaError, IsingModel.from_operator, qubit_op)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,12 +16,14 @@ import unittest
 import time
 
 import numpy as np
-from qiskit.ignis.mitigation.measurement import CompleteMeasFitter
+from qiskit import BasicAer, QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.ignis.mitigation.measurement import CompleteMeasFitter, TensoredMeasFitter
 
 from test.aqua.common import QiskitAquaTestCase
 from qiskit.aqua.components.oracles import LogicalExpressionOracle
 from qiskit.aqua import QuantumInstance, aqua_globals
 from qiskit.aqua.algorithms import Grover
+from qiskit.aqua.utils import TensoredMeasurementFilter
 
 
 class TestMeasurementErrorMitigation(QiskitAquaTestCase):
@@ -141,6 +143,106 @@ class TestMeasurementErrorMitigation(QiskitAquaTestCase):
         self.assertGreater(total_diff, 0.0)
         self.assertGreater(timestamp_2, timestamp_1)
 
+    def test_tensored_measurement_error_mitigation(self):
+        from qiskit import Aer
+        from qiskit.providers.aer import noise
+
+        aqua_globals.random_seed = 0
+
+        # build noise model
+        noise_model = noise.NoiseModel()
+        read_err = noise.errors.readout_error.ReadoutError([[0.9, 0.1], [0.25, 0.75]])
+        noise_model.add_all_qubit_readout_error(read_err)
+
+        backend = Aer.get_backend('qasm_simulator')
+        quantum_instance = QuantumInstance(backend=backend, seed_simulator=167, seed_transpiler=167,
+                                           noise_model=noise_model)
+
+        quantum_instance_with_mitigation = QuantumInstance(backend=backend, seed_simulator=167, seed_transpiler=167,
+                                                           noise_model=noise_model,
+                                                           measurement_error_mitigation_cls=TensoredMeasFitter)
+
+        input = 'a & b & c'
+        oracle = LogicalExpressionOracle(input)
+        grover = Grover(oracle)
+
+        result_wo_mitigation = grover.run(quantum_instance)
+        prob_top_measurement_wo_mitigation = result_wo_mitigation['measurement'][
+            result_wo_mitigation['top_measurement']]
+
+        result_w_mitigation = grover.run(quantum_instance_with_mitigation)
+        prob_top_measurement_w_mitigation = result_w_mitigation['measurement'][result_w_mitigation['top_measurement']]
+
+        self.assertGreaterEqual(prob_top_measurement_w_mitigation, prob_top_measurement_wo_mitigation)
+
+
+class TestTensoredMeasurementFilter(QiskitAquaTestCase):
+    """Test the tensored measurement error mitigation."""
+
+    def setUp(self):
+        super().setUp()
+        # blocks [[0], [2, 1]] of the qubits, read in the bits 0, 1 and 2 of the counts
+        self.qubit_list = [0, 1, 2]
+        self.mit_pattern = [[0], [2, 1]]
+        self.cal_matrices = [np.array([[0.9, 0.25], [0.1, 0.75]]),
+                             np.array([[0.85, 0.1, 0.05, 0.02],
+                                       [0.05, 0.8, 0.02, 0.1],
+                                       [0.06, 0.02, 0.88, 0.08],
+                                       [0.04, 0.08, 0.05, 0.8]])]
+        # full calibration matrix over the bitstrings (b2 b1 b0), with the block state q1 + 2 q2 for [2, 1]
+        permutation = [0, 2, 1, 3]
+        block_matrix = self.cal_matrices[1][np.ix_(permutation, permutation)]
+        self.full_matrix = np.kron(block_matrix, self.cal_matrices[0])
+
+    def test_apply_counts(self):
+        probabilities = np.array([0.5, 0, 0, 0.1, 0, 0, 0, 0.4])
+        noisy = self.full_matrix @ probabilities * 1000
+        counts = {format(i, '03b'): value for i, value in enumerate(noisy)}
+        mitigation_filter = TensoredMeasurementFilter(self.cal_matrices, self.mit_pattern, self.qubit_list)
+        mitigated = mitigation_filter.apply(counts, method='pseudo_inverse')
+        for i, probability in enumerate(probabilities):
+            self.assertAlmostEqual(mitigated.get(format(i, '03b'), 0), probability * 1000, places=4)
+        mitigated = mitigation_filter.apply(counts)
+        self.assertAlmostEqual(sum(mitigated.values()), 1000)
+        self.assertAlmostEqual(mitigated['111'], 400, places=4)
+
+    def test_apply_observed_counts(self):
+        counts = {'000': 480, '001': 70, '011': 10, '111': 440}
+        mitigation_filter = TensoredMeasurementFilter(self.cal_matrices, self.mit_pattern, self.qubit_list)
+        mitigated = mitigation_filter.apply(counts)
+        self.assertTrue(set(mitigated.keys()) <= set(counts.keys()))
+        self.assertTrue(all(value >= 0 for value in mitigated.values()))
+        self.assertAlmostEqual(sum(mitigated.values()), 1000)
+        self.assertGreater(mitigated['111'], counts['111'])
+
+    def test_quantum_instance(self):
+        backend = BasicAer.get_backend('qasm_simulator')
+        quantum_instance = QuantumInstance(backend=backend, seed_simulator=7, seed_transpiler=7,
+                                           measurement_error_mitigation_cls=TensoredMeasFitter,
+                                           measurement_error_mitigation_pattern=[[1, 2]])
+        qr = QuantumRegister(3)
+        cr = ClassicalRegister(3)
+        qc = QuantumCircuit(qr, cr)
+        qc.h(qr[0])
+        qc.cx(qr[0], qr[1])
+        qc.x(qr[2])
+        qc.measure(qr, cr)
+        result = quantum_instance.execute(qc)
+        self.assertEqual(len(result.results), 1)
+        counts = result.get_counts(qc)
+        self.assertSetEqual(set(counts.keys()), {'100', '111'})
+        self.assertAlmostEqual(sum(counts.values()), 1024)
+
+        cal_matrices, timestamp = quantum_instance.cals_matrix(qubit_index=[0, 1, 2])
+        self.assertListEqual([cal_matrix.shape for cal_matrix in cal_matrices], [(4, 4), (2, 2)])
+        # the calibration is noiseless
+        np.testing.assert_array_almost_equal(cal_matrices[0], np.identity(4))
+
+        # the calibration matrices are reused while they are up to date
+        result = quantum_instance.execute(qc)
+        self.assertEqual(quantum_instance.cals_matrix(qubit_index=[0, 1, 2])[1], timestamp)
+        self.assertDictEqual(result.get_counts(qc), counts)
+
 
 if __name__ == '__main__':
     unittest.main()
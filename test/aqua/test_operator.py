@@ -693,6 +693,59 @@ class TestOperator(QiskitAquaTestCase):
                     break
             self.assertTrue(passed, "non-existed paulis in grouped_paulis: {}".format(gp[1].to_label()))
 
+    def test_kernel_F2(self):
+        """ kernel_F2 returns a basis of the null space on the binary field """
+        rng = np.random.RandomState(11)
+        for num_rows, num_cols in [(3, 5), (20, 70), (70, 20), (130, 66)]:
+            matrix = (rng.rand(num_rows, num_cols) < 0.2).astype(int)
+            # duplicate some columns so that the kernel is not trivial
+            matrix[:, -3:] = matrix[:, :3]
+            kernel = Operator.kernel_F2(matrix)
+            self.assertGreaterEqual(len(kernel), 3)
+            for vector in kernel:
+                np.testing.assert_array_equal(matrix @ vector % 2, 0)
+            # the kernel vectors are independent
+            echelon = Operator.row_echelon_F2(np.asarray(kernel))
+            self.assertTrue(np.all(np.any(echelon, axis=1)))
+
+    def test_find_Z2_symmetries(self):
+        """ symmetries commute with the operator and each anticommutes with its single qubit Pauli only """
+        rng = np.random.RandomState(5)
+        labels = [''.join(label) for label in rng.choice(list('IXYZ'), size=(60, 8))]
+        # Z and X on label position 5, and Z, Z and XX on label positions 1 and 2 are symmetries
+        labels = [label[:1] + ('ZZ' if label[1] in 'XY' else 'II') + label[3:5] + 'I' + label[6:]
+                  for label in labels]
+        op = Operator(paulis=[[1.0, Pauli.from_label(label)] for label in labels])
+        symmetries, sq_paulis, cliffords, sq_list = op.find_Z2_symmetries()
+        self.assertEqual(len(symmetries), 5)
+        self.assertEqual(len(sq_paulis), len(symmetries))
+        self.assertEqual(len(sq_list), len(symmetries))
+
+        def commute(pauli_1, pauli_2):
+            return (np.sum(pauli_1.x & pauli_2.z) + np.sum(pauli_1.z & pauli_2.x)) % 2 == 0
+
+        for i, symmetry in enumerate(symmetries):
+            for _, pauli in op.paulis:
+                self.assertTrue(commute(symmetry, pauli))
+            for j, sq_pauli in enumerate(sq_paulis):
+                self.assertEqual(commute(symmetry, sq_pauli), i != j)
+            self.assertEqual(np.flatnonzero(sq_paulis[i].z | sq_paulis[i].x).tolist(), [sq_list[i]])
+
+    def test_multiply_pauli_tables(self):
+        """ products of Pauli tables match Pauli.sgn_prod """
+        labels_1 = [''.join(label) for label in np.random.choice(list('IXYZ'), size=(20, 4))]
+        labels_2 = [''.join(label) for label in np.random.choice(list('IXYZ'), size=(20, 4))]
+        paulis_1 = [Pauli.from_label(label) for label in labels_1]
+        paulis_2 = [Pauli.from_label(label) for label in labels_2]
+        z, x, phases = Operator._multiply_pauli_tables(np.asarray([p.z for p in paulis_1]),
+                                                       np.asarray([p.x for p in paulis_1]),
+                                                       np.asarray([p.z for p in paulis_2]),
+                                                       np.asarray([p.x for p in paulis_2]))
+        for i, (pauli_1, pauli_2) in enumerate(zip(paulis_1, paulis_2)):
+            product, phase = Pauli.sgn_prod(pauli_1, pauli_2)
+            self.assertEqual(Pauli(z[i], x[i]), product)
+            self.assertEqual(phases[i], phase)
+
 
 if __name__ == '__main__':
     unittest.main()
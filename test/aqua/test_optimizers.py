@@ -14,11 +14,12 @@
 
 import unittest
 
-from scipy.optimize import rosen
+from scipy.optimize import rosen, rosen_der
 import numpy as np
+from parameterized import parameterized
 
 from test.aqua.common import QiskitAquaTestCase
-from qiskit.aqua.components.optimizers import (ADAM, CG, COBYLA, L_BFGS_B, NELDER_MEAD,
+from qiskit.aqua.components.optimizers import (Optimizer, ADAM, CG, COBYLA, L_BFGS_B, NELDER_MEAD,
                                                POWELL, SLSQP, SPSA, TNC)
 
 
@@ -81,6 +82,39 @@ class TestOptimizers(QiskitAquaTestCase):
         res = self._optimize(optimizer)
         self.assertLessEqual(res[2], 10000)
 
+    @parameterized.expand([
+        ['forward', 1],
+        ['central', 4],
+        ['central', 10]
+    ])
+    def test_gradient_num_diff(self, method, max_evals_grouped):
+        calls = []
+
+        def grouped_rosen(x):
+            points = np.reshape(x, (-1, 5))
+            calls.append(len(points))
+            values = [rosen(point) for point in points]
+            return values if len(values) > 1 else values[0]
+
+        x0 = np.asarray([1.3, 0.7, 0.8, 1.9, 1.2])
+        grad = Optimizer.gradient_num_diff(x0, grouped_rosen, 1e-6, max_evals_grouped, method)
+        np.testing.assert_array_almost_equal(grad, rosen_der(x0), decimal=2)
+        num_points = 6 if method == 'forward' else 10
+        self.assertEqual(len(calls), int(np.ceil(num_points / max_evals_grouped)))
+
+    def test_gradient_parameter_shift(self):
+        x0 = np.asarray([0.3, -1.2, 2.5])
+
+        def f(x):
+            x = np.reshape(x, (-1, 3))
+            values = np.cos(x[:, 0]) * np.sin(x[:, 1]) + np.cos(x[:, 2])
+            return list(values) if len(values) > 1 else values[0]
+
+        grad = Optimizer.gradient_num_diff(x0, f, None, 6, 'parameter_shift')
+        np.testing.assert_array_almost_equal(
+            grad, [-np.sin(x0[0]) * np.sin(x0[1]), np.cos(x0[0]) * np.cos(x0[1]), -np.sin(x0[2])])
+        self.assertRaises(ValueError, Optimizer.gradient_num_diff, x0, f, 1e-6, 1, 'backward')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from test.aqua.common import QiskitAquaTestCase
+from qiskit.aqua import (PluggableType, refresh_pluggables, local_pluggables_types, local_pluggables,
+                         get_pluggable_class)
+from qiskit.aqua import _discover
+
+
+class TestPluggablesManifest(QiskitAquaTestCase):
+    """Tests the manifest of the local pluggables."""
+
+    def test_manifest_matches_discovery(self):
+        refresh_pluggables()
+        manifest = _discover._load_manifest()
+        for pluggable_type in local_pluggables_types():
+            for pluggable_name in local_pluggables(pluggable_type):
+                cls = get_pluggable_class(pluggable_type, pluggable_name)
+                if cls.__module__.startswith('qiskit.'):
+                    self.assertEqual(manifest[pluggable_type.value][pluggable_name],
+                                     '{}:{}'.format(cls.__module__, cls.__qualname__))
+
+        # the listed pluggables resolve as the discovered ones, or fail as they were not registered
+        for pluggable_type, pluggables in manifest.items():
+            pluggable_type = PluggableType(pluggable_type)
+            for pluggable_name in pluggables:
+                cls = _discover._get_manifest_class(pluggable_type, pluggable_name)
+                if pluggable_name in local_pluggables(pluggable_type):
+                    self.assertIs(cls, get_pluggable_class(pluggable_type, pluggable_name))
+                else:
+                    self.assertIsNone(cls)
+
+    def test_import_aqua(self):
+        # the optional classical solvers are only imported where they are used
+        code = ("import json\n"
+                "import sys\n"
+                "import qiskit\n"
+                "modules = set(sys.modules)\n"
+                "import qiskit.aqua\n"
+                "print(json.dumps(sorted(set(sys.modules) - modules)))\n")
+        imports = json.loads(self._run_python(code).stdout)
+        self.assertFalse([name for name in imports if name.split('.')[0] in ['sklearn', 'cvxopt', 'docplex']])
+        self.assertFalse([name for name in imports if name.startswith('qiskit.chemistry')])
+        self.assertLessEqual(len(imports), 250)
+
+    @unittest.skipIf(sys.version_info < (3, 7), '-X importtime requires Python 3.7')
+    def test_import_budget(self):
+        # the modules imported by resolving a pluggable, after importing Aqua, are listed by -X importtime
+        code = ("import sys\n"
+                "from qiskit.aqua import get_pluggable_class, _discover\n"
+                "sys.stderr.write('resolve\\n')\n"
+                "sys.stderr.flush()\n"
+                "get_pluggable_class('optimizer', 'COBYLA')\n"
+                "assert not _discover._DISCOVERED\n")
+        output = self._run_python(code, '-X', 'importtime').stderr
+        imports = [line.split('|')[-1].strip() for line in output.split('resolve\n', 1)[1].splitlines()
+                   if line.startswith('import time:')]
+        self.assertFalse([name for name in imports if name.startswith('qiskit.chemistry')])
+        self.assertLessEqual(len(imports), 5)
+
+    @staticmethod
+    def _run_python(code, *options):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.environ.get('PYTHONPATH', '')]))
+        return subprocess.run([sys.executable] + list(options) + ['-c', code], env=env, stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,7 +21,7 @@ from qiskit import BasicAer
 from test.aqua.common import QiskitAquaTestCase
 from qiskit.aqua.translators.ising import max_cut
 from qiskit.aqua.components.optimizers import COBYLA
-from qiskit.aqua.algorithms import QAOA
+from qiskit.aqua.algorithms import QAOA, VQE
 from qiskit.aqua import Operator, QuantumInstance
 
 w1 = np.array([
@@ -79,6 +79,35 @@ class TestQAOA(QiskitAquaTestCase):
         if quantum_instance.has_circuit_caching:
             self.assertLess(quantum_instance._circuit_cache.misses, 3)
 
+    @parameterized.expand([
+        ['statevector_simulator', 7],
+        ['qasm_simulator', 1],
+    ])
+    def test_qaoa_ising_energy_evaluation(self, backend_name, decimal):
+        qubitOp, _ = max_cut.get_max_cut_qubitops(w2)
+        qaoa = QAOA(qubitOp, COBYLA(), 2, operator_mode='paulis')
+        qaoa._quantum_instance = QuantumInstance(BasicAer.get_backend(backend_name), shots=8192,
+                                                 seed_simulator=7, seed_transpiler=7)
+        qaoa._use_simulator_operator_mode = False
+        parameters = np.asarray([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
+        energies = qaoa._energy_evaluation(parameters)
+        expected = VQE._energy_evaluation(qaoa, parameters)
+        np.testing.assert_array_almost_equal(energies, expected, decimal=decimal)
+
+    def test_qaoa_matrix_operator(self):
+        qubitOp, _ = max_cut.get_max_cut_qubitops(w2)
+        qubitOp.to_matrix()
+        operator = Operator(matrix=np.diag(qubitOp.matrix))
+        qaoa = QAOA(operator, COBYLA(), 1, operator_mode='matrix')
+        # the operator is not converted to Paulis for the Ising model
+        self.assertIsNone(operator.paulis)
+        qaoa._quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        qaoa._use_simulator_operator_mode = False
+        parameters = np.asarray([0.1, 0.2])
+        energy = qaoa._energy_evaluation(parameters)
+        self.assertIsNone(qaoa._ising_model)
+        self.assertAlmostEqual(energy, VQE._energy_evaluation(qaoa, parameters))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -13,9 +13,12 @@
 # that they have been altered from the originals.
 # =============================================================================
 
+from copy import deepcopy
 import unittest
+from unittest.mock import patch
 
 import numpy as np
+from scipy.stats import entropy
 from qiskit import QuantumCircuit, QuantumRegister
 
 from qiskit.aqua.components.uncertainty_models import UniformDistribution, UnivariateVariationalDistribution
@@ -25,6 +28,7 @@ from qiskit.aqua.algorithms.adaptive.qgan.qgan import QGAN
 from qiskit.aqua.input import QGANInput
 from qiskit.aqua import aqua_globals, QuantumInstance, run_algorithm
 from qiskit.aqua.components.initial_states import Custom
+from qiskit.aqua.components.neural_networks.numpy_discriminator import NumpyDiscriminator
 
 from qiskit import BasicAer
 
@@ -118,6 +122,58 @@ class TestQGAN(QiskitAquaTestCase):
         for i, weight_q in enumerate(weights_qasm):
             self.assertAlmostEqual(weight_q, weights_statevector[i], delta=0.1)
 
+    def test_data_histogram(self):
+        data = np.random.lognormal(mean=1, sigma=1, size=(1000, 2))
+        qgan = QGAN(data, [[0., 3.], [0., 4.]], [2, 3], generator=self.qgan.generator)
+        grid_elements = [[x, y] for x in np.linspace(0., 3., 4) for y in np.linspace(0., 4., 8)]
+        np.testing.assert_array_almost_equal(qgan._grid_elements, grid_elements)
+        prob_data = np.asarray([np.sum(np.all(qgan._data == element, axis=1)) for element in grid_elements])
+        prob_data = prob_data / len(qgan._data)
+        prob_data[prob_data == 0] = 1e-10
+        np.testing.assert_array_almost_equal(qgan._prob_data, prob_data)
+
+    def test_rel_entr(self):
+        self.qgan._quantum_instance = self.quantum_instance_statevector
+        samples, prob_gen = self.qgan.generator.get_output(self.quantum_instance_statevector)
+        grid_prob = [np.sum([p for sample, p in zip(samples, prob_gen) if sample[0] == element])
+                     for element in self.qgan._grid_elements]
+        grid_prob = [1e-8 if p == 0 else p for p in grid_prob]
+        self.assertAlmostEqual(self.qgan.get_rel_entr(), entropy(grid_prob, self.qgan._prob_data))
+
+    def test_generator_output_cache(self):
+        generator = self.qgan.generator
+        quantum_instance = self.quantum_instance_statevector
+        params = np.asarray(generator.generator_circuit.params)
+        samples, weights = generator.get_output(quantum_instance)
+        with patch.object(quantum_instance, 'execute', wraps=quantum_instance.execute) as execute:
+            self.assertEqual(generator.get_output(quantum_instance, params=params), (samples, weights))
+            execute.assert_not_called()
+            generator.get_output(quantum_instance, params=params + 0.1)
+            self.assertEqual(execute.call_count, 1)
+            # a new generator circuit with the same parameters is simulated again
+            generator.generator_circuit = deepcopy(generator.generator_circuit)
+            generator.get_output(quantum_instance, params=params)
+            self.assertEqual(execute.call_count, 2)
+        # sampled outputs are not cached
+        quantum_instance = self.quantum_instance_qasm
+        with patch.object(quantum_instance, 'execute', wraps=quantum_instance.execute) as execute:
+            generator.get_output(quantum_instance)
+            generator.get_output(quantum_instance)
+            self.assertEqual(execute.call_count, 2)
+
+    def test_numpy_discriminator_gradient(self):
+        discriminator = NumpyDiscriminator(n_features=1)
+        data = [np.random.rand(50, 1), np.random.rand(4, 1)]
+        weights = [np.ones(50) / 50, np.asarray([0.1, 0.2, 0.3, 0.4])]
+        forward = discriminator._get_forward_function(data)
+        objective = discriminator._get_objective_function(data, weights, forward)
+        gradient = discriminator._get_gradient_function(data, weights, forward)
+        params = np.array(discriminator.get_discriminator().parameters)
+        direction = np.random.rand(len(params))
+        derivative = (objective(params + 1e-6 * direction) - objective(params - 1e-6 * direction)) / 2e-6
+        # the gradient is the one of the sum of the real and generated data losses
+        self.assertAlmostEqual(gradient(params) @ direction, 2 * derivative, places=5)
+
     def test_qgan_training(self):
         trained_statevector = self.qgan.run(self.quantum_instance_statevector)
         trained_qasm = self.qgan.run(self.quantum_instance_qasm)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from test.aqua.common import QiskitAquaTestCase
+from qiskit.aqua.utils import optimize_svm
+
+
+class TestQPSolver(QiskitAquaTestCase):
+    """Tests the SVM quadratic programming solvers."""
+
+    def setUp(self):
+        super().setUp()
+        np.random.seed(50)
+        x = np.random.randn(60, 2)
+        self.y = np.where(x[:, 0] + 0.3 * x[:, 1] > 0, 1., -1.)
+        self.kernel_matrix = np.exp(-np.sum((x[:, np.newaxis] - x[np.newaxis]) ** 2, axis=2))
+
+    def _objective(self, alpha):
+        return 0.5 * (alpha * self.y) @ self.kernel_matrix @ (alpha * self.y) - np.sum(alpha)
+
+    def test_smo(self):
+        alpha, bias, support = optimize_svm(self.kernel_matrix, self.y)
+        alpha_smo, bias_smo, support_smo = optimize_svm(self.kernel_matrix, self.y, solver='smo')
+        self.assertTrue(np.all(alpha_smo >= 0))
+        self.assertAlmostEqual(alpha_smo @ self.y, 0)
+        self.assertAlmostEqual(self._objective(alpha_smo), self._objective(alpha), delta=1e-3)
+        np.testing.assert_array_equal(support_smo, support)
+        np.testing.assert_array_almost_equal(bias_smo, bias, decimal=2)
+
+    def test_smo_memmap_warm_start(self):
+        alpha, bias, _ = optimize_svm(self.kernel_matrix, self.y, solver='smo')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, 'kernel.npy')
+            np.save(file, self.kernel_matrix)
+            kernel_matrix = np.load(file, mmap_mode='r')
+            alpha_warm, bias_warm, _ = optimize_svm(kernel_matrix, self.y, solver='smo', max_iters=0,
+                                                    initial_alpha=alpha)
+            del kernel_matrix
+        np.testing.assert_array_almost_equal(alpha_warm, alpha)
+        np.testing.assert_array_almost_equal(bias_warm, bias)
+
+    def test_unknown_solver(self):
+        self.assertRaises(ValueError, optimize_svm, self.kernel_matrix, self.y, solver='newton')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,15 +13,20 @@
 # that they have been altered from the originals.
 
 import os
+from unittest.mock import patch
 
 import numpy as np
 from qiskit import BasicAer
 
 from test.aqua.common import QiskitAquaTestCase
-from qiskit.aqua import run_algorithm, QuantumInstance, aqua_globals
+from qiskit.aqua import run_algorithm, QuantumInstance, aqua_globals, AquaError
 from qiskit.aqua.input import ClassificationInput
 from qiskit.aqua.components.feature_maps import SecondOrderExpansion
 from qiskit.aqua.algorithms import QSVM
+from qiskit.aqua.utils import optimize_svm
+from qiskit.aqua.algorithms.many_sample.qsvm._qsvm_estimator import _QSVM_Estimator
+from qiskit.aqua.components.multiclass_extensions.all_pairs import AllPairs
+from qiskit.aqua.components.multiclass_extensions.one_against_rest import OneAgainstRest
 
 
 class TestQSVM(QiskitAquaTestCase):
@@ -306,3 +311,63 @@ class TestQSVM(QiskitAquaTestCase):
         self.assertAlmostEqual(result['testing_accuracy'], 0.444444444, places=4)
         self.assertEqual(result['predicted_classes'], ['A', 'A', 'C', 'A',
                                                        'A', 'A', 'A', 'C', 'C'])
+
+    def test_qsvm_multiclass_share_kernel(self):
+
+        backend = BasicAer.get_backend('statevector_simulator')
+        training_input = {'A': np.asarray([[0.6560706, 0.17605998], [0.25776033, 0.47628296],
+                                           [0.8690704, 0.70847635]]),
+                          'B': np.asarray([[0.38857596, -0.33775802], [0.49946978, -0.48727951],
+                                           [0.49156185, -0.3660534]]),
+                          'C': np.asarray([[-0.68088231, 0.46824423], [-0.56167659, 0.65270294],
+                                           [-0.82139073, 0.29941512]])}
+
+        test_input = {'A': np.asarray([[0.57483139, 0.47120732], [0.48372348, 0.25438544],
+                                       [0.48142649, 0.15931707]]),
+                      'B': np.asarray([[-0.06048935, -0.48345293], [-0.01065613, -0.33910828],
+                                       [0.06183066, -0.53376975]]),
+                      'C': np.asarray([[-0.74561108, 0.27047295], [-0.69942965, 0.11885162],
+                                       [-0.66489165, 0.1181712]])}
+
+        total_array = np.concatenate((test_input['A'], test_input['B'], test_input['C']))
+
+        for multiclass_extension_cls in [AllPairs, OneAgainstRest]:
+            results = []
+            for share_kernel in [False, True]:
+                feature_map = SecondOrderExpansion(feature_dimension=2, depth=2, entangler_map=[[0, 1]])
+                multiclass_extension = multiclass_extension_cls(_QSVM_Estimator, [feature_map])
+                svm = QSVM(feature_map, training_input, test_input, total_array,
+                           multiclass_extension=multiclass_extension, share_kernel=share_kernel)
+                quantum_instance = QuantumInstance(backend, seed_transpiler=self.random_seed,
+                                                   seed_simulator=self.random_seed)
+                with patch.object(QSVM, 'get_kernel_matrix', wraps=QSVM.get_kernel_matrix) as get_kernel_matrix:
+                    results.append(svm.run(quantum_instance))
+                    if share_kernel:
+                        # the training kernel, then the kernels of the test points and the datapoints
+                        self.assertEqual(get_kernel_matrix.call_count, 3)
+            self.assertAlmostEqual(results[0]['testing_accuracy'], results[1]['testing_accuracy'])
+            self.assertEqual(results[0]['predicted_classes'], results[1]['predicted_classes'])
+
+    def test_qsvm_binary_smo(self):
+        backend = BasicAer.get_backend('statevector_simulator')
+        quantum_instance = QuantumInstance(backend, seed_transpiler=self.random_seed)
+        feature_map = SecondOrderExpansion(feature_dimension=2, depth=2, entangler_map=[[0, 1]])
+        result = QSVM(feature_map, self.training_data, self.testing_data).run(quantum_instance)
+        result_smo = QSVM(feature_map, self.training_data, self.testing_data, solver='smo').run(quantum_instance)
+        np.testing.assert_array_almost_equal(result_smo['svm']['alphas'], result['svm']['alphas'], decimal=2)
+        self.assertEqual(result_smo['testing_accuracy'], result['testing_accuracy'])
+
+        # warm started from the alphas of the previous training, all the points being support vectors
+        self.assertEqual(len(result_smo['svm']['alphas']), 4)
+        svm = QSVM(feature_map, self.training_data, self.testing_data, solver='smo',
+                   initial_alpha=result_smo['svm']['alphas'])
+        with patch('qiskit.aqua.algorithms.many_sample.qsvm._qsvm_binary.optimize_svm',
+                   wraps=optimize_svm) as optimize:
+            result_warm = svm.run(quantum_instance)
+        self.assertEqual(optimize.call_args[1]['solver'], 'smo')
+        np.testing.assert_array_equal(optimize.call_args[1]['initial_alpha'], result_smo['svm']['alphas'])
+        np.testing.assert_array_almost_equal(result_warm['svm']['alphas'], result_smo['svm']['alphas'])
+
+        multiclass_extension = AllPairs(_QSVM_Estimator, [feature_map])
+        self.assertRaises(AquaError, QSVM, feature_map, self.training_data, self.testing_data,
+                          multiclass_extension=multiclass_extension, initial_alpha=result_smo['svm']['alphas'])
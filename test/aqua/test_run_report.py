@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import json
+import os
+import tempfile
+import unittest
+
+from qiskit import BasicAer, QuantumCircuit, QuantumRegister, ClassicalRegister
+
+from test.aqua.common import QiskitAquaTestCase
+from qiskit.aqua import QuantumInstance
+from qiskit.aqua.utils import RunReport
+
+
+class TestRunReport(QiskitAquaTestCase):
+    """Test the per-stage report of the executions."""
+
+    def setUp(self):
+        super().setUp()
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        self.circuit = QuantumCircuit(qr, cr)
+        self.circuit.h(qr[0])
+        self.circuit.cx(qr[0], qr[1])
+        self.circuit.measure(qr, cr)
+
+    def test_execute(self):
+        records = []
+        quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'), shots=100,
+                                           seed_simulator=7, seed_transpiler=7)
+        run_report = quantum_instance.enable_run_report(callback=records.append)
+        for _ in range(3):
+            quantum_instance.execute(self.circuit)
+
+        self.assertListEqual(records, run_report.records)
+        summary = run_report.summary()
+        for stage in ['transpile', 'assemble', 'circuit_cache', 'submit', 'run', 'combine_results']:
+            self.assertIn(stage, summary['stages'])
+        self.assertEqual(summary['stages']['execute']['count'], 3)
+        self.assertEqual(summary['stages']['run']['count'], 3)
+        # every execution looks up the cache
+        cache = summary['circuit_cache']
+        self.assertEqual(cache['hits'] + cache['misses'], 3)
+        self.assertAlmostEqual(cache['hit_rate'], cache['hits'] / 3)
+        self.assertEqual(summary['circuits']['max_width'], 4)
+        self.assertEqual(summary['circuits']['count'], 3)
+
+        # a stage ends after the stages it contains
+        execute = [record for record in records if record['name'] == 'execute'][0]
+        run = [record for record in records if record['name'] == 'run'][0]
+        self.assertLessEqual(execute['start'], run['start'])
+        self.assertGreaterEqual(execute['start'] + execute['duration'], run['start'] + run['duration'])
+
+    def test_export(self):
+        quantum_instance = QuantumInstance(BasicAer.get_backend('qasm_simulator'), shots=100,
+                                           circuit_caching=False)
+        quantum_instance.run_report = RunReport()
+        quantum_instance.execute(self.circuit)
+        with quantum_instance.run_report.stage('postprocessing', label='test'):
+            pass
+
+        fd, file_name = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            quantum_instance.run_report.save_chrome_trace(file_name)
+            with open(file_name) as f:
+                trace = json.load(f)
+            names = [event['name'] for event in trace['traceEvents']]
+            self.assertEqual(names[-1], 'postprocessing')
+            self.assertDictEqual(trace['traceEvents'][-1]['args'], {'label': 'test'})
+            self.assertTrue(all(event['ph'] == 'X' for event in trace['traceEvents']))
+
+            quantum_instance.run_report.save_json(file_name)
+            with open(file_name) as f:
+                report = json.load(f)
+            self.assertIsNone(report['summary']['circuit_cache']['hit_rate'])
+            self.assertEqual(len(report['records']), len(names))
+        finally:
+            os.remove(file_name)
+
+        quantum_instance.run_report.reset()
+        self.assertListEqual(quantum_instance.run_report.records, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from test.aqua.common import QiskitAquaTestCase
+from qiskit.aqua.utils import get_subsystem_density_matrix, get_subsystem_probabilities
+
+
+class TestSubsystem(QiskitAquaTestCase):
+    """Subsystem utilities tests."""
+
+    @parameterized.expand([
+        [[0]],
+        [[1, 3]],
+        [range(2, 5)]
+    ])
+    def test_subsystem_probabilities(self, trace_systems):
+        num_qubits = 5
+        statevector = np.random.random(2 ** num_qubits) + 1j * np.random.random(2 ** num_qubits)
+        statevector /= np.linalg.norm(statevector)
+        expected = np.real(np.diag(get_subsystem_density_matrix(statevector, trace_systems)))
+        probabilities = get_subsystem_probabilities(statevector, trace_systems)
+        np.testing.assert_array_almost_equal(probabilities, expected)
+        self.assertAlmostEqual(np.sum(probabilities), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
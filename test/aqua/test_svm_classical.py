@@ -106,6 +106,11 @@ class TestSVMClassical(QiskitAquaTestCase):
                          ['A', 'A', 'A', 'A', 'A', 'A', 'A', 'A', 'A', 'A',
                           'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B'])
 
+        params['algorithm']['solver'] = 'smo'
+        result_smo = run_algorithm(params, algo_input)
+        self.assertEqual(result_smo['predicted_classes'], result['predicted_classes'])
+        np.testing.assert_array_almost_equal(result_smo['svm']['bias'], result['svm']['bias'], decimal=2)
+
     def test_classical_multiclass_one_against_all(self):
         training_input = {'A': np.asarray([[0.6560706, 0.17605998],
                                            [0.25776033, 0.47628296],
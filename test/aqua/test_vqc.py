@@ -27,6 +27,7 @@ from qiskit import BasicAer
 from qiskit.aqua.input import ClassificationInput
 from qiskit.aqua import run_algorithm, QuantumInstance, aqua_globals
 from qiskit.aqua.algorithms import VQC
+from qiskit.aqua.algorithms.adaptive.vqc.vqc import assign_label, get_label_table
 from qiskit.aqua.components.optimizers import SPSA, COBYLA
 from qiskit.aqua.components.feature_maps import SecondOrderExpansion
 from qiskit.aqua.components.variational_forms import RYRZ, RY
@@ -53,6 +54,14 @@ class TestVQC(QiskitAquaTestCase):
 
         self.svm_input = ClassificationInput(self.training_data, self.testing_data)
 
+    def test_label_table(self):
+        for num_qubits in range(1, 6):
+            for num_classes in range(2, min(5, 2 ** num_qubits) + 1):
+                expected = [assign_label(format(i, '0{}b'.format(num_qubits)), num_classes)
+                            for i in range(2 ** num_qubits)]
+                np.testing.assert_array_equal(get_label_table(num_qubits, num_classes), expected)
+        self.assertFalse(get_label_table(3, 2).flags.writeable)
+
     def test_vqc_via_run_algorithm(self):
         params = {
             'problem': {'name': 'classification', 'random_seed': self.random_seed},
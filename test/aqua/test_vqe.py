@@ -20,11 +20,11 @@ from parameterized import parameterized
 
 from test.aqua.common import QiskitAquaTestCase
 from qiskit import BasicAer
-from qiskit.aqua import Operator, run_algorithm, QuantumInstance, aqua_globals
+from qiskit.aqua import Operator, run_algorithm, QuantumInstance, aqua_globals, AquaError
 from qiskit.aqua.input import EnergyInput
-from qiskit.aqua.components.variational_forms import RY
-from qiskit.aqua.components.optimizers import L_BFGS_B, COBYLA
-from qiskit.aqua.components.initial_states import Zero
+from qiskit.aqua.components.variational_forms import RY, RYRZ, SwapRZ
+from qiskit.aqua.components.optimizers import Optimizer, L_BFGS_B, COBYLA
+from qiskit.aqua.components.initial_states import Zero, Custom
 from qiskit.aqua.algorithms import VQE
 
 
@@ -122,6 +122,50 @@ class TestVQE(QiskitAquaTestCase):
         if quantum_instance.has_circuit_caching:
             self.assertLess(quantum_instance._circuit_cache.misses, 3)
 
+    @parameterized.expand([
+        [RY, -1.85727503],
+        [RYRZ, -1.85727503]
+    ])
+    def test_vqe_parameter_shift_gradient(self, var_form_class, energy):
+        backend = BasicAer.get_backend('statevector_simulator')
+        var_form = var_form_class(self.algo_input.qubit_op.num_qubits, 2)
+        algo = VQE(self.algo_input.qubit_op, var_form, L_BFGS_B(), 'paulis', use_parameter_shift=True)
+        result = algo.run(QuantumInstance(backend))
+        self.assertAlmostEqual(result['energy'], energy)
+        parameters = np.random.uniform(-np.pi, np.pi, var_form.num_parameters)
+        np.testing.assert_array_almost_equal(
+            algo.gradient(parameters),
+            Optimizer.gradient_num_diff(parameters, algo._energy_evaluation, 1e-6, method='central'), 5)
+
+    @parameterized.expand([
+        [1],
+        [3]
+    ])
+    def test_vqe_parameter_shift_initial_state(self, max_evals_grouped):
+        # an excited initial state, from which all the parameters have a non-zero gradient
+        num_qubits = self.algo_input.qubit_op.num_qubits
+        var_form = RY(num_qubits, 1, initial_state=Custom(num_qubits, state_vector=[0, 1, 0, 0]))
+        algo = VQE(self.algo_input.qubit_op, var_form, L_BFGS_B(), 'matrix',
+                   max_evals_grouped=max_evals_grouped, use_parameter_shift=True)
+        algo._quantum_instance = QuantumInstance(BasicAer.get_backend('statevector_simulator'))
+        algo._use_simulator_operator_mode = False
+        parameters = np.linspace(0.1, 0.9, var_form.num_parameters)
+        energies = [algo._energy_evaluation(parameters), algo._energy_evaluation(parameters + 0.3)]
+        np.testing.assert_array_almost_equal(
+            algo._energy_evaluation(np.concatenate([parameters, parameters + 0.3])), energies)
+        np.testing.assert_array_almost_equal(
+            algo.gradient(parameters),
+            Optimizer.gradient_num_diff(parameters, algo._energy_evaluation, 1e-6, method='central'), 5)
+
+    @parameterized.expand([
+        [RY(2, 2, entanglement_gate='crx')],
+        [SwapRZ(2, 2)]
+    ])
+    def test_vqe_parameter_shift_not_supported(self, var_form):
+        self.assertFalse(var_form.support_parameter_shift)
+        self.assertRaises(AquaError, VQE, self.algo_input.qubit_op, var_form, L_BFGS_B(),
+                          'paulis', use_parameter_shift=True)
+
     def test_vqe_callback(self):
 
         tmp_filename = 'vqe_callback_test.csv'
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import glob
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from test.chemistry.common import QiskitChemistryTestCase
+from qiskit.chemistry import QiskitChemistryError, QMolecule
+from qiskit.chemistry.drivers import PySCFDriver, GaussianDriver, UnitsType, QMoleculeCache
+from test.chemistry.test_driver import TestDriver
+
+
+class TestDriverCache(QiskitChemistryTestCase, TestDriver):
+    """Driver cache tests, the common driver tests run on the cached molecule."""
+
+    def setUp(self):
+        super().setUp()
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = QMoleculeCache(self._tmp_dir.name, max_size=2)
+        try:
+            driver = self._get_driver('H .0 .0 .0; H .0 .0 0.735')
+        except QiskitChemistryError:
+            self.skipTest('PYSCF driver does not appear to be installed')
+        driver.run()
+        # white space does not change the configuration
+        self.qmolecule = self._get_driver('H .0 .0 .0;  H .0 .0 0.735').run()
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+        super().tearDown()
+
+    def _get_driver(self, atom):
+        driver = PySCFDriver(atom=atom, unit=UnitsType.ANGSTROM, charge=0, spin=0, basis='sto3g')
+        driver.cache = self.cache
+        return driver
+
+    def test_cache_hits(self):
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(os.path.dirname(self.qmolecule.filename), self.cache.directory)
+
+    def test_cache_eviction(self):
+        self._get_driver('H .0 .0 .0; H .0 .0 0.8').run()
+        self._get_driver('H .0 .0 .0; H .0 .0 0.735').run()
+        self._get_driver('H .0 .0 .0; H .0 .0 0.9').run()
+        self.assertEqual(self.cache.misses, 3)
+        self.assertEqual(self.cache.hits, 2)
+        self.assertEqual(len(glob.glob(os.path.join(self.cache.directory, '*.hdf5'))), 2)
+        # the least recently used molecule, at 0.8, was evicted
+        self._get_driver('H .0 .0 .0; H .0 .0 0.735').run()
+        self._get_driver('H .0 .0 .0; H .0 .0 0.8').run()
+        self.assertEqual(self.cache.misses, 4)
+        self.assertEqual(self.cache.hits, 3)
+
+    def test_cache_key(self):
+        key = self._get_driver('H .0 .0 .0; H .0 .0 0.735')._cache_key()
+        with patch.object(QMolecule, 'QMOLECULE_VERSION', QMolecule.QMOLECULE_VERSION + 1):
+            self.assertNotEqual(self._get_driver('H .0 .0 .0; H .0 .0 0.735')._cache_key(), key)
+        with patch.object(PySCFDriver, '_library_version', return_value='0.0'):
+            self.assertNotEqual(self._get_driver('H .0 .0 .0; H .0 .0 0.735')._cache_key(), key)
+
+        # white space is only normalized within the lines of a Gaussian input
+        with patch.object(GaussianDriver, 'check_driver_valid'):
+            key = GaussianDriver('# rhf/sto-3g\n\nH2\n\n0 1\nH 0.0 0.0 0.0\nH 0.0 0.0 0.735\n\n')._cache_key()
+            self.assertEqual(GaussianDriver('#  rhf/sto-3g \n\nH2\n\n0 1\nH 0.0 0.0 0.0\n H 0.0  0.0 0.735\n\n')._cache_key(),
+                             key)
+            self.assertNotEqual(GaussianDriver('# rhf/sto-3g\n\nH2\n\n0 1 H 0.0 0.0 0.0 H 0.0 0.0 0.735\n\n')._cache_key(),
+                                key)
+
+
+if __name__ == '__main__':
+    unittest.main()
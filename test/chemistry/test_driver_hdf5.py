@@ -12,9 +12,14 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import os
+import tempfile
 import unittest
+import numpy as np
 from test.chemistry.common import QiskitChemistryTestCase
+from qiskit.chemistry import QMolecule
 from qiskit.chemistry.drivers import HDF5Driver
+from qiskit.chemistry.qmolecule import _UNLOADED
 from test.chemistry.test_driver import TestDriver
 
 
@@ -27,5 +32,33 @@ class TestDriverHDF5(QiskitChemistryTestCase, TestDriver):
         self.qmolecule = driver.run()
 
 
+class TestDriverHDF5Lazy(QiskitChemistryTestCase, TestDriver):
+    """HDF5 Driver tests, with the integrals read on first access."""
+
+    def setUp(self):
+        super().setUp()
+        self.qmolecule = QMolecule(self._get_resource_path('test_driver_hdf5.hdf5'))
+        self.qmolecule.load(lazy=True)
+
+    def test_lazy_load(self):
+        eager = HDF5Driver(hdf5_input=self._get_resource_path('test_driver_hdf5.hdf5')).run()
+        np.testing.assert_array_equal(self.qmolecule.read_slice('mo_eri_ints', (0, slice(None), 1)),
+                                      eager.mo_eri_ints[0, :, 1])
+        self.assertIs(self.qmolecule.__dict__['mo_eri_ints'], _UNLOADED)
+        np.testing.assert_array_equal(self.qmolecule.mo_eri_ints, eager.mo_eri_ints)
+        self.assertIsInstance(self.qmolecule.__dict__['mo_eri_ints'], np.ndarray)
+
+    def test_save_chunked(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_name = os.path.join(tmp_dir, 'chunked.hdf5')
+            self.qmolecule.save(file_name, chunked=True, compression='gzip')
+            molecule = QMolecule(file_name)
+            molecule.load(lazy=True)
+            np.testing.assert_array_equal(molecule.read_slice('mo_eri_ints', (1, 0)),
+                                          self.qmolecule.mo_eri_ints[1, 0])
+            np.testing.assert_array_equal(molecule.mo_onee_ints, self.qmolecule.mo_onee_ints)
+            self.assertIsNone(molecule.mo_eri_ints_BB)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -17,6 +17,7 @@ Test of Symmetry UCCSD processing.
 """
 
 import itertools
+import numpy as np
 from test.chemistry.common import QiskitChemistryTestCase
 from qiskit import BasicAer
 from qiskit.aqua import QuantumInstance, Operator
@@ -70,6 +71,18 @@ class TestSymmetries(QiskitChemistryTestCase):
     def test_sq_list(self):
         self.assertSequenceEqual(self.sq_list, [1, 2])
 
+    def test_tapered_sectors(self):
+        sectors, tapered_ops, eigenvalues = Operator.qubit_tapering_sectors(self.qubit_op, self.cliffords,
+                                                                            self.sq_list, min_eigenvalues=True)
+        self.assertListEqual(sectors, [list(coeff) for coeff in itertools.product([1, -1], repeat=len(self.sq_list))])
+        for coeff, tapered_op in zip(sectors, tapered_ops):
+            self.assertEqual(tapered_op.num_qubits, self.qubit_op.num_qubits - len(self.sq_list))
+            self.assertEqual(tapered_op,
+                             Operator.qubit_tapering(self.qubit_op, self.cliffords, self.sq_list, coeff))
+        # the first sector has the ground state, whose energy is the lowest eigenvalue of the full operator
+        self.assertEqual(int(np.argmin(eigenvalues)), 0)
+        self.assertAlmostEqual(eigenvalues[0], Operator._min_eigenvalue(self.qubit_op), places=6)
+
     def test_tapered_op(self):
         # set_qiskit_chemistry_logging(logging.DEBUG)
         tapered_ops = []